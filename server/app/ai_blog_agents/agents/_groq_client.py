@@ -0,0 +1,131 @@
+# ai_blog_agents/agents/_groq_client.py
+import asyncio
+import os
+import random
+import threading
+import time
+from functools import lru_cache
+from typing import Optional
+import httpx
+from app.ai_blog_agents.agents._models import DEFAULT_TIER, resolve_model
+
+DEFAULT_MODEL = resolve_model(DEFAULT_TIER)
+
+# Cap on in-flight Groq requests across all agents, sized to the account's TPM budget
+GROQ_MAX_CONCURRENCY = int(os.getenv("GROQ_MAX_CONCURRENCY", "16"))
+GROQ_SEM = asyncio.Semaphore(GROQ_MAX_CONCURRENCY)
+GROQ_SYNC_SEM = threading.BoundedSemaphore(GROQ_MAX_CONCURRENCY)
+GROQ_MAX_RETRIES = 3
+GROQ_BACKOFF_BASE = 1.0  # seconds, doubled on each retry
+
+# One keep-alive connection pool shared by every ChatGroq instance
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_http_client = httpx.Client(limits=_POOL_LIMITS)
+_http_async_client = httpx.AsyncClient(limits=_POOL_LIMITS)
+
+def _api_keys() -> tuple:
+    """
+    Groq API keys to spread load across: GROQ_API_KEYS (comma-separated), else GROQ_API_KEY.
+    """
+    keys = tuple(k.strip() for k in os.getenv("GROQ_API_KEYS", "").split(",") if k.strip())
+    if not keys and os.getenv("GROQ_API_KEY"):
+        keys = (os.getenv("GROQ_API_KEY"),)
+    return keys
+
+# Temperature for structured calls (JSON, SEO, summaries) whose output should be repeatable
+DETERMINISTIC_TEMPERATURE = 0
+
+@lru_cache(maxsize=32)
+def _build_groq(model_name: str, api_key: str, temperature: Optional[float] = None):
+    # Imported on first use: langchain_groq pulls in a large dependency tree
+    from langchain_groq import ChatGroq
+    options = {} if temperature is None else {"temperature": temperature}
+    return ChatGroq(
+        model=model_name,
+        api_key=api_key,
+        http_client=_http_client,
+        http_async_client=_http_async_client,
+        **options
+    )
+
+# Groq's OpenAI-compatible JSON mode: the model is constrained to emit one valid JSON object
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+@lru_cache(maxsize=32)
+def _build_groq_json(model_name: str, api_key: str):
+    return _build_groq(model_name, api_key, DETERMINISTIC_TEMPERATURE).bind(response_format=JSON_RESPONSE_FORMAT)
+
+@lru_cache(maxsize=8)
+def get_groq(model_name: str = DEFAULT_MODEL, temperature: Optional[float] = None):
+    """
+    Returns the shared ChatGroq client for a model (on the first configured key).
+    temperature=None keeps the model's default sampling.
+    Returns None if no Groq API key is set.
+    """
+    keys = _api_keys()
+    if not keys:
+        return None
+    return _build_groq(model_name, keys[0], temperature)
+
+@lru_cache(maxsize=4)
+def get_groq_json(model_name: str = DEFAULT_MODEL):
+    """
+    Returns the shared ChatGroq client bound to JSON mode, at DETERMINISTIC_TEMPERATURE.
+    Returns None if no Groq API key is set.
+    """
+    keys = _api_keys()
+    if not keys:
+        return None
+    return _build_groq_json(model_name, keys[0])
+
+_round_robin = {}
+_round_robin_lock = threading.Lock()
+
+def next_groq(model_name: str = DEFAULT_MODEL, json_mode: bool = False):
+    """
+    Returns a ChatGroq client for the model, rotating round-robin across the configured
+    API keys so each key's rate limit carries part of the load.
+    Returns None if no Groq API key is set.
+    """
+    keys = _api_keys()
+    if not keys:
+        return None
+    with _round_robin_lock:
+        index = _round_robin.get(model_name, 0) % len(keys)
+        _round_robin[model_name] = index + 1
+    build = _build_groq_json if json_mode else _build_groq
+    return build(model_name, keys[index])
+
+def _is_rate_limit_error(e: Exception) -> bool:
+    return type(e).__name__ == "RateLimitError" or getattr(e, "status_code", None) == 429
+
+def _backoff_delay(attempt: int) -> float:
+    # Exponential backoff with full jitter so queued callers don't retry in lockstep
+    return random.uniform(0, GROQ_BACKOFF_BASE * (2 ** attempt))
+
+async def guarded_ainvoke(model, prompt):
+    """
+    Awaits model.ainvoke under GROQ_SEM, retrying rate-limit (429) errors with backoff.
+    """
+    for attempt in range(GROQ_MAX_RETRIES + 1):
+        async with GROQ_SEM:
+            try:
+                return await model.ainvoke(prompt)
+            except Exception as e:
+                if not _is_rate_limit_error(e) or attempt == GROQ_MAX_RETRIES:
+                    raise
+        # Sleep outside the semaphore so other requests can use the slot
+        await asyncio.sleep(_backoff_delay(attempt))
+
+def guarded_invoke(model, prompt):
+    """
+    Sync counterpart of guarded_ainvoke for code paths that call model.invoke.
+    """
+    for attempt in range(GROQ_MAX_RETRIES + 1):
+        with GROQ_SYNC_SEM:
+            try:
+                return model.invoke(prompt)
+            except Exception as e:
+                if not _is_rate_limit_error(e) or attempt == GROQ_MAX_RETRIES:
+                    raise
+        time.sleep(_backoff_delay(attempt))
@@ -0,0 +1,24 @@
+# ai_blog_agents/agents/_models.py
+
+# Groq models by speed tier. Short, structured tasks (SEO, summaries, tags)
+# use the instant tier; long-form writing keeps the larger model.
+SPEED_TIERS = {
+    "instant": "llama-3.1-8b-instant",
+    "balanced": "llama-3.3-70b-versatile",
+    "writer": "openai/gpt-oss-20b"
+}
+DEFAULT_TIER = "writer"
+
+def resolve_model(tier: str) -> str:
+    """
+    Maps a speed tier to its concrete model name. Unknown values are treated as model names.
+    """
+    return SPEED_TIERS.get(tier, tier)
+
+# Per-agent input budgets (in tokens) for content inserted into prompts as context
+TOKEN_BUDGETS = {
+    "engagement": 512,
+    "seo": 1024,
+    "summary": 4096,
+    "postprocess": 4096
+}
@@ -1,32 +1,66 @@
 # ai_blog_agents/agents/base_agent.py
+import logging
 from pathlib import Path
+from functools import lru_cache
 import os
-from langchain_groq import ChatGroq
+from langchain_core.messages import HumanMessage, SystemMessage
+from app.ai_blog_agents.agents._groq_client import get_groq, next_groq
+from app.ai_blog_agents.agents._models import DEFAULT_TIER, resolve_model
+from app.ai_blog_agents.utils.llm_cache import invoke_cached, ainvoke_cached, astream_cached
+
+logger = logging.getLogger(__name__)
+
+PROMPTS_DIR = Path(__file__).parent.parent / "utils" / "prompts"
+
+@lru_cache(maxsize=32)
+def _read_prompt(path_str: str, mtime_ns: int) -> str:
+    # mtime_ns is part of the cache key so edited prompt files are re-read
+    return Path(path_str).read_text(encoding="utf-8")
+
+def load_prompt(prompt_filename: str) -> str:
+    """
+    Loads a text prompt template from utils/prompts, cached until the file changes.
+    """
+    prompt_path = PROMPTS_DIR / prompt_filename
+    try:
+        mtime_ns = os.stat(prompt_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt file not found: {prompt_filename}")
+    return _read_prompt(str(prompt_path), mtime_ns)
+
+def build_messages(prompt: str, system=None):
+    """
+    Returns the prompt as-is, or as [system, user] messages when a system preamble is given.
+    Keeping static instructions in an identical system message lets Groq reuse its prompt prefix cache.
+    system may be a string or a prebuilt SystemMessage, which is reused as-is.
+    """
+    if not system:
+        return prompt
+    if not isinstance(system, SystemMessage):
+        system = SystemMessage(content=system)
+    return [system, HumanMessage(content=prompt)]
 
 class BaseAgent:
     """
     Base class for all AI agents in FluxWell Blog Module.
     Provides standardized access to Groq model and prompt loading.
     """
-    def __init__(self, model_name: str = "openai/gpt-oss-20b"):
+    def __init__(self, tier: str = DEFAULT_TIER):
+        # tier is a key of SPEED_TIERS (or a concrete Groq model name)
+        self.model_name = resolve_model(tier)
         try:
-            groq_api_key = os.getenv("GROQ_API_KEY")
-            if not groq_api_key:
+            self.model = get_groq(self.model_name)
+            if self.model is None:
                 raise ValueError("GROQ_API_KEY environment variable not set")
-            self.model = ChatGroq(model=model_name, api_key=groq_api_key)
         except Exception as e:
-            print(f"[BaseAgent] Warning: Failed to initialize ChatGroq: {e}")
+            logger.warning("Failed to initialize ChatGroq: %s", e)
             self.model = None
 
     def load_prompt(self, prompt_filename: str) -> str:
         """
         Loads a text prompt template from utils/prompts.
         """
-        prompt_path = Path(__file__).parent.parent / "utils" / "prompts" / prompt_filename
-        if not prompt_path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {prompt_filename}")
-        with open(prompt_path, "r", encoding="utf-8") as f:
-            return f.read()
+        return load_prompt(prompt_filename)
 
     def run_prompt(self, prompt: str):
         """
@@ -34,10 +68,47 @@ class BaseAgent:
         """
         try:
             if self.model is None:
-                print("[BaseAgent] Model not initialized, returning None")
+                logger.warning("Model not initialized, returning None")
                 return None
-            response = self.model.invoke(prompt)
-            return response.content
+            return invoke_cached(next_groq(self.model_name) or self.model, self.model_name, prompt)
         except Exception as e:
-            print(f"[BaseAgent] Model error: {str(e)}")
+            logger.exception("Model call failed")
             return None
+
+    async def arun_prompt(self, prompt: str, system: str = None):
+        """
+        Async version of run_prompt; awaits the model without blocking the event loop.
+        """
+        try:
+            if self.model is None:
+                logger.warning("Model not initialized, returning None")
+                return None
+            return await ainvoke_cached(next_groq(self.model_name) or self.model, self.model_name, build_messages(prompt, system))
+        except Exception as e:
+            logger.exception("Model call failed")
+            return None
+
+    async def arun_json_prompt(self, prompt: str, system: str = None):
+        """
+        Like arun_prompt, but with Groq JSON mode so the response is a single valid JSON object.
+        The prompt must still mention JSON and describe the expected keys.
+        """
+        try:
+            if self.model is None:
+                logger.warning("Model not initialized, returning None")
+                return None
+            json_model = next_groq(self.model_name, json_mode=True)
+            return await ainvoke_cached(json_model, f"{self.model_name}:json", build_messages(prompt, system))
+        except Exception as e:
+            logger.exception("Model call failed")
+            return None
+
+    async def astream_prompt(self, prompt: str, system: str = None):
+        """
+        Streams the model response as content chunks, so callers can render from first token.
+        """
+        if self.model is None:
+            logger.warning("Model not initialized, nothing to stream")
+            return
+        async for chunk in astream_cached(next_groq(self.model_name) or self.model, self.model_name, build_messages(prompt, system)):
+            yield chunk
@@ -0,0 +1,70 @@
+# ai_blog_agents/agents/batch_queue.py
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+class BatchQueue:
+    """
+    Coalesces concurrent requests that share a key into one batch.
+
+    A batch is flushed when it reaches max_items or max_chars, or max_delay seconds
+    after its first item arrived. flush_fn(key, items) must return one result per item,
+    in order; each caller's future resolves to its own result.
+    """
+    def __init__(self, flush_fn, max_delay: float = 0.05, max_chars: int = 4000, max_items: int = 8):
+        self.flush_fn = flush_fn
+        self.max_delay = max_delay
+        self.max_chars = max_chars
+        self.max_items = max_items
+        self._pending = {}  # key -> {"items": [...], "futures": [...], "chars": int, "timer": TimerHandle}
+        self._tasks = set()  # in-flight flushes; the loop only keeps weak references to tasks
+
+    async def submit(self, key, item, size: int = 0):
+        """
+        Queues item under key and waits for its result from the batch it lands in.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending.get(key)
+        # Start a new batch if this item would push the current one over the char cap
+        if batch is not None and batch["items"] and batch["chars"] + size > self.max_chars:
+            self._flush(key)
+            batch = None
+        if batch is None:
+            batch = {"items": [], "futures": [], "chars": 0, "timer": None}
+            self._pending[key] = batch
+            batch["timer"] = loop.call_later(self.max_delay, self._flush, key)
+
+        batch["items"].append(item)
+        batch["futures"].append(future)
+        batch["chars"] += size
+        if len(batch["items"]) >= self.max_items or batch["chars"] >= self.max_chars:
+            self._flush(key)
+
+        return await future
+
+    def _flush(self, key):
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        batch["timer"].cancel()
+        task = asyncio.ensure_future(self._run(key, batch["items"], batch["futures"]))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key, items, futures):
+        try:
+            results = await self.flush_fn(key, items)
+            if len(results) != len(items):
+                raise ValueError(f"Batch returned {len(results)} results for {len(items)} items")
+        except Exception as e:
+            logger.exception("Batch flush failed for %s", key)
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
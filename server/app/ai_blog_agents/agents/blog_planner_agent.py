@@ -1,8 +1,11 @@
 # ai_blog_agents/agents/blog_planner_agent.py
+import asyncio
+import logging
 import json
 from app.ai_blog_agents.agents.base_agent import BaseAgent
 from app.ai_blog_agents.tools.content_plan_tool import generate_mindmap
-from app.ai_blog_agents.utils.helpers import safe_json_parse
+
+logger = logging.getLogger(__name__)
 
 class BlogPlannerAgent(BaseAgent):
     """
@@ -19,7 +22,8 @@ class BlogPlannerAgent(BaseAgent):
         """
         try:
             # Step 1: Use the content_plan_tool to generate a structural outline
-            mindmap = generate_mindmap(topic)
+            # (its Groq call is synchronous, so it runs off the event loop)
+            mindmap = await asyncio.to_thread(generate_mindmap, topic)
 
             # Step 2: Build the planning prompt for the model
             prompt = self.prompt_template.format(
@@ -29,7 +33,7 @@ class BlogPlannerAgent(BaseAgent):
             )
 
             # Step 3: Get AI feedback on the structure (optional enrichment)
-            ai_feedback = self.run_prompt(prompt)
+            ai_feedback = await self.arun_prompt(prompt)
 
             # Step 4: Combine mindmap and feedback into one structure
             plan_data = {
@@ -38,7 +42,7 @@ class BlogPlannerAgent(BaseAgent):
                 "ai_feedback": ai_feedback
             }
 
-            return safe_json_parse(json.dumps(plan_data), plan_data)
+            return plan_data
         except Exception as e:
-            print(f"[BlogPlannerAgent] Planning error: {str(e)}")
+            logger.exception("Blog planning failed")
             return None
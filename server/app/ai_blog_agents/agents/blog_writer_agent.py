@@ -1,34 +1,48 @@
 # ai_blog_agents/agents/blog_writer_agent.py
+import asyncio
+import logging
 import json
-import os
-from pathlib import Path
-from langchain_groq import ChatGroq
+from app.ai_blog_agents.agents._groq_client import get_groq
+from app.ai_blog_agents.agents._models import resolve_model
+from app.ai_blog_agents.agents.base_agent import load_prompt
 from app.ai_blog_agents.tools.content_plan_tool import generate_mindmap
-from app.ai_blog_agents.utils.helpers import safe_json_parse
+from app.ai_blog_agents.utils.llm_cache import ainvoke_cached, astream_cached
+
+logger = logging.getLogger(__name__)
 
 # Load blog generation prompt template
-PROMPT_PATH = Path(__file__).parent.parent / "utils" / "prompts" / "blog_generation_prompt.txt"
-with open(PROMPT_PATH, "r") as f:
-    BLOG_PROMPT_TEMPLATE = f.read()
+BLOG_PROMPT_FILE = "blog_generation_prompt.txt"
+
+MODEL_NAME = resolve_model("writer")
 
-# Initialize ChatGroq with API key
+# Shared ChatGroq client
 try:
-    groq_api_key = os.getenv("GROQ_API_KEY")
-    if groq_api_key:
-        groq = ChatGroq(model="openai/gpt-oss-20b", api_key=groq_api_key)
-    else:
-        groq = None
-        print("[BlogWriterAgent] Warning: GROQ_API_KEY not set")
+    groq = get_groq(MODEL_NAME)
+    if groq is None:
+        logger.warning("GROQ_API_KEY not set")
 except Exception as e:
     groq = None
-    print(f"[BlogWriterAgent] Warning: Failed to initialize ChatGroq: {e}")
+    logger.warning("Failed to initialize ChatGroq: %s", e)
+
+def _is_usable_mindmap(mindmap) -> bool:
+    return isinstance(mindmap, dict) and all(k in mindmap for k in ("title", "description", "sections"))
+
+def _build_blog_prompt(mindmap: dict) -> str:
+    return load_prompt(BLOG_PROMPT_FILE).format(
+        title=mindmap["title"],
+        description=mindmap["description"],
+        sections=json.dumps(mindmap["sections"], indent=2)
+    )
 
-async def generate_blog(topic: str):
+async def generate_blog(topic: str, mindmap: dict = None):
     """
     Generates a full blog using AI and a mindmap plan.
+    Pass the planner's mindmap to skip generating it again; otherwise the
+    synchronous mindmap call runs in a worker thread.
     """
+    if not _is_usable_mindmap(mindmap):
+        mindmap = await asyncio.to_thread(generate_mindmap, topic)
     if not groq:
-        mindmap = generate_mindmap(topic)
         return {
             "topic": topic,
             "mindmap": mindmap,
@@ -36,23 +50,29 @@ async def generate_blog(topic: str):
         }
     
     try:
-        mindmap = generate_mindmap(topic)
-        prompt = BLOG_PROMPT_TEMPLATE.format(
-            title=mindmap["title"],
-            description=mindmap["description"],
-            sections=json.dumps(mindmap["sections"], indent=2)
-        )
-        response = groq.invoke(prompt)
+        prompt = _build_blog_prompt(mindmap)
+        content = await ainvoke_cached(groq, MODEL_NAME, prompt)
         return {
             "topic": topic,
             "mindmap": mindmap,
-            "content": response.content if response else ""
+            "content": content or ""
         }
     except Exception as e:
-        print(f"[BlogWriterAgent] Error: {e}")
-        mindmap = generate_mindmap(topic)
+        logger.exception("Blog generation failed")
         return {
             "topic": topic,
             "mindmap": mindmap,
             "content": ""
         }
+
+async def stream_blog(topic: str, mindmap: dict = None):
+    """
+    Streams the generated blog content chunk by chunk.
+    Yields nothing if Groq is not available.
+    """
+    if not groq:
+        return
+    if not _is_usable_mindmap(mindmap):
+        mindmap = await asyncio.to_thread(generate_mindmap, topic)
+    async for chunk in astream_cached(groq, MODEL_NAME, _build_blog_prompt(mindmap)):
+        yield chunk
@@ -1,19 +1,41 @@
 # ai_blog_agents/agents/engagement_agent.py
+import logging
 from typing import Dict, Any, Optional
+import asyncio
 from app.ai_blog_agents.agents.base_agent import BaseAgent
+from app.ai_blog_agents.agents._models import TOKEN_BUDGETS
 from app.ai_blog_agents.tools.sentiment_tool import analyze_sentiment
 from app.ai_blog_agents.tools.analytics_tool import get_blog_analytics
 from app.ai_blog_agents.tools.pinecone_tool import query_similar
-import json
-import re
+from app.ai_blog_agents.utils.json_extract import extract_json
+from app.ai_blog_agents.utils.tokens import truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+ENGAGEMENT_KEYS = {"insights": str, "suggested_tags": list, "improvements": str}
+
+# Static instructions, sent as an identical system message on every call
+ENGAGEMENT_SYSTEM_PROMPT = """You are an expert content strategist for health and fitness blogs.
+
+Analyze the blog content you are given and provide:
+1. Key insights about what makes this content engaging
+2. Suggested tags to improve discoverability (return as JSON array)
+3. Specific improvements to increase engagement
+
+Format your response as JSON:
+{
+    "insights": "Your insights here",
+    "suggested_tags": ["tag1", "tag2", "tag3"],
+    "improvements": "Your improvement suggestions here"
+}"""
 
 class EngagementAgent(BaseAgent):
     """
     Analyzes blog engagement and provides insights and suggestions.
     """
     
-    def __init__(self, model_name: str = "openai/gpt-oss-20b"):
-        super().__init__(model_name)
+    def __init__(self, tier: str = "instant"):
+        super().__init__(tier)
     
     async def run(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -52,32 +74,17 @@ class EngagementAgent(BaseAgent):
             results["analytics"] = get_blog_analytics(blog_id)
         
         # Generate insights using AI
-        insights_prompt = f"""You are an expert content strategist for health and fitness blogs.
-
-Analyze the following blog content and provide engagement insights:
-Content: {content[:1000] if content else "No content provided"}
+        insights_prompt = f"""Analyze the following blog content and provide engagement insights:
+Content: {truncate_to_tokens(content, TOKEN_BUDGETS["engagement"]) if content else "No content provided"}
 Tags: {', '.join(tags) if tags else "No tags"}
-
-Provide:
-1. Key insights about what makes this content engaging
-2. Suggested tags to improve discoverability (return as JSON array)
-3. Specific improvements to increase engagement
-
-Format your response as JSON:
-{{
-    "insights": "Your insights here",
-    "suggested_tags": ["tag1", "tag2", "tag3"],
-    "improvements": "Your improvement suggestions here"
-}}
 """
         
         try:
-            response = self.run_prompt(insights_prompt)
+            response = await self.arun_json_prompt(insights_prompt, system=ENGAGEMENT_SYSTEM_PROMPT)
             if response:
                 # Try to parse JSON from response
-                json_match = re.search(r'\{[^{}]*\}', response, re.DOTALL)
-                if json_match:
-                    parsed = json.loads(json_match.group())
+                parsed = extract_json(response, ENGAGEMENT_KEYS)
+                if isinstance(parsed, dict):
                     results["insights"] = parsed.get("insights", "")
                     results["suggested_tags"] = parsed.get("suggested_tags", [])
                     results["improvements"] = parsed.get("improvements", "")
@@ -87,7 +94,7 @@ Format your response as JSON:
                     results["suggested_tags"] = tags[:5] if tags else []
                     results["improvements"] = "Consider adding more engaging visuals and interactive elements."
         except Exception as e:
-            print(f"[EngagementAgent] Error: {e}")
+            logger.exception("Engagement analysis failed")
             # Fallback values
             results["insights"] = "Your content shows good potential. Focus on trending topics in health and fitness."
             results["suggested_tags"] = tags[:5] if tags else []
@@ -99,9 +106,12 @@ async def learn_from_feedback(blog_id: str, comments: list):
     """
     Learns from blog analytics and comments to improve topic suggestions.
     """
-    analytics = get_blog_analytics(blog_id)
-    sentiment = analyze_sentiment(comments)
-    similar_topics = await query_similar(["fitness", "health"])  # example tags
+    # Independent lookups; the sync tools run in worker threads so they overlap
+    analytics, sentiment, similar_topics = await asyncio.gather(
+        asyncio.to_thread(get_blog_analytics, blog_id),
+        asyncio.to_thread(analyze_sentiment, comments),
+        query_similar(["fitness", "health"])  # example tags
+    )
     
     feedback_summary = {
         "analytics": analytics,
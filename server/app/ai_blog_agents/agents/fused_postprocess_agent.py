@@ -0,0 +1,68 @@
+# ai_blog_agents/agents/fused_postprocess_agent.py
+import logging
+from typing import Any, Dict, List, Optional
+from app.ai_blog_agents.agents._groq_client import get_groq_json
+from app.ai_blog_agents.agents._models import TOKEN_BUDGETS, resolve_model
+from app.ai_blog_agents.agents.base_agent import load_prompt
+from app.ai_blog_agents.utils.json_extract import extract_json
+from app.ai_blog_agents.utils.llm_cache import ainvoke_cached
+from app.ai_blog_agents.utils.tokens import truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+POSTPROCESS_PROMPT_FILE = "postprocess_prompt.txt"
+
+MODEL_NAME = resolve_model("instant")
+
+POSTPROCESS_KEYS = {"summary": str, "keywords": list, "seo_meta": str, "tags": list}
+
+# Shared JSON-mode ChatGroq client
+try:
+    groq_json = get_groq_json(MODEL_NAME)
+    if groq_json is None:
+        logger.warning("GROQ_API_KEY not set")
+except Exception as e:
+    groq_json = None
+    logger.warning("Failed to initialize ChatGroq: %s", e)
+
+async def fused_blog_postprocess(title: str, content: str, tags: List[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Summarizes, SEO-optimizes and engagement-analyzes a finished blog in one LLM call,
+    instead of three calls that each re-send the content.
+
+    Returns:
+        {"summary", "keywords", "seo_meta", "tags", "engagement": {"insights", "suggested_tags", "improvements", "analytics"}},
+        or None if the model is unavailable or the response is incomplete, so callers can
+        fall back to summarize_blog / optimize_blog / EngagementAgent.
+    """
+    if not groq_json or not content:
+        return None
+
+    try:
+        prompt = load_prompt(POSTPROCESS_PROMPT_FILE).format(
+            title=title,
+            tags=", ".join(tags) if tags else "No tags",
+            content=truncate_to_tokens(content, TOKEN_BUDGETS["postprocess"])
+        )
+        response_text = await ainvoke_cached(groq_json, f"{MODEL_NAME}:json", prompt)
+        data = extract_json(response_text, POSTPROCESS_KEYS) if response_text else None
+        if not isinstance(data, dict) or not all(isinstance(data.get(k), t) for k, t in POSTPROCESS_KEYS.items()):
+            logger.warning("Fused postprocess response incomplete, falling back to separate calls")
+            return None
+
+        engagement = data.get("engagement") if isinstance(data.get("engagement"), dict) else {}
+        return {
+            "summary": data["summary"],
+            "keywords": data["keywords"],
+            "seo_meta": data["seo_meta"],
+            "tags": data["tags"],
+            "engagement": {
+                "insights": engagement.get("insights", ""),
+                "suggested_tags": engagement.get("suggested_tags", []),
+                "improvements": engagement.get("improvements", ""),
+                "analytics": None
+            }
+        }
+    except Exception as e:
+        logger.exception("Fused postprocess failed")
+        return None
@@ -1,13 +1,37 @@
 # ai_blog_agents/agents/readability_agent.py
+import logging
 from app.ai_blog_agents.agents.base_agent import BaseAgent
 
+logger = logging.getLogger(__name__)
+
+# Static instructions, sent as an identical system message on every call
+READABILITY_SYSTEM_PROMPT = """You are an expert content editor. Improve the readability of the blog content you are given.
+Make it clearer, more engaging, and easier to understand while maintaining the original meaning and tone.
+
+Guidelines:
+- Simplify complex sentences
+- Break up long paragraphs
+- Use active voice where possible
+- Improve flow and transitions
+- Maintain the original style and voice
+- Keep technical terms if they're essential
+- Preserve any markdown formatting"""
+
 class ReadabilityAgent(BaseAgent):
     """
     Improves content readability by simplifying language, improving flow, and enhancing clarity.
     """
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, tier: str = "balanced"):
+        super().__init__(tier)
+    
+    def _build_prompt(self, content: str, title: str = "") -> str:
+        return f"""{'Title: ' + title if title else ''}
+
+Original Content:
+{content}
+
+Improved Content:"""
     
     async def improve_readability(self, content: str, title: str = ""):
         """
@@ -24,26 +48,8 @@ class ReadabilityAgent(BaseAgent):
             return {"improved_content": content, "error": "Model not initialized"}
         
         try:
-            prompt = f"""You are an expert content editor. Improve the readability of the following blog content.
-Make it clearer, more engaging, and easier to understand while maintaining the original meaning and tone.
-
-Guidelines:
-- Simplify complex sentences
-- Break up long paragraphs
-- Use active voice where possible
-- Improve flow and transitions
-- Maintain the original style and voice
-- Keep technical terms if they're essential
-- Preserve any markdown formatting
-
-{'Title: ' + title if title else ''}
-
-Original Content:
-{content}
-
-Improved Content:"""
-            
-            response = self.run_prompt(prompt)
+            prompt = self._build_prompt(content, title)
+            response = await self.arun_prompt(prompt, system=READABILITY_SYSTEM_PROMPT)
             
             if response:
                 return {
@@ -57,10 +63,17 @@ Improved Content:"""
                     "success": False
                 }
         except Exception as e:
-            print(f"[ReadabilityAgent] Error: {str(e)}")
+            logger.exception("Readability improvement failed")
             return {
                 "improved_content": content,
                 "error": str(e),
                 "success": False
             }
 
+    async def stream_readability(self, content: str, title: str = ""):
+        """
+        Streams the improved content chunk by chunk.
+        Yields nothing if the model is not initialized.
+        """
+        async for chunk in self.astream_prompt(self._build_prompt(content, title), system=READABILITY_SYSTEM_PROMPT):
+            yield chunk
@@ -1,24 +1,32 @@
 # ai_blog_agents/agents/seo_optimizer_agent.py
-from pathlib import Path
-import os
-from langchain_groq import ChatGroq
+import logging
+from app.ai_blog_agents.agents._groq_client import DETERMINISTIC_TEMPERATURE, get_groq, get_groq_json
+from app.ai_blog_agents.agents._models import TOKEN_BUDGETS, resolve_model
+from app.ai_blog_agents.agents.base_agent import load_prompt
 from app.ai_blog_agents.utils.helpers import safe_json_parse
+from app.ai_blog_agents.utils.llm_cache import ainvoke_cached
+from app.ai_blog_agents.utils.tokens import truncate_to_tokens
 
-PROMPT_PATH = Path(__file__).parent.parent / "utils" / "prompts" / "seo_prompt.txt"
-with open(PROMPT_PATH, "r") as f:
-    SEO_PROMPT_TEMPLATE = f.read()
+logger = logging.getLogger(__name__)
 
-# Initialize ChatGroq with API key
+SEO_PROMPT_FILE = "seo_prompt.txt"
+
+MODEL_NAME = resolve_model("instant")
+
+# Shared ChatGroq client
 try:
-    groq_api_key = os.getenv("GROQ_API_KEY")
-    if groq_api_key:
-        groq = ChatGroq(model="openai/gpt-oss-20b", api_key=groq_api_key)
-    else:
-        groq = None
-        print("[SEOOptimizerAgent] Warning: GROQ_API_KEY not set")
+    groq = get_groq(MODEL_NAME, DETERMINISTIC_TEMPERATURE)
+    # JSON mode guarantees a parseable object, so no fence stripping or retries are needed
+    groq_json = get_groq_json(MODEL_NAME)
+    if groq is None:
+        logger.warning("GROQ_API_KEY not set")
 except Exception as e:
     groq = None
-    print(f"[SEOOptimizerAgent] Warning: Failed to initialize ChatGroq: {e}")
+    groq_json = None
+    logger.warning("Failed to initialize ChatGroq: %s", e)
+
+# Words kept lowercase in titles (except as the first word)
+_TITLE_STOPWORDS = frozenset({"a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"})
 
 def _simple_title_optimization(title: str) -> str:
     """
@@ -28,13 +36,11 @@ def _simple_title_optimization(title: str) -> str:
     if not title:
         return title
     
-    # Basic improvements
-    words = title.split()
-    optimized = " ".join(word.capitalize() if word.lower() not in ['a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'] else word.lower() for word in words)
-    
-    # Capitalize first word
-    if optimized:
-        optimized = optimized[0].upper() + optimized[1:] if len(optimized) > 1 else optimized.upper()
+    # Basic improvements: capitalize words, keep stopwords lowercase after the first word
+    optimized = " ".join(
+        word.lower() if i and word.lower() in _TITLE_STOPWORDS else word.capitalize()
+        for i, word in enumerate(title.split())
+    )
     
     # Ensure reasonable length (truncate if too long)
     if len(optimized) > 70:
@@ -48,34 +54,23 @@ async def optimize_blog(title: str, summary: str, content: str):
     Returns: {"title": str, "seo_meta": str, "tags": List[str]}
     """
     if not groq:
-        print("[SEOOptimizerAgent] Groq not available, using simple optimization")
+        logger.info("Groq not available, using simple optimization")
         optimized_title = _simple_title_optimization(title)
         return {"title": optimized_title, "seo_meta": "", "tags": []}
     
     try:
-        # Truncate content if too long (keep first 2000 chars for context)
-        content_preview = content[:2000] if content else ""
+        # Truncate content to the SEO token budget (only the opening is needed for context)
+        content_preview = truncate_to_tokens(content, TOKEN_BUDGETS["seo"])
         summary_text = summary if summary else ""
         
-        prompt = SEO_PROMPT_TEMPLATE.format(
+        prompt = load_prompt(SEO_PROMPT_FILE).format(
             title=title or "Untitled Blog Post",
             summary=summary_text,
             content=content_preview
         )
         
-        print(f"[SEOOptimizerAgent] Optimizing title: '{title}'")
-        response = groq.invoke(prompt)
-        response_text = response.content if hasattr(response, 'content') else str(response)
-        
-        # Clean response text (remove markdown code blocks if present)
-        response_text = response_text.strip()
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        elif response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-        response_text = response_text.strip()
+        logger.debug("Optimizing title: %r", title)
+        response_text = await ainvoke_cached(groq_json, f"{MODEL_NAME}:json", prompt) or ""
         
         # Parse JSON response
         data = safe_json_parse(response_text, {})
@@ -94,7 +89,7 @@ async def optimize_blog(title: str, summary: str, content: str):
         
         # Final validation - if still empty or same as original, use simple optimization
         if not optimized_title or optimized_title == title.strip():
-            print(f"[SEOOptimizerAgent] Using fallback optimization for title")
+            logger.debug("Using fallback optimization for title")
             optimized_title = _simple_title_optimization(title)
         
         # Ensure title is reasonable length
@@ -112,13 +107,11 @@ async def optimize_blog(title: str, summary: str, content: str):
             "tags": tags[:10]  # Limit to 10 tags
         }
         
-        print(f"[SEOOptimizerAgent] ✅ Optimized title: '{result['title']}' (original: '{title}')")
+        logger.debug("Optimized title: %r (original: %r)", result["title"], title)
         return result
         
     except Exception as e:
-        import traceback
-        print(f"[SEOOptimizerAgent] Error optimizing blog: {e}")
-        print(traceback.format_exc())
+        logger.exception("SEO optimization failed")
         # Use fallback optimization on error
         optimized_title = _simple_title_optimization(title)
         return {"title": optimized_title, "seo_meta": "", "tags": []}
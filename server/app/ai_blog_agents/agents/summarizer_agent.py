@@ -1,24 +1,26 @@
 # ai_blog_agents/agents/summarizer_agent.py
-from pathlib import Path
-import os
-from langchain_groq import ChatGroq
+import logging
+from app.ai_blog_agents.agents._groq_client import DETERMINISTIC_TEMPERATURE, get_groq
+from app.ai_blog_agents.agents._models import TOKEN_BUDGETS, resolve_model
+from app.ai_blog_agents.agents.base_agent import load_prompt
 from app.ai_blog_agents.utils.helpers import safe_json_parse
+from app.ai_blog_agents.utils.llm_cache import ainvoke_cached
+from app.ai_blog_agents.utils.tokens import truncate_to_tokens
 
-PROMPT_PATH = Path(__file__).parent.parent / "utils" / "prompts" / "summary_prompt.txt"
-with open(PROMPT_PATH, "r") as f:
-    SUMMARY_PROMPT_TEMPLATE = f.read()
+logger = logging.getLogger(__name__)
 
-# Initialize ChatGroq with API key
+SUMMARY_PROMPT_FILE = "summary_prompt.txt"
+
+MODEL_NAME = resolve_model("instant")
+
+# Shared ChatGroq client
 try:
-    groq_api_key = os.getenv("GROQ_API_KEY")
-    if groq_api_key:
-        groq = ChatGroq(model="openai/gpt-oss-20b", api_key=groq_api_key)
-    else:
-        groq = None
-        print("[SummarizerAgent] Warning: GROQ_API_KEY not set")
+    groq = get_groq(MODEL_NAME, DETERMINISTIC_TEMPERATURE)
+    if groq is None:
+        logger.warning("GROQ_API_KEY not set")
 except Exception as e:
     groq = None
-    print(f"[SummarizerAgent] Warning: Failed to initialize ChatGroq: {e}")
+    logger.warning("Failed to initialize ChatGroq: %s", e)
 
 async def summarize_blog(title: str, content: str):
     """
@@ -28,10 +30,13 @@ async def summarize_blog(title: str, content: str):
         return {"summary": "", "keywords": []}
     
     try:
-        prompt = SUMMARY_PROMPT_TEMPLATE.format(title=title, content=content)
-        response = groq.invoke(prompt)
-        data = safe_json_parse(response.content, {})
+        prompt = load_prompt(SUMMARY_PROMPT_FILE).format(
+            title=title,
+            content=truncate_to_tokens(content, TOKEN_BUDGETS["summary"])
+        )
+        response_text = await ainvoke_cached(groq, MODEL_NAME, prompt)
+        data = safe_json_parse(response_text, {})
         return data
     except Exception as e:
-        print(f"[SummarizerAgent] Error: {e}")
+        logger.exception("Blog summarization failed")
         return {"summary": "", "keywords": []}
@@ -1,13 +1,56 @@
 # ai_blog_agents/agents/tone_agent.py
+import logging
+from langchain_core.messages import SystemMessage
 from app.ai_blog_agents.agents.base_agent import BaseAgent
 
+logger = logging.getLogger(__name__)
+
+# Static instructions, sent as an identical system message on every call
+TONE_SYSTEM_PROMPT = """You are an expert content editor. Adjust the tone of the blog content you are given to the requested tone.
+
+Important:
+- Maintain the original meaning and key information
+- Preserve any markdown formatting
+- Keep the structure and organization
+- Only change the tone, not the content itself"""
+
+_DEFAULT_TONE = "professional"
+
+_TONE_GUIDELINES = {
+    "professional": "Use formal language, avoid contractions, maintain a serious and respectful tone",
+    "casual": "Use conversational language, contractions are fine, be relaxed and approachable",
+    "friendly": "Be warm and welcoming, use inclusive language, create a sense of connection",
+    "authoritative": "Be confident and knowledgeable, use strong statements, demonstrate expertise",
+    "conversational": "Write as if speaking to a friend, use natural language, be engaging",
+    "academic": "Use formal academic language, cite sources appropriately, maintain objectivity"
+}
+
+# One system message per tone, built once and reused so each tone keeps a stable prompt prefix
+_TONE_SYSTEM_MESSAGES = {
+    tone: SystemMessage(content=f"{TONE_SYSTEM_PROMPT}\n\nGuidelines for {tone} tone:\n{guidelines}")
+    for tone, guidelines in _TONE_GUIDELINES.items()
+}
+
+def _tone_system_message(target_tone: str) -> SystemMessage:
+    return _TONE_SYSTEM_MESSAGES.get(target_tone.strip().lower(), _TONE_SYSTEM_MESSAGES[_DEFAULT_TONE])
+
 class ToneAgent(BaseAgent):
     """
     Adjusts the tone of blog content (e.g., professional, casual, friendly, authoritative).
     """
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, tier: str = "balanced"):
+        super().__init__(tier)
+    
+    def _build_prompt(self, content: str, target_tone: str, title: str = "") -> str:
+        return f"""Target tone: {target_tone}
+
+{'Title: ' + title if title else ''}
+
+Original Content:
+{content}
+
+Adjusted Content:"""
     
     async def adjust_tone(self, content: str, target_tone: str = "professional", title: str = ""):
         """
@@ -25,36 +68,8 @@ class ToneAgent(BaseAgent):
             return {"adjusted_content": content, "error": "Model not initialized"}
         
         try:
-            tone_guidelines = {
-                "professional": "Use formal language, avoid contractions, maintain a serious and respectful tone",
-                "casual": "Use conversational language, contractions are fine, be relaxed and approachable",
-                "friendly": "Be warm and welcoming, use inclusive language, create a sense of connection",
-                "authoritative": "Be confident and knowledgeable, use strong statements, demonstrate expertise",
-                "conversational": "Write as if speaking to a friend, use natural language, be engaging",
-                "academic": "Use formal academic language, cite sources appropriately, maintain objectivity"
-            }
-            
-            guidelines = tone_guidelines.get(target_tone.lower(), tone_guidelines["professional"])
-            
-            prompt = f"""You are an expert content editor. Adjust the tone of the following blog content to be {target_tone}.
-
-Guidelines for {target_tone} tone:
-{guidelines}
-
-Important:
-- Maintain the original meaning and key information
-- Preserve any markdown formatting
-- Keep the structure and organization
-- Only change the tone, not the content itself
-
-{'Title: ' + title if title else ''}
-
-Original Content:
-{content}
-
-Adjusted Content:"""
-            
-            response = self.run_prompt(prompt)
+            prompt = self._build_prompt(content, target_tone, title)
+            response = await self.arun_prompt(prompt, system=_tone_system_message(target_tone))
             
             if response:
                 return {
@@ -69,10 +84,17 @@ Adjusted Content:"""
                     "success": False
                 }
         except Exception as e:
-            print(f"[ToneAgent] Error: {str(e)}")
+            logger.exception("Tone adjustment failed")
             return {
                 "adjusted_content": content,
                 "error": str(e),
                 "success": False
             }
 
+    async def stream_tone(self, content: str, target_tone: str = "professional", title: str = ""):
+        """
+        Streams the tone-adjusted content chunk by chunk.
+        Yields nothing if the model is not initialized.
+        """
+        async for chunk in self.astream_prompt(self._build_prompt(content, target_tone, title), system=_tone_system_message(target_tone)):
+            yield chunk
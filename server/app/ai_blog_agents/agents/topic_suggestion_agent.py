@@ -1,17 +1,160 @@
 # ai_blog_agents/agents/topic_suggestion_agent.py
+import logging
 from typing import Dict, Any, List
+import asyncio
+from functools import lru_cache
 from app.ai_blog_agents.agents.base_agent import BaseAgent
 from app.ai_blog_agents.tools.serpapi_tool import search_web
-import json
-import re
+from app.ai_blog_agents.utils.json_extract import extract_json
+
+logger = logging.getLogger(__name__)
+
+TOPIC_KEYS = {"suggested_topics": list}
+
+# Static instructions, sent as an identical system message on every call
+TOPIC_SYSTEM_PROMPT = """You are an expert content strategist for health and fitness blogs.
+
+Generate engaging blog topic suggestions for the requested category.
+
+Consider:
+- Current trends in health and fitness
+- High search volume topics
+- Evergreen content that performs well
+- Topics that align with user interests
+
+For each topic, provide:
+- A compelling title
+- A reason why it's a good topic (trending, high engagement, etc.)
+- Whether it's currently trending (true/false)
+- The category it belongs to (the category named in the request)
+
+Format your response as JSON:
+{
+    "suggested_topics": [
+        {
+            "title": "Topic Title Here",
+            "reason": "Why this topic is good (e.g., High search volume and trending topic)",
+            "trending": true,
+            "category": "<category from the request>"
+        }
+    ]
+}"""
+
+# Static topics used when the model or web search is unavailable
+_FALLBACK_TOPICS = {
+    "nutrition": [
+        {
+            "title": "Intermittent Fasting: Is It Right for You?",
+            "reason": "High search volume and trending topic.",
+            "trending": True,
+            "category": "nutrition"
+        },
+        {
+            "title": "The Benefits of Probiotics for Gut Health",
+            "reason": "Aligns with your best-performing category.",
+            "trending": True,
+            "category": "nutrition"
+        },
+        {
+            "title": "Plant-Based Protein: Complete Guide",
+            "reason": "Evergreen content with strong engagement.",
+            "trending": False,
+            "category": "nutrition"
+        },
+        {
+            "title": "Meal Prep Hacks for Busy Professionals",
+            "reason": "High search volume and trending topic.",
+            "trending": True,
+            "category": "nutrition"
+        },
+        {
+            "title": "Understanding Macronutrients: A Beginner's Guide",
+            "reason": "Evergreen content with strong engagement.",
+            "trending": False,
+            "category": "nutrition"
+        }
+    ],
+    "fitness": [
+        {
+            "title": "Home Workouts: No Equipment Needed",
+            "reason": "High search volume and trending topic.",
+            "trending": True,
+            "category": "fitness"
+        },
+        {
+            "title": "HIIT vs. Cardio: What's Best for Weight Loss?",
+            "reason": "Aligns with your best-performing category.",
+            "trending": True,
+            "category": "fitness"
+        },
+        {
+            "title": "Building Muscle: A Complete Guide",
+            "reason": "Evergreen content with strong engagement.",
+            "trending": False,
+            "category": "fitness"
+        },
+        {
+            "title": "Recovery Techniques for Athletes",
+            "reason": "High search volume and trending topic.",
+            "trending": True,
+            "category": "fitness"
+        },
+        {
+            "title": "Yoga for Beginners: Getting Started",
+            "reason": "Evergreen content with strong engagement.",
+            "trending": False,
+            "category": "fitness"
+        }
+    ],
+    "wellness": [
+        {
+            "title": "How Sleep Affects Your Mental Wellness",
+            "reason": "High search volume and trending topic.",
+            "trending": True,
+            "category": "wellness"
+        },
+        {
+            "title": "Mindfulness and Meditation for Stress Relief",
+            "reason": "Aligns with your best-performing category.",
+            "trending": True,
+            "category": "wellness"
+        },
+        {
+            "title": "The Science of Sleep and Cognitive Performance",
+            "reason": "Evergreen content with strong engagement.",
+            "trending": False,
+            "category": "wellness"
+        },
+        {
+            "title": "Managing Anxiety Through Exercise",
+            "reason": "High search volume and trending topic.",
+            "trending": True,
+            "category": "wellness"
+        },
+        {
+            "title": "Building Healthy Habits That Stick",
+            "reason": "Evergreen content with strong engagement.",
+            "trending": False,
+            "category": "wellness"
+        }
+    ]
+}
+
+@lru_cache(maxsize=64)
+def _fallback_topic_slice(category: str, count: int) -> tuple:
+    return tuple(_FALLBACK_TOPICS.get(category, _FALLBACK_TOPICS["nutrition"])[:count])
+
+def _fallback_topics(category: str, count: int) -> List[Dict[str, Any]]:
+    # Copy the dicts so callers can't mutate the shared constants
+    return [dict(topic) for topic in _fallback_topic_slice(category, count)]
 
 class TopicSuggestionAgent(BaseAgent):
     """
     Generates trending and relevant topic suggestions for blog posts.
     """
     
-    def __init__(self, model_name: str = "openai/gpt-oss-20b"):
-        super().__init__(model_name)
+    def __init__(self, tier: str = "writer"):
+        super().__init__(tier)
     
     async def run(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -42,162 +185,35 @@ class TopicSuggestionAgent(BaseAgent):
         existing_topics = input_data.get("existing_topics", [])
         count = input_data.get("count", 5)
         
-        # Search for trending topics
+        # Search for trending topics while the prompt is built
         search_query = f"trending {category} health fitness topics 2024"
-        web_results = await search_web(search_query, num_results=3)
+        web_task = asyncio.create_task(search_web(search_query, num_results=3))
         
         # Generate topic suggestions using AI
-        prompt = f"""You are an expert content strategist for health and fitness blogs.
-
-Generate {count} engaging blog topic suggestions for the "{category}" category.
-
-Consider:
-- Current trends in health and fitness
-- High search volume topics
-- Evergreen content that performs well
-- Topics that align with user interests
+        prompt = f"""Generate {count} engaging blog topic suggestions for the "{category}" category.
 
 Avoid these existing topics: {', '.join(existing_topics) if existing_topics else "None"}
-
-For each topic, provide:
-- A compelling title
-- A reason why it's a good topic (trending, high engagement, etc.)
-- Whether it's currently trending (true/false)
-- The category it belongs to
-
-Format your response as JSON:
-{{
-    "suggested_topics": [
-        {{
-            "title": "Topic Title Here",
-            "reason": "Why this topic is good (e.g., High search volume and trending topic)",
-            "trending": true,
-            "category": "{category}"
-        }}
-    ]
-}}
 """
+        web_results = await web_task
         
         try:
-            response = self.run_prompt(prompt)
+            response = await self.arun_json_prompt(prompt, system=TOPIC_SYSTEM_PROMPT)
             if response:
                 # Try to parse JSON from response
-                json_match = re.search(r'\{[^{}]*"suggested_topics"[^{}]*\[[^\]]*\][^{}]*\}', response, re.DOTALL)
-                if json_match:
-                    parsed = json.loads(json_match.group())
-                    topics = parsed.get("suggested_topics", [])
+                parsed = extract_json(response, TOPIC_KEYS)
+                topics = parsed.get("suggested_topics") if isinstance(parsed, dict) else None
+                if topics:
                     # Ensure we have the right count
                     return {"suggested_topics": topics[:count]}
                 else:
                     # Fallback: generate default topics
                     return self._generate_fallback_topics(category, count)
         except Exception as e:
-            print(f"[TopicSuggestionAgent] Error: {e}")
+            logger.exception("Topic suggestion failed")
             return self._generate_fallback_topics(category, count)
         
         return self._generate_fallback_topics(category, count)
     
     def _generate_fallback_topics(self, category: str, count: int) -> Dict[str, List[Dict[str, Any]]]:
         """Generate fallback topics if AI fails"""
-        fallback_topics = {
-            "nutrition": [
-                {
-                    "title": "Intermittent Fasting: Is It Right for You?",
-                    "reason": "High search volume and trending topic.",
-                    "trending": True,
-                    "category": "nutrition"
-                },
-                {
-                    "title": "The Benefits of Probiotics for Gut Health",
-                    "reason": "Aligns with your best-performing category.",
-                    "trending": True,
-                    "category": "nutrition"
-                },
-                {
-                    "title": "Plant-Based Protein: Complete Guide",
-                    "reason": "Evergreen content with strong engagement.",
-                    "trending": False,
-                    "category": "nutrition"
-                },
-                {
-                    "title": "Meal Prep Hacks for Busy Professionals",
-                    "reason": "High search volume and trending topic.",
-                    "trending": True,
-                    "category": "nutrition"
-                },
-                {
-                    "title": "Understanding Macronutrients: A Beginner's Guide",
-                    "reason": "Evergreen content with strong engagement.",
-                    "trending": False,
-                    "category": "nutrition"
-                }
-            ],
-            "fitness": [
-                {
-                    "title": "Home Workouts: No Equipment Needed",
-                    "reason": "High search volume and trending topic.",
-                    "trending": True,
-                    "category": "fitness"
-                },
-                {
-                    "title": "HIIT vs. Cardio: What's Best for Weight Loss?",
-                    "reason": "Aligns with your best-performing category.",
-                    "trending": True,
-                    "category": "fitness"
-                },
-                {
-                    "title": "Building Muscle: A Complete Guide",
-                    "reason": "Evergreen content with strong engagement.",
-                    "trending": False,
-                    "category": "fitness"
-                },
-                {
-                    "title": "Recovery Techniques for Athletes",
-                    "reason": "High search volume and trending topic.",
-                    "trending": True,
-                    "category": "fitness"
-                },
-                {
-                    "title": "Yoga for Beginners: Getting Started",
-                    "reason": "Evergreen content with strong engagement.",
-                    "trending": False,
-                    "category": "fitness"
-                }
-            ],
-            "wellness": [
-                {
-                    "title": "How Sleep Affects Your Mental Wellness",
-                    "reason": "High search volume and trending topic.",
-                    "trending": True,
-                    "category": "wellness"
-                },
-                {
-                    "title": "Mindfulness and Meditation for Stress Relief",
-                    "reason": "Aligns with your best-performing category.",
-                    "trending": True,
-                    "category": "wellness"
-                },
-                {
-                    "title": "The Science of Sleep and Cognitive Performance",
-                    "reason": "Evergreen content with strong engagement.",
-                    "trending": False,
-                    "category": "wellness"
-                },
-                {
-                    "title": "Managing Anxiety Through Exercise",
-                    "reason": "High search volume and trending topic.",
-                    "trending": True,
-                    "category": "wellness"
-                },
-                {
-                    "title": "Building Healthy Habits That Stick",
-                    "reason": "Evergreen content with strong engagement.",
-                    "trending": False,
-                    "category": "wellness"
-                }
-            ]
-        }
-        
-        topics = fallback_topics.get(category, fallback_topics["nutrition"])
-        return {"suggested_topics": topics[:count]}
-
+        return {"suggested_topics": _fallback_topics(category, count)}
@@ -1,7 +1,189 @@
 # ai_blog_agents/agents/translation_agent.py
+import asyncio
+import json
+import logging
 import os
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from langchain_core.messages import SystemMessage
 from langchain_groq import ChatGroq
 from app.ai_blog_agents.agents.base_agent import BaseAgent
+from app.ai_blog_agents.agents.batch_queue import BatchQueue
+from app.ai_blog_agents.utils.json_extract import extract_json
+from app.ai_blog_agents.utils.llm_cache import LLMCache
+
+logger = logging.getLogger(__name__)
+
+TRANSLATION_KEYS = {"title": str, "content": str}
+BATCH_KEYS = {"translations": list}
+
+_LANG_NAMES = MappingProxyType({
+    "en": "English",
+    "es": "Spanish",
+    "fr": "French",
+    "de": "German",
+    "it": "Italian",
+    "pt": "Portuguese",
+    "zh": "Chinese",
+    "ja": "Japanese",
+    "ko": "Korean",
+    "ar": "Arabic",
+    "ru": "Russian",
+    "hi": "Hindi"
+})
+
+# Fixed pieces of the user message, built once
+_CONTENT_HEADER = "BLOG CONTENT (translate everything including headings):"
+_JSON_TAIL = (
+    "Respond with ONLY a JSON object, no other text:\n"
+    '{"title": "<translated title, plain text without markdown or prefixes>", "content": "<complete translated content with all markdown formatting>"}'
+)
+_BATCH_JSON_TAIL = (
+    "Respond with ONLY a JSON object, no other text, with one entry per item in the same order:\n"
+    '{"translations": [{"title": "<translated title, or empty if none was given>", "content": "<complete translated content with all markdown formatting>"}]}'
+)
+
+# Leading markdown/quotes with an optional "Title:"-style label, or trailing markdown/quotes
+_TITLE_CLEANUP = re.compile(r'^[\s#*"\']*(?:(?:translated\s*title|title|translated)\s*:[\s#*"\']*)?|[\s#*"\']+$', re.IGNORECASE)
+
+# Finished translations keyed by (languages, title, content); entries live for a day
+translation_cache = LLMCache(maxsize=256, ttl=86400, prefix="trans")
+
+# Static translation rules, sent as a system message so the prefix is identical across calls
+_SYSTEM_PROMPT_TEMPLATE = """You are a professional translator. Translate the following blog content from {source_lang_name} to {target_lang_name}.
+
+CRITICAL TRANSLATION RULES - READ CAREFULLY:
+
+1. TRANSLATE EVERYTHING:
+   ✓ Blog title (if provided)
+   ✓ ALL markdown headings (# Heading, ## Heading, ### Heading, etc.)
+   ✓ ALL paragraph text
+   ✓ ALL list items (- item, * item, 1. item)
+   ✓ ALL content text
+
+2. PRESERVE MARKDOWN STRUCTURE EXACTLY:
+   ✓ Keep ALL markdown symbols: #, ##, ###, **, *, -, 1., etc.
+   ✓ Only translate the TEXT after markdown symbols
+   ✓ Example: '## Introduction' → '## Introducción' (Spanish) or '## Introduction' (French)
+   ✓ Example: '### Key Points' → '### Points Clés' (French)
+   ✓ Preserve line breaks, spacing, and formatting
+
+3. HEADING TRANSLATION EXAMPLES:
+   Original: ## The Benefits of Exercise
+   {target_lang_name}: ## [Translated version of 'The Benefits of Exercise']
+
+   Original: ### How to Get Started
+   {target_lang_name}: ### [Translated version of 'How to Get Started']
+
+4. DO NOT TRANSLATE:
+   ✗ Placeholders like {{§0§}} - copy them exactly where they appear
+   ✗ Technical terms that are universal (API, HTML, CSS, etc.)
+
+5. MAINTAIN:
+   ✓ Original tone and style
+   ✓ Professional language
+   ✓ All formatting and structure"""
+
+@lru_cache(maxsize=144)
+def _system_prompt(source_lang_name: str, target_lang_name: str) -> SystemMessage:
+    # One prebuilt message per language pair (12 x 12 known languages)
+    return SystemMessage(content=_SYSTEM_PROMPT_TEMPLATE.format(
+        source_lang_name=source_lang_name,
+        target_lang_name=target_lang_name
+    ))
+
+# Code blocks, inline code and URLs are swapped for {§N§} placeholders before translation
+# and restored afterwards, so they are preserved exactly and don't cost prompt tokens
+_PROTECTED_RE = re.compile(r'```.*?```|`[^`\n]+`|https?://[^\s)\]>"\']+', re.DOTALL)
+_PLACEHOLDER_RE = re.compile(r'\{§(\d+)§\}')
+_PARTIAL_PLACEHOLDER_RE = re.compile(r'\{(?:§\d*§?)?$')
+
+def _mask_protected(text: str):
+    """
+    Returns (masked_text, table) where table[i] is the original text behind {§i§}.
+    """
+    table = []
+    def stash(match):
+        table.append(match.group(0))
+        return f"{{§{len(table) - 1}§}}"
+    return _PROTECTED_RE.sub(stash, text), table
+
+def _unmask_protected(text: str, table: list) -> str:
+    if not table:
+        return text
+    return _PLACEHOLDER_RE.sub(
+        lambda m: table[int(m.group(1))] if int(m.group(1)) < len(table) else m.group(0),
+        text
+    )
+
+# Content longer than this is translated in blocks of up to LONG_CONTENT_BLOCK_CHARS
+LONG_CONTENT_CHARS = 10000
+LONG_CONTENT_BLOCK_CHARS = 2500
+LONG_CONTENT_CONCURRENCY = 8
+
+_HEADING_RE = re.compile(r'^#{1,6} ')
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+')
+
+def _hard_split(paragraph: str, max_chars: int) -> list:
+    """
+    Splits an oversized paragraph into (separator, piece) units of up to max_chars:
+    on line breaks, then sentence ends, then at max_chars as a last resort.
+    """
+    units = []
+    for line in paragraph.split("\n"):
+        sep = "\n" if units else ""
+        if len(line) <= max_chars:
+            units.append((sep, line))
+            continue
+        for sentence in _SENTENCE_END_RE.split(line):
+            for start in range(0, len(sentence), max_chars):
+                units.append((sep, sentence[start:start + max_chars]))
+                sep = ""
+            sep = " "
+    return units
+
+def _split_markdown(content: str, max_chars: int = LONG_CONTENT_BLOCK_CHARS) -> list:
+    """
+    Splits markdown into (separator, block) pairs with blocks of up to max_chars, breaking
+    at headings and blank lines but never inside a fenced code block. Paragraphs longer
+    than max_chars are split on lines, then sentences.
+    "".join(sep + block) rebuilds the content (with blank-line runs collapsed).
+    """
+    paragraphs = []
+    current = []
+    in_fence = False
+    for line in content.split("\n"):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        if not in_fence and _HEADING_RE.match(line) and current:
+            paragraphs.append("\n".join(current))
+            current = []
+        if not line.strip() and not in_fence:
+            if current:
+                paragraphs.append("\n".join(current))
+                current = []
+            continue
+        current.append(line)
+    if current:
+        paragraphs.append("\n".join(current))
+    
+    units = []
+    for paragraph in paragraphs:
+        pieces = _hard_split(paragraph, max_chars) if len(paragraph) > max_chars else [("", paragraph)]
+        units.append(("\n\n" if units else "", pieces[0][1]))
+        units.extend(pieces[1:])
+    
+    blocks = []
+    for sep, text in units:
+        if blocks and len(blocks[-1][1]) + len(sep) + len(text) <= max_chars:
+            blocks[-1] = (blocks[-1][0], blocks[-1][1] + sep + text)
+        else:
+            blocks.append((sep, text))
+    return blocks
+
+def _is_noop_translation(content: str, source_language: str, target_language: str) -> bool:
+    return not content or not content.strip() or source_language.strip().lower() == target_language.strip().lower()
 
 class TranslationAgent(BaseAgent):
     """
@@ -10,10 +192,150 @@ class TranslationAgent(BaseAgent):
     
     def __init__(self):
         super().__init__()
+        # Coalesces concurrent translations for the same language pair into one call
+        self._batch_queue = BatchQueue(self._translate_batch)
+    
+    @staticmethod
+    def _clean_title(translated_title: str) -> str:
+        """
+        Removes common prefixes, markdown and quotes the model may wrap around a title.
+        """
+        return _TITLE_CLEANUP.sub("", translated_title).strip()
+    
+    def _finalize_title(self, raw_title, title: str) -> str:
+        """
+        Cleans a translated title, falling back to the original when it looks invalid.
+        """
+        translated_title = self._clean_title(raw_title) if isinstance(raw_title, str) else ""
+        if not translated_title or len(translated_title) < 3:
+            logger.warning("Title translation seems invalid, using original")
+            return title
+        logger.debug("Translated title: %r (original: %r)", translated_title, title)
+        return translated_title
+    
+    def _language_names(self, source_language: str, target_language: str):
+        """
+        Maps language codes to the names used in prompts; unknown codes pass through.
+        """
+        return (
+            _LANG_NAMES.get(source_language.lower(), source_language),
+            _LANG_NAMES.get(target_language.lower(), target_language)
+        )
+    
+    def _content_prompt(self, content: str, target_lang_name: str) -> str:
+        return (
+            f"{_CONTENT_HEADER}\n{content}\n\n"
+            f"Provide the complete translated content in {target_lang_name}, maintaining all markdown formatting:"
+        )
+    
+    async def _translate_one(self, content: str, title: str, source_lang_name: str, target_lang_name: str):
+        """
+        Translates one blog, splitting very long content into blocks translated in parallel.
+        Returns (translated_content, translated_title), or None if the model gave no response.
+        """
+        if len(content) > LONG_CONTENT_CHARS:
+            return await self._translate_long(content, title, source_lang_name, target_lang_name)
+        return await self._translate_block(content, title, source_lang_name, target_lang_name)
+    
+    async def _translate_block(self, content: str, title: str, source_lang_name: str, target_lang_name: str):
+        """
+        Translates content (and title, if given) in a single call, whatever its length.
+        Returns (translated_content, translated_title), or None if the model gave no response.
+        """
+        system = _system_prompt(source_lang_name, target_lang_name)
+        
+        if title:
+            # Title and content come back together in one JSON object, so one call covers both
+            prompt = f"BLOG TITLE (translate this): {title}\n\n{_CONTENT_HEADER}\n{content}\n\n{_JSON_TAIL}"
+        else:
+            prompt = self._content_prompt(content, target_lang_name)
+        
+        logger.debug("Translating to %s...", target_lang_name)
+        if title:
+            logger.debug("Title to translate: %r", title)
+        logger.debug("Content length: %d characters", len(content))
+        
+        if title:
+            response = await self.arun_json_prompt(prompt, system=system)
+        else:
+            response = await self.arun_prompt(prompt, system=system)
+        
+        if not response:
+            return None
+        
+        translated_content = response.strip()
+        translated_title = None
+        if title:
+            data = extract_json(response, TRANSLATION_KEYS)
+            if isinstance(data, dict) and isinstance(data.get("content"), str) and data["content"].strip():
+                translated_content = data["content"].strip()
+                translated_title = self._finalize_title(data.get("title"), title)
+            else:
+                logger.warning("Could not parse JSON response, using raw text as content")
+                translated_title = title
+        return translated_content, translated_title
+    
+    async def _translate_long(self, content: str, title: str, source_lang_name: str, target_lang_name: str):
+        """
+        Translates long content block by block (at most LONG_CONTENT_CONCURRENCY at once)
+        and reassembles it. The title rides along with the first block.
+        Returns None if any block fails, rather than mixing languages.
+        """
+        blocks = _split_markdown(content)
+        logger.debug("Translating %d chars as %d blocks", len(content), len(blocks))
+        sem = asyncio.Semaphore(LONG_CONTENT_CONCURRENCY)
+        
+        async def translate_block(i: int, block: str):
+            async with sem:
+                return await self._translate_block(block, title if i == 0 else None, source_lang_name, target_lang_name)
+        
+        results = await asyncio.gather(*(translate_block(i, block) for i, (_, block) in enumerate(blocks)))
+        if any(result is None for result in results):
+            return None
+        return "".join(sep + result[0] for (sep, _), result in zip(blocks, results)), results[0][1]
+    
+    async def _translate_batch(self, key, items):
+        """
+        BatchQueue flush: translates several (content, title) items for one language pair
+        in a single call, falling back to per-item calls if the batch reply doesn't line up.
+        """
+        source_lang_name, target_lang_name = key
+        if len(items) == 1:
+            content, title = items[0]
+            return [await self._translate_one(content, title, source_lang_name, target_lang_name)]
+        
+        system = _system_prompt(source_lang_name, target_lang_name)
+        items_text = "\n".join(
+            f"ITEM {i}\nBLOG TITLE (translate this): {title or ''}\n{_CONTENT_HEADER}\n{content}\n"
+            for i, (content, title) in enumerate(items, 1)
+        )
+        prompt = f"Translate each of the following {len(items)} blog items independently.\n\n{items_text}\n{_BATCH_JSON_TAIL}"
+        
+        logger.debug("Translating batch of %d items to %s...", len(items), target_lang_name)
+        response = await self.arun_json_prompt(prompt, system=system)
+        data = extract_json(response, BATCH_KEYS) if response else None
+        translations = data.get("translations") if isinstance(data, dict) else None
+        
+        if (
+            not isinstance(translations, list)
+            or len(translations) != len(items)
+            or not all(isinstance(t, dict) and isinstance(t.get("content"), str) and t["content"].strip() for t in translations)
+        ):
+            logger.warning("Batch response did not match %d items, translating individually", len(items))
+            return list(await asyncio.gather(*(
+                self._translate_one(content, title, source_lang_name, target_lang_name)
+                for content, title in items
+            )))
+        
+        return [
+            (t["content"].strip(), self._finalize_title(t.get("title"), title) if title else None)
+            for t, (content, title) in zip(translations, items)
+        ]
     
     async def translate(self, content: str, target_language: str = "es", source_language: str = "en", title: str = None):
         """
         Translates content and title to target language.
+        Concurrent requests for the same language pair are batched into one model call.
         
         Args:
             content: Text to translate (includes markdown headings)
@@ -24,6 +346,16 @@ class TranslationAgent(BaseAgent):
         Returns:
             Dictionary with translated_content and translated_title
         """
+        # Nothing to translate: same language or empty content, so skip the model entirely
+        if _is_noop_translation(content, source_language, target_language):
+            return {
+                "translated_content": content,
+                "translated_title": title,
+                "source_language": source_language,
+                "target_language": target_language,
+                "success": True
+            }
+        
         if not self.model:
             return {
                 "translated_content": content,
@@ -33,141 +365,26 @@ class TranslationAgent(BaseAgent):
             }
         
         try:
-            language_names = {
-                "en": "English",
-                "es": "Spanish",
-                "fr": "French",
-                "de": "German",
-                "it": "Italian",
-                "pt": "Portuguese",
-                "zh": "Chinese",
-                "ja": "Japanese",
-                "ko": "Korean",
-                "ar": "Arabic",
-                "ru": "Russian",
-                "hi": "Hindi"
-            }
+            source_lang_name, target_lang_name = self._language_names(source_language, target_language)
             
-            target_lang_name = language_names.get(target_language.lower(), target_language)
-            source_lang_name = language_names.get(source_language.lower(), source_language)
-            
-            # Build comprehensive prompt that explicitly instructs to translate headings and title
-            prompt_parts = [
-                f"You are a professional translator. Translate the following blog content from {source_lang_name} to {target_lang_name}.",
-                "",
-                "CRITICAL TRANSLATION RULES - READ CAREFULLY:",
-                "",
-                "1. TRANSLATE EVERYTHING:",
-                "   ✓ Blog title (if provided above)",
-                "   ✓ ALL markdown headings (# Heading, ## Heading, ### Heading, etc.)",
-                "   ✓ ALL paragraph text",
-                "   ✓ ALL list items (- item, * item, 1. item)",
-                "   ✓ ALL content text",
-                "",
-                "2. PRESERVE MARKDOWN STRUCTURE EXACTLY:",
-                "   ✓ Keep ALL markdown symbols: #, ##, ###, **, *, -, 1., etc.",
-                "   ✓ Only translate the TEXT after markdown symbols",
-                "   ✓ Example: '## Introduction' → '## Introducción' (Spanish) or '## Introduction' (French)",
-                "   ✓ Example: '### Key Points' → '### Points Clés' (French)",
-                "   ✓ Preserve line breaks, spacing, and formatting",
-                "",
-                "3. HEADING TRANSLATION EXAMPLES:",
-                "   Original: ## The Benefits of Exercise",
-                f"   {target_lang_name}: ## [Translated version of 'The Benefits of Exercise']",
-                "",
-                "   Original: ### How to Get Started",
-                f"   {target_lang_name}: ### [Translated version of 'How to Get Started']",
-                "",
-                "4. DO NOT TRANSLATE:",
-                "   ✗ Code blocks (```code```)",
-                "   ✗ URLs (http://, https://)",
-                "   ✗ Technical terms that are universal (API, HTML, CSS, etc.)",
-                "",
-                "5. MAINTAIN:",
-                "   ✓ Original tone and style",
-                "   ✓ Professional language",
-                "   ✓ All formatting and structure",
-                ""
-            ]
-            
-            if title:
-                prompt_parts.append(f"BLOG TITLE (translate this): {title}")
-                prompt_parts.append("")
-            
-            # Use full content for translation (AI models can handle reasonable lengths)
-            # For very long content (>10000 chars), we'll let the model handle it
-            if len(content) > 10000:
-                print(f"[TranslationAgent] Warning: Very long content ({len(content)} chars), translation may take longer")
-            
-            prompt_parts.extend([
-                "BLOG CONTENT (translate everything including headings):",
-                content,
-                "",
-                f"Provide the complete translated content in {target_lang_name}, maintaining all markdown formatting:"
-            ])
-            
-            prompt = "\n".join(prompt_parts)
-            
-            print(f"[TranslationAgent] Translating to {target_lang_name}...")
-            if title:
-                print(f"[TranslationAgent] Title to translate: '{title}'")
-            print(f"[TranslationAgent] Content length: {len(content)} characters")
-            
-            response = self.run_prompt(prompt)
+            # Re-translations of unchanged content are served from the translation cache
+            cache_key = f"{source_lang_name}|{target_lang_name}|{title or ''}|{content}"
+            cached = translation_cache.get(target_lang_name, cache_key)
+            if cached is not None:
+                result = tuple(json.loads(cached))
+            else:
+                masked_content, protected = _mask_protected(content)
+                result = await self._batch_queue.submit(
+                    (source_lang_name, target_lang_name),
+                    (masked_content, title),
+                    size=len(masked_content) + len(title or "")
+                )
+                if result:
+                    result = (_unmask_protected(result[0], protected), result[1])
+                    translation_cache.set(target_lang_name, cache_key, json.dumps(result))
             
-            if response:
-                translated_content = response.strip()
-                translated_title = None
-                
-                # If title was provided, translate it separately for better accuracy
-                if title:
-                    title_prompt = f"""Translate ONLY the blog title from {source_lang_name} to {target_lang_name}.
-
-Original Title: {title}
-
-Instructions:
-- Translate the title naturally and accurately
-- Maintain the same tone and style
-- Keep it engaging and SEO-friendly
-- Return ONLY the translated title, nothing else
-- Do NOT include any prefixes like "Translated title:" or "Title:"
-- Do NOT include any markdown formatting
-
-Translated Title:"""
-                    
-                    print(f"[TranslationAgent] Translating title separately...")
-                    title_response = self.run_prompt(title_prompt)
-                    if title_response:
-                        translated_title = title_response.strip()
-                        
-                        # Clean up response - remove common prefixes and markdown
-                        cleanup_patterns = [
-                            "Translated title:",
-                            "Title:",
-                            "Translated:",
-                            "#",
-                            "**",
-                            "*"
-                        ]
-                        for pattern in cleanup_patterns:
-                            if translated_title.startswith(pattern):
-                                translated_title = translated_title[len(pattern):].strip()
-                            if translated_title.endswith(pattern):
-                                translated_title = translated_title[:-len(pattern)].strip()
-                        
-                        # Remove quotes if present
-                        translated_title = translated_title.strip('"').strip("'").strip()
-                        
-                        # Final validation
-                        if not translated_title or len(translated_title) < 3:
-                            print(f"[TranslationAgent] Warning: Title translation seems invalid, using original")
-                            translated_title = title
-                        else:
-                            print(f"[TranslationAgent] ✅ Translated title: '{translated_title}' (original: '{title}')")
-                    else:
-                        print(f"[TranslationAgent] Warning: No title translation response, using original")
-                        translated_title = title
-                
+            if result:
+                translated_content, translated_title = result
                 return {
                     "translated_content": translated_content,
                     "translated_title": translated_title,
@@ -183,9 +400,7 @@ Translated Title:"""
                     "success": False
                 }
         except Exception as e:
-            import traceback
-            print(f"[TranslationAgent] Error: {str(e)}")
-            print(traceback.format_exc())
+            logger.exception("Translation failed")
             return {
                 "translated_content": content,
                 "translated_title": title,
@@ -193,3 +408,27 @@ Translated Title:"""
                 "success": False
             }
 
+    async def translate_stream(self, content: str, target_language: str = "es", source_language: str = "en"):
+        """
+        Streams the translated content chunk by chunk, so clients can render before the tail arrives.
+        Titles are not streamed; use translate for the title + content dict.
+        Yields nothing if the model is not initialized.
+        """
+        if _is_noop_translation(content, source_language, target_language):
+            if content:
+                yield content
+            return
+        source_lang_name, target_lang_name = self._language_names(source_language, target_language)
+        system = _system_prompt(source_lang_name, target_lang_name)
+        masked_content, protected = _mask_protected(content)
+        pending = ""
+        async for chunk in self.astream_prompt(self._content_prompt(masked_content, target_lang_name), system=system):
+            pending += chunk
+            # Hold back a placeholder that is split across chunks until it is complete
+            partial = _PARTIAL_PLACEHOLDER_RE.search(pending)
+            cut = partial.start() if partial else len(pending)
+            ready, pending = pending[:cut], pending[cut:]
+            if ready:
+                yield _unmask_protected(ready, protected)
+        if pending:
+            yield _unmask_protected(pending, protected)
@@ -1,12 +1,22 @@
 # ai_blog_agents/graph/blog_generation_graph.py
+import logging
 from typing import Dict, Any, Optional
 import asyncio
 from app.ai_blog_agents.agents.blog_planner_agent import BlogPlannerAgent
 from app.ai_blog_agents.agents.engagement_agent import EngagementAgent
+from app.ai_blog_agents.agents.fused_postprocess_agent import fused_blog_postprocess
 from app.ai_blog_agents.agents.blog_writer_agent import generate_blog
 from app.ai_blog_agents.agents.seo_optimizer_agent import optimize_blog
 from app.ai_blog_agents.agents.summarizer_agent import summarize_blog
 
+logger = logging.getLogger(__name__)
+
+# Characters of generated content given to the engagement agent for context
+ENGAGEMENT_CONTEXT_CHARS = 1000
+
+async def _empty_result() -> Dict[str, Any]:
+    return {}
+
 class BlogGenerationGraph:
     """
     Orchestrates the complete blog generation workflow:
@@ -21,13 +31,13 @@ class BlogGenerationGraph:
         try:
             self.planner_agent = BlogPlannerAgent()
         except Exception as e:
-            print(f"[BlogGenerationGraph] Warning: Failed to initialize BlogPlannerAgent: {e}")
+            logger.warning("Failed to initialize BlogPlannerAgent: %s", e)
             self.planner_agent = None
         
         try:
             self.engagement_agent = EngagementAgent()
         except Exception as e:
-            print(f"[BlogGenerationGraph] Warning: Failed to initialize EngagementAgent: {e}")
+            logger.warning("Failed to initialize EngagementAgent: %s", e)
             self.engagement_agent = None
 
     async def run_planning_phase(self, topic: str, user_id: str = None) -> Dict[str, Any]:
@@ -70,28 +80,31 @@ class BlogGenerationGraph:
                         suggested_tags.extend([w for w in words if len(w) > 4][:2])
                 suggested_tags = list(set(suggested_tags))[:5]  # Limit to 5 unique tags
 
-            # 2️⃣ SEO Optimization: Get optimized title and meta
-            seo_result = {}
-            try:
-                seo_result = await optimize_blog(suggested_title, "", "")
-                if seo_result.get("title"):
-                    suggested_title = seo_result.get("title", suggested_title)
-                if seo_result.get("tags"):
-                    suggested_tags = list(set(suggested_tags + seo_result.get("tags", [])))[:10]
-            except Exception as e:
-                print(f"[BlogGenerationGraph] SEO optimization error: {e}")
+            # 2️⃣ SEO Optimization + 3️⃣ Engagement: both only need the plan, so run them together
+            engagement_task = (
+                self.engagement_agent.run({
+                    "user_id": user_id,
+                    "tags": list(suggested_tags),
+                    "content": ""  # No content yet in planning phase
+                })
+                if self.engagement_agent else _empty_result()
+            )
+            seo_result, engagement_result = await asyncio.gather(
+                optimize_blog(suggested_title, "", ""),
+                engagement_task,
+                return_exceptions=True
+            )
+            if isinstance(seo_result, Exception):
+                logger.error("SEO optimization failed", exc_info=seo_result)
+                seo_result = {}
+            if isinstance(engagement_result, Exception):
+                logger.error("Engagement agent failed", exc_info=engagement_result)
+                engagement_result = {}
 
-            # 3️⃣ Engagement: Get engagement suggestions based on topic and tags
-            engagement_result = {}
-            if self.engagement_agent:
-                try:
-                    engagement_result = await self.engagement_agent.run({
-                        "user_id": user_id,
-                        "tags": suggested_tags,
-                        "content": ""  # No content yet in planning phase
-                    })
-                except Exception as e:
-                    print(f"[BlogGenerationGraph] Engagement agent error: {e}")
+            if seo_result.get("title"):
+                suggested_title = seo_result.get("title", suggested_title)
+            if seo_result.get("tags"):
+                suggested_tags = list(set(suggested_tags + seo_result.get("tags", [])))[:10]
 
             return {
                 "topic": topic,
@@ -103,9 +116,7 @@ class BlogGenerationGraph:
                 "success": True
             }
         except Exception as e:
-            import traceback
-            print(f"[BlogGenerationGraph] Error in planning phase: {e}")
-            print(traceback.format_exc())
+            logger.exception("Planning phase failed")
             return {
                 "topic": topic,
                 "outline": {},
@@ -117,51 +128,70 @@ class BlogGenerationGraph:
                 "error": str(e)
             }
 
+    async def _run_postprocess_separately(self, final_title: str, content: str, generated_mindmap: Dict[str, Any], user_id: str = None):
+        """
+        Fallback for run_generation_phase when the fused postprocess call is unavailable:
+        summary and SEO run together, then engagement uses the SEO tags.
+        """
+        # 2️⃣ Summarization + 3️⃣ SEO Optimization: independent passes over the content, run together
+        summary_result = {}
+        seo_result = {}
+        if content:
+            summary_result, seo_result = await asyncio.gather(
+                summarize_blog(final_title, content),
+                optimize_blog(final_title, "", content),
+                return_exceptions=True
+            )
+            if isinstance(summary_result, Exception):
+                logger.error("Summarization failed", exc_info=summary_result)
+                summary_result = {}
+            if isinstance(seo_result, Exception):
+                logger.error("SEO optimization failed", exc_info=seo_result)
+                seo_result = {}
+
+        # 4️⃣ Engagement: Get engagement suggestions with full content
+        engagement_result = {}
+        if self.engagement_agent and content:
+            # Slice the context once; the engagement agent only needs the opening
+            engagement_context = content[:ENGAGEMENT_CONTEXT_CHARS]
+            try:
+                tags = generated_mindmap.get("tags", [])
+                if seo_result.get("tags"):
+                    tags = list(set(tags + seo_result.get("tags", [])))
+                engagement_result = await self.engagement_agent.run({
+                    "user_id": user_id,
+                    "tags": tags,
+                    "content": engagement_context
+                })
+            except Exception as e:
+                logger.exception("Engagement agent failed")
+
+        return summary_result, seo_result, engagement_result
+
     async def run_generation_phase(self, topic: str, outline: Dict[str, Any] = None, title: str = None, user_id: str = None) -> Dict[str, Any]:
         """
         Phase 2: Full Generation - Generate complete blog content.
         This is called after user approves the outline.
         """
         try:
-            # 1️⃣ Writer: Generate full blog content
-            blog_result = await generate_blog(topic)
+            # 1️⃣ Writer: Generate full blog content from the approved outline (planner's mindmap)
+            blog_result = await generate_blog(topic, mindmap=outline)
             content = blog_result.get("content", "")
             generated_mindmap = blog_result.get("mindmap", outline or {})
             
             # Use provided title or generated title
             final_title = title or generated_mindmap.get("title", topic)
             
-            # 2️⃣ Summarization: Generate summary and keywords
-            summary_result = {}
-            if content:
-                try:
-                    summary_result = await summarize_blog(final_title, content)
-                except Exception as e:
-                    print(f"[BlogGenerationGraph] Summarization error: {e}")
-
-            # 3️⃣ SEO Optimization: Optimize with full content
-            seo_result = {}
-            if content:
-                try:
-                    summary_text = summary_result.get("summary", "")
-                    seo_result = await optimize_blog(final_title, summary_text, content)
-                except Exception as e:
-                    print(f"[BlogGenerationGraph] SEO optimization error: {e}")
-
-            # 4️⃣ Engagement: Get engagement suggestions with full content
-            engagement_result = {}
-            if self.engagement_agent and content:
-                try:
-                    tags = generated_mindmap.get("tags", [])
-                    if seo_result.get("tags"):
-                        tags = list(set(tags + seo_result.get("tags", [])))
-                    engagement_result = await self.engagement_agent.run({
-                        "user_id": user_id,
-                        "tags": tags,
-                        "content": content[:1000]  # First 1000 chars for context
-                    })
-                except Exception as e:
-                    print(f"[BlogGenerationGraph] Engagement agent error: {e}")
+            # 2️⃣-4️⃣ Summary, SEO and engagement in one fused call over the content
+            fused = await fused_blog_postprocess(final_title, content, generated_mindmap.get("tags", [])) if content else None
+            if fused:
+                summary_result = {"summary": fused["summary"], "keywords": fused["keywords"]}
+                seo_result = {"seo_meta": fused["seo_meta"], "tags": fused["tags"]}
+                engagement_result = fused["engagement"]
+            else:
+                summary_result, seo_result, engagement_result = await self._run_postprocess_separately(
+                    final_title, content, generated_mindmap, user_id
+                )
 
             return {
                 "topic": topic,
@@ -176,9 +206,7 @@ class BlogGenerationGraph:
                 "success": True
             }
         except Exception as e:
-            import traceback
-            print(f"[BlogGenerationGraph] Error in generation phase: {e}")
-            print(traceback.format_exc())
+            logger.exception("Generation phase failed")
             return {
                 "topic": topic,
                 "outline": outline or {},
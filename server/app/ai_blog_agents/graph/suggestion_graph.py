@@ -1,8 +1,38 @@
 # ai_blog_agents/graph/suggestion_graph.py
+import logging
 from typing import Dict, Any
 import asyncio
+from functools import lru_cache
 from app.ai_blog_agents.agents.engagement_agent import EngagementAgent
 from app.ai_blog_agents.agents.topic_suggestion_agent import TopicSuggestionAgent
+from app.ai_blog_agents.utils.json_extract import extract_json
+
+logger = logging.getLogger(__name__)
+
+SECTION_IDEA_KEYS = {"ideas": list}
+
+# Static topics used when the topic suggestion agent is unavailable
+_FALLBACK_TOPICS = {
+    "nutrition": [
+        {"title": "Intermittent Fasting: Is It Right for You?", "reason": "High search volume and trending topic.", "trending": True, "category": "nutrition"},
+        {"title": "The Benefits of Probiotics for Gut Health", "reason": "Aligns with your best-performing category.", "trending": True, "category": "nutrition"},
+        {"title": "Plant-Based Protein: Complete Guide", "reason": "Evergreen content with strong engagement.", "trending": False, "category": "nutrition"},
+    ],
+    "fitness": [
+        {"title": "Home Workouts: No Equipment Needed", "reason": "High search volume and trending topic.", "trending": True, "category": "fitness"},
+        {"title": "HIIT vs. Cardio: What's Best for Weight Loss?", "reason": "Aligns with your best-performing category.", "trending": True, "category": "fitness"},
+        {"title": "Building Muscle: A Complete Guide", "reason": "Evergreen content with strong engagement.", "trending": False, "category": "fitness"},
+    ],
+    "wellness": [
+        {"title": "How Sleep Affects Your Mental Wellness", "reason": "High search volume and trending topic.", "trending": True, "category": "wellness"},
+        {"title": "Mindfulness and Meditation for Stress Relief", "reason": "Aligns with your best-performing category.", "trending": True, "category": "wellness"},
+        {"title": "The Science of Sleep and Cognitive Performance", "reason": "Evergreen content with strong engagement.", "trending": False, "category": "wellness"},
+    ]
+}
+
+@lru_cache(maxsize=64)
+def _fallback_topic_slice(category: str, count: int) -> tuple:
+    return tuple(_FALLBACK_TOPICS.get(category, _FALLBACK_TOPICS["nutrition"])[:count])
 
 class BlogSuggestionGraph:
     """
@@ -17,13 +47,13 @@ class BlogSuggestionGraph:
         try:
             self.engagement_agent = EngagementAgent()
         except Exception as e:
-            print(f"[BlogSuggestionGraph] Warning: Failed to initialize EngagementAgent: {e}")
+            logger.warning("Failed to initialize EngagementAgent: %s", e)
             self.engagement_agent = None
         
         try:
             self.topic_suggestion_agent = TopicSuggestionAgent()
         except Exception as e:
-            print(f"[BlogSuggestionGraph] Warning: Failed to initialize TopicSuggestionAgent: {e}")
+            logger.warning("Failed to initialize TopicSuggestionAgent: %s", e)
             self.topic_suggestion_agent = None
 
     async def run(self, content: str = None, tags: list = None, user_id: str = None, category: str = None, count: int = 5) -> Dict[str, Any]:
@@ -47,28 +77,46 @@ class BlogSuggestionGraph:
         """
         results = {}
 
+        # Engagement, topic suggestions and section ideas are independent, so run them together
+        engagement_co = (
+            self.engagement_agent.run({
+                "user_id": user_id,
+                "tags": tags or [],
+                "content": content
+            })
+            if content and self.engagement_agent else asyncio.sleep(0, result=None)
+        )
+        topic_co = (
+            self.topic_suggestion_agent.run({
+                "user_id": user_id,
+                "category": category or "general",
+                "existing_topics": [],
+                "count": count
+            })
+            if self.topic_suggestion_agent else asyncio.sleep(0, result=None)
+        )
+        sections_co = self._generate_section_ideas(content, tags or []) if content else asyncio.sleep(0, result=[])
+        engagement_result, topic_result, new_sections = await asyncio.gather(
+            engagement_co, topic_co, sections_co, return_exceptions=True
+        )
+
         # If we have content, use engagement agent
         if content and self.engagement_agent:
-            try:
-                engagement_result = await self.engagement_agent.run({
-                    "user_id": user_id,
-                    "tags": tags or [],
-                    "content": content
+            if isinstance(engagement_result, Exception):
+                logger.error("Engagement agent failed", exc_info=engagement_result)
+                results.update({
+                    "suggested_tags": [],
+                    "improvements": "",
+                    "insights": "AI features temporarily unavailable.",
+                    "analytics": None
                 })
+            else:
                 results.update({
                     "suggested_tags": engagement_result.get("suggested_tags", []),
                     "improvements": engagement_result.get("improvements", ""),
                     "insights": engagement_result.get("insights", ""),
                     "analytics": engagement_result.get("analytics")
                 })
-            except Exception as e:
-                print(f"[BlogSuggestionGraph] Error running engagement agent: {e}")
-                results.update({
-                    "suggested_tags": [],
-                    "improvements": "",
-                    "insights": "AI features temporarily unavailable.",
-                    "analytics": None
-                })
         elif content:
             # Agent not initialized, provide defaults
             results.update({
@@ -80,27 +128,20 @@ class BlogSuggestionGraph:
 
         # Always generate topic suggestions
         if self.topic_suggestion_agent:
-            try:
-                topic_result = await self.topic_suggestion_agent.run({
-                    "user_id": user_id,
-                    "category": category or "general",
-                    "existing_topics": [],
-                    "count": count
-                })
-                results["suggested_topics"] = topic_result.get("suggested_topics", [])
-            except Exception as e:
-                print(f"[BlogSuggestionGraph] Error running topic suggestion agent: {e}")
+            if isinstance(topic_result, Exception):
+                logger.error("Topic suggestion agent failed", exc_info=topic_result)
                 results["suggested_topics"] = []
+            else:
+                results["suggested_topics"] = topic_result.get("suggested_topics", [])
         else:
             # Agent not initialized, provide fallback topics
             results["suggested_topics"] = self._get_fallback_topics(category or "general", count)
 
         # Generate new section ideas if content provided
-        if content:
-            new_sections = await self._generate_section_ideas(content, tags or [])
-            results["new_section_ideas"] = new_sections
-        else:
-            results["new_section_ideas"] = []
+        if isinstance(new_sections, Exception):
+            logger.error("Section idea generation failed", exc_info=new_sections)
+            new_sections = []
+        results["new_section_ideas"] = new_sections
 
         return results
 
@@ -118,47 +159,23 @@ and tags: {tags}
 Generate 3-5 new section ideas or multimedia suggestions that could make the blog more engaging.
 Return as a JSON list: ["Idea1", "Idea2", ...]
 """
-            response = self.engagement_agent.run_prompt(prompt)
+            response = await self.engagement_agent.arun_prompt(prompt)
             
             if not response:
                 return []
             
-            import json
-            import re
-            try:
-                start = response.find("[")
-                end = response.rfind("]")
-                if start != -1 and end != -1:
-                    return json.loads(response[start:end+1])
-            except Exception:
-                pass
+            # Bracket-aware parse; a {"ideas": [...]} style object is unwrapped to its list
+            data = extract_json(response, SECTION_IDEA_KEYS)
+            if isinstance(data, dict) and isinstance(data.get("ideas"), list):
+                return data["ideas"]
         except Exception as e:
-            print(f"[BlogSuggestionGraph] Error generating section ideas: {e}")
+            logger.exception("Section idea generation failed")
         
         return []
     
     def _get_fallback_topics(self, category: str, count: int) -> list:
         """Get fallback topic suggestions when AI is unavailable"""
-        fallback_topics = {
-            "nutrition": [
-                {"title": "Intermittent Fasting: Is It Right for You?", "reason": "High search volume and trending topic.", "trending": True, "category": "nutrition"},
-                {"title": "The Benefits of Probiotics for Gut Health", "reason": "Aligns with your best-performing category.", "trending": True, "category": "nutrition"},
-                {"title": "Plant-Based Protein: Complete Guide", "reason": "Evergreen content with strong engagement.", "trending": False, "category": "nutrition"},
-            ],
-            "fitness": [
-                {"title": "Home Workouts: No Equipment Needed", "reason": "High search volume and trending topic.", "trending": True, "category": "fitness"},
-                {"title": "HIIT vs. Cardio: What's Best for Weight Loss?", "reason": "Aligns with your best-performing category.", "trending": True, "category": "fitness"},
-                {"title": "Building Muscle: A Complete Guide", "reason": "Evergreen content with strong engagement.", "trending": False, "category": "fitness"},
-            ],
-            "wellness": [
-                {"title": "How Sleep Affects Your Mental Wellness", "reason": "High search volume and trending topic.", "trending": True, "category": "wellness"},
-                {"title": "Mindfulness and Meditation for Stress Relief", "reason": "Aligns with your best-performing category.", "trending": True, "category": "wellness"},
-                {"title": "The Science of Sleep and Cognitive Performance", "reason": "Evergreen content with strong engagement.", "trending": False, "category": "wellness"},
-            ]
-        }
-        topics = fallback_topics.get(category, fallback_topics["nutrition"])
-        return topics[:count]
-
+        return [dict(topic) for topic in _fallback_topic_slice(category, count)]
 
 # ------------------------------
 # Async runner for testing
@@ -1,8 +1,11 @@
 # ai_blog_agents/graph/blog_summarizer_graph.py
+import logging
 from typing import Dict, Any
 import asyncio
 from app.ai_blog_agents.agents.summarizer_agent import summarize_blog
 
+logger = logging.getLogger(__name__)
+
 # Note: This graph is not currently used in the blog router
 # Updated to use the function-based summarizer_agent
 
@@ -33,7 +36,7 @@ class BlogSummarizerGraph:
             result = await summarize_blog(title, content)
             return result
         except Exception as e:
-            print(f"[BlogSummarizerGraph] Error: {e}")
+            logger.exception("Blog summarization failed")
             return {
                 "summary": "",
                 "keywords": []
@@ -1,14 +1,21 @@
 # ai_blog_agents/tools/analytics_tool.py
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict
 
-def get_blog_analytics(blog_id: str) -> Dict:
-    """
-    Returns dummy analytics metrics
-    """
-    return {
+@lru_cache(maxsize=1024)
+def _cached_blog_analytics(blog_id: str):
+    # Read-only so the cached entry can't be changed through a caller's reference
+    return MappingProxyType({
         "views": 150,
         "likes": 45,
         "comments": 12,
         "shares": 5,
         "average_read_time": 4.5  # in minutes
-    }
+    })
+
+def get_blog_analytics(blog_id: str) -> Dict:
+    """
+    Returns dummy analytics metrics (memoized per blog_id; callers get their own copy)
+    """
+    return dict(_cached_blog_analytics(blog_id))
@@ -1,39 +1,75 @@
 # ai_blog_agents/tools/content_plan_tool.py
+import logging
 from typing import Dict, List
-import os
-from langchain_groq import ChatGroq
+from functools import lru_cache
+import copy
 import json
+from app.ai_blog_agents.agents._groq_client import get_groq, guarded_invoke
+from app.ai_blog_agents.agents._models import DEFAULT_TIER, resolve_model
+from app.ai_blog_agents.utils.json_extract import strip_code_fences
+from app.ai_blog_agents.utils.llm_cache import LLMCache
 
-# Initialize ChatGroq for AI-powered mindmap generation
-groq = None
+# orjson parses LLM output several times faster; fall back to the stdlib when it isn't installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply.
 try:
-    groq_api_key = os.getenv("GROQ_API_KEY")
-    if groq_api_key:
-        groq = ChatGroq(model="openai/gpt-oss-20b", api_key=groq_api_key)
-except Exception as e:
-    print(f"[ContentPlanTool] Warning: Failed to initialize ChatGroq: {e}")
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
-def generate_mindmap(topic: str) -> Dict:
+logger = logging.getLogger(__name__)
+
+MODEL_NAME = resolve_model(DEFAULT_TIER)
+
+# Raw mindmap responses by (model, topic prompt), kept for a day and shared through Redis when configured
+mindmap_cache = LLMCache(maxsize=512, ttl=86400, prefix="mindmap")
+
+@lru_cache(maxsize=1)
+def _get_groq():
     """
-    Generates a comprehensive blog outline/mindmap using AI for the given topic.
-    Returns a structured outline with sections, subsections, and tags.
+    Shared ChatGroq client for AI-powered mindmap generation, built on first use
+    so importing this module doesn't load langchain_groq.
     """
-    if not groq:
-        # Fallback to basic structure if AI is not available
-        return {
-            "title": f"{topic} - Complete Guide",
-            "description": f"A comprehensive guide covering all aspects of {topic}.",
-            "sections": [
-                {"title": "Introduction", "subsections": [{"title": "What is it?"}, {"title": "Why it matters"}]},
-                {"title": "Key Concepts", "subsections": [{"title": "Core principles"}, {"title": "Important factors"}]},
-                {"title": "Practical Applications", "subsections": [{"title": "How to get started"}, {"title": "Best practices"}]},
-                {"title": "Conclusion", "subsections": [{"title": "Key takeaways"}, {"title": "Next steps"}]}
-            ],
-            "tags": [topic.lower().replace(" ", "-"), "guide", "tutorial"]
-        }
-    
     try:
-        prompt = f"""Generate a comprehensive blog outline for the topic: "{topic}"
+        return get_groq(MODEL_NAME)
+    except Exception as e:
+        logger.warning("Failed to initialize ChatGroq: %s", e)
+        return None
+
+# Outline used when no AI client is configured
+_BASIC_SECTIONS = (
+    {"title": "Introduction", "subsections": [{"title": "What is it?"}, {"title": "Why it matters"}]},
+    {"title": "Key Concepts", "subsections": [{"title": "Core principles"}, {"title": "Important factors"}]},
+    {"title": "Practical Applications", "subsections": [{"title": "How to get started"}, {"title": "Best practices"}]},
+    {"title": "Conclusion", "subsections": [{"title": "Key takeaways"}, {"title": "Next steps"}]}
+)
+
+# Outline used when the AI outline fails or comes back without sections
+_DEFAULT_SECTIONS = (
+    {"title": "Introduction", "subsections": [{"title": "Overview"}]},
+    {"title": "Main Content", "subsections": [{"title": "Key Points"}]},
+    {"title": "Conclusion", "subsections": [{"title": "Summary"}]}
+)
+
+def _fallback_mindmap(topic: str, sections=_DEFAULT_SECTIONS, extra_tags=("guide",)) -> Dict:
+    """
+    Builds a fallback mindmap for a topic from one of the outline templates.
+    Sections are copied so callers can't mutate the templates.
+    """
+    return {
+        "title": f"{topic} - Complete Guide",
+        "description": f"A comprehensive guide covering all aspects of {topic}.",
+        "sections": copy.deepcopy(list(sections)),
+        "tags": [topic.lower().replace(" ", "-"), *extra_tags]
+    }
+
+def _generate_ai_mindmap(topic: str, model_name: str = MODEL_NAME) -> Dict:
+    """
+    Asks Groq for the mindmap of a topic, serving repeats from mindmap_cache (one-day TTL).
+    Raises on failure, so only responses that parse are cached. The model name is part
+    of the cache key, so switching models doesn't serve stale outlines.
+    """
+    prompt = f"""Generate a comprehensive blog outline for the topic: "{topic}"
 
 Create a detailed structure with:
 1. An engaging, SEO-friendly title
@@ -62,63 +98,54 @@ Return ONLY valid JSON, no markdown formatting or additional text.
 
 Topic: {topic}
 JSON:"""
-        
-        response = groq.invoke(prompt)
+    
+    cached_text = mindmap_cache.get(model_name, prompt)
+    if cached_text is not None:
+        response_text = cached_text
+    else:
+        response = guarded_invoke(_get_groq(), prompt)
         response_text = response.content if hasattr(response, 'content') else str(response)
-        
-        # Clean up response (remove markdown code blocks if present)
-        response_text = response_text.strip()
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-        response_text = response_text.strip()
-        
-        # Parse JSON
-        try:
-            mindmap = json.loads(response_text)
-            
-            # Ensure required fields exist
-            if "title" not in mindmap:
-                mindmap["title"] = f"{topic} - Complete Guide"
-            if "description" not in mindmap:
-                mindmap["description"] = f"A comprehensive guide on {topic}."
-            if "sections" not in mindmap or not mindmap["sections"]:
-                mindmap["sections"] = [
-                    {"title": "Introduction", "subsections": [{"title": "Overview"}]},
-                    {"title": "Main Content", "subsections": [{"title": "Key Points"}]},
-                    {"title": "Conclusion", "subsections": [{"title": "Summary"}]}
-                ]
-            if "tags" not in mindmap or not mindmap["tags"]:
-                mindmap["tags"] = [topic.lower().replace(" ", "-"), "guide"]
-            
-            return mindmap
-        except json.JSONDecodeError as e:
-            print(f"[ContentPlanTool] JSON parse error: {e}")
-            print(f"[ContentPlanTool] Response text: {response_text[:200]}")
-            # Return fallback structure
-            return {
-                "title": f"{topic} - Complete Guide",
-                "description": f"A comprehensive guide covering all aspects of {topic}.",
-                "sections": [
-                    {"title": "Introduction", "subsections": [{"title": "Overview"}]},
-                    {"title": "Main Content", "subsections": [{"title": "Key Points"}]},
-                    {"title": "Conclusion", "subsections": [{"title": "Summary"}]}
-                ],
-                "tags": [topic.lower().replace(" ", "-"), "guide"]
-            }
+    raw_text = response_text
+    
+    # Clean up response (remove markdown code blocks if present)
+    response_text = strip_code_fences(response_text)
+    
+    mindmap = _loads(response_text)
+    # Only responses that parse are worth keeping
+    if cached_text is None:
+        mindmap_cache.set(model_name, prompt, raw_text)
+    
+    # Ensure required fields exist
+    if "title" not in mindmap:
+        mindmap["title"] = f"{topic} - Complete Guide"
+    if "description" not in mindmap:
+        mindmap["description"] = f"A comprehensive guide on {topic}."
+    if "sections" not in mindmap or not mindmap["sections"]:
+        mindmap["sections"] = copy.deepcopy(list(_DEFAULT_SECTIONS))
+    if "tags" not in mindmap or not mindmap["tags"]:
+        mindmap["tags"] = [topic.lower().replace(" ", "-"), "guide"]
+    
+    return mindmap
+
+def generate_mindmap(topic: str) -> Dict:
+    """
+    Generates a comprehensive blog outline/mindmap using AI for the given topic.
+    Returns a structured outline with sections, subsections, and tags.
+    AI outlines are cached per topic; callers get their own copy.
+    """
+    if not _get_groq():
+        # Fallback to basic structure if AI is not available
+        return _fallback_mindmap(topic, _BASIC_SECTIONS, ("guide", "tutorial"))
+    
+    try:
+        # Whitespace variants of the same topic share one cache entry
+        return copy.deepcopy(_generate_ai_mindmap(" ".join(topic.split())))
+    except json.JSONDecodeError as e:
+        logger.warning("Mindmap JSON parse error: %s", e)
+        logger.debug("Mindmap response text: %s", e.doc[:200])
+        # Return fallback structure
+        return _fallback_mindmap(topic)
     except Exception as e:
-        print(f"[ContentPlanTool] Error generating mindmap: {e}")
+        logger.exception("Mindmap generation failed")
         # Return fallback structure
-        return {
-            "title": f"{topic} - Complete Guide",
-            "description": f"A comprehensive guide covering all aspects of {topic}.",
-            "sections": [
-                {"title": "Introduction", "subsections": [{"title": "Overview"}]},
-                {"title": "Main Content", "subsections": [{"title": "Key Points"}]},
-                {"title": "Conclusion", "subsections": [{"title": "Summary"}]}
-            ],
-            "tags": [topic.lower().replace(" ", "-"), "guide"]
-        }
+        return _fallback_mindmap(topic)
@@ -1,32 +1,62 @@
 # ai_blog_agents/tools/image_suggestion_tool.py
 import os
 import json
-import requests
+import logging
+import asyncio
+import httpx
 import time
 import re
-from typing import Dict, List, Optional
+import hashlib
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import quote
 import base64
 from datetime import datetime, timedelta
+from collections import OrderedDict
 from threading import Lock
+from app.ai_blog_agents.utils.json_extract import strip_code_fences
+from app.ai_blog_agents.utils.llm_cache import LLMCache
 
-# Initialize Gemini API for prompt generation
-gemini_model = None
+logger = logging.getLogger(__name__)
+
+# orjson parses LLM output several times faster; fall back to the stdlib when it isn't installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply.
 try:
-    gemini_api_key = os.getenv("GEMINI_API_KEY")
-    if gemini_api_key:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Gemini API for prompt generation, initialized on first use so importing this
+# module doesn't pay for google.generativeai
+gemini_model = None
+_gemini_initialized = False
+_gemini_init_lock = Lock()
+
+def _get_gemini_model():
+    """Lazy initialization of the Gemini model"""
+    global gemini_model, _gemini_initialized
+    if _gemini_initialized:
+        return gemini_model
+    with _gemini_init_lock:
+        if _gemini_initialized:
+            return gemini_model
         try:
-            import google.generativeai as genai
-            genai.configure(api_key=gemini_api_key)
-            gemini_model = genai.GenerativeModel('gemini-pro')
-        except ImportError:
-            print("[ImageSuggestionTool] Warning: google-generativeai package not installed. Install with: pip install google-generativeai")
+            gemini_api_key = os.getenv("GEMINI_API_KEY")
+            if gemini_api_key:
+                try:
+                    import google.generativeai as genai
+                    genai.configure(api_key=gemini_api_key)
+                    gemini_model = genai.GenerativeModel('gemini-pro')
+                except ImportError:
+                    logger.warning("google-generativeai package not installed. Install with: pip install google-generativeai")
+                except Exception as e:
+                    logger.warning("Failed to initialize Gemini: %s", e)
+            else:
+                logger.warning("GEMINI_API_KEY not set")
         except Exception as e:
-            print(f"[ImageSuggestionTool] Warning: Failed to initialize Gemini: {e}")
-    else:
-        print("[ImageSuggestionTool] Warning: GEMINI_API_KEY not set")
-except Exception as e:
-    print(f"[ImageSuggestionTool] Warning: {e}")
+            logger.warning("Gemini setup failed: %s", e)
+        _gemini_initialized = True
+    return gemini_model
 
 # Groq API rate limiting
 groq_model = None
@@ -35,10 +65,11 @@ groq_rate_limiter = {
     'request_count': 0,
     'window_start': datetime.now(),
     'lock': Lock(),
-    'cache': {}  # Simple cache for prompts
+    'cache': OrderedDict()  # LRU cache for prompts
 }
 GROQ_RATE_LIMIT = 30  # requests per minute
 GROQ_MIN_INTERVAL = 2.0  # minimum seconds between requests
+PROMPT_CACHE_SIZE = 256
 
 def _get_groq_model():
     """Lazy initialization of Groq model with rate limiting awareness"""
@@ -48,20 +79,24 @@ def _get_groq_model():
             groq_api_key = os.getenv("GROQ_API_KEY")
             if groq_api_key:
                 try:
-                    from langchain_groq import ChatGroq
-                    groq_model = ChatGroq(model="openai/gpt-oss-20b", api_key=groq_api_key)
+                    from app.ai_blog_agents.agents._groq_client import get_groq
+                    groq_model = get_groq()
                 except ImportError:
-                    print("[ImageSuggestionTool] Warning: langchain-groq package not installed")
+                    logger.warning("langchain-groq package not installed")
                 except Exception as e:
-                    print(f"[ImageSuggestionTool] Warning: Failed to initialize Groq: {e}")
+                    logger.warning("Failed to initialize Groq: %s", e)
             else:
-                print("[ImageSuggestionTool] Warning: GROQ_API_KEY not set")
+                logger.warning("GROQ_API_KEY not set")
         except Exception as e:
-            print(f"[ImageSuggestionTool] Warning: {e}")
+            logger.warning("Groq setup failed: %s", e)
     return groq_model
 
 def _check_groq_rate_limit() -> bool:
-    """Check if we can make a Groq API request (rate limiting)"""
+    """
+    Check if we can make a Groq API request (rate limiting).
+    Each caller reserves its own slot under the lock and waits out the minimum
+    interval after releasing it, so concurrent callers don't queue behind a sleep.
+    """
     with groq_rate_limiter['lock']:
         now = datetime.now()
         
@@ -74,34 +109,74 @@ def _check_groq_rate_limit() -> bool:
         if groq_rate_limiter['request_count'] >= GROQ_RATE_LIMIT:
             wait_time = 60 - (now - groq_rate_limiter['window_start']).total_seconds()
             if wait_time > 0:
-                print(f"[ImageSuggestionTool] ⚠️ Groq rate limit reached. Waiting {wait_time:.1f}s...")
+                logger.warning("Groq rate limit reached. Waiting %.1fs...", wait_time)
                 return False
         
-        # Check minimum interval
+        # Reserve the next slot at least GROQ_MIN_INTERVAL after the previous one
+        slot = now
         if groq_rate_limiter['last_request_time']:
-            time_since_last = (now - groq_rate_limiter['last_request_time']).total_seconds()
-            if time_since_last < GROQ_MIN_INTERVAL:
-                sleep_time = GROQ_MIN_INTERVAL - time_since_last
-                time.sleep(sleep_time)
+            slot = max(now, groq_rate_limiter['last_request_time'] + timedelta(seconds=GROQ_MIN_INTERVAL))
         
-        groq_rate_limiter['last_request_time'] = datetime.now()
+        groq_rate_limiter['last_request_time'] = slot
         groq_rate_limiter['request_count'] += 1
-        return True
+    
+    sleep_time = (slot - now).total_seconds()
+    if sleep_time > 0:
+        time.sleep(sleep_time)
+    return True
 
 def _get_cached_prompt(content_hash: str) -> Optional[List[Dict]]:
     """Get cached prompt suggestions"""
-    return groq_rate_limiter['cache'].get(content_hash)
+    with groq_rate_limiter['lock']:
+        suggestions = groq_rate_limiter['cache'].get(content_hash)
+        if suggestions is not None:
+            groq_rate_limiter['cache'].move_to_end(content_hash)
+        return suggestions
 
 def _cache_prompt(content_hash: str, suggestions: List[Dict]):
-    """Cache prompt suggestions (limit cache size)"""
-    if len(groq_rate_limiter['cache']) > 50:  # Limit cache size
-        # Remove oldest entry
-        oldest_key = next(iter(groq_rate_limiter['cache']))
-        del groq_rate_limiter['cache'][oldest_key]
-    groq_rate_limiter['cache'][content_hash] = suggestions
+    """Cache prompt suggestions (evicts the least recently used entry when full)"""
+    with groq_rate_limiter['lock']:
+        groq_rate_limiter['cache'][content_hash] = suggestions
+        groq_rate_limiter['cache'].move_to_end(content_hash)
+        if len(groq_rate_limiter['cache']) > PROMPT_CACHE_SIZE:
+            groq_rate_limiter['cache'].popitem(last=False)
 
 # Pollinations.ai API base URL
 POLLINATIONS_BASE_URL = "https://image.pollinations.ai/prompt/"
+POLLINATIONS_TIMEOUT = 90.0
+POLLINATIONS_MODEL = "flux"
+
+# Generated images keyed by cleaned prompt; data URLs are large, so keep few in memory
+# and let Redis (when REDIS_URL is set) hold them for a week
+image_cache = LLMCache(maxsize=64, ttl=7 * 86400, prefix="pollinations")
+
+# HTTP/2 lets concurrent fetches and retries share one connection; it needs the h2 package
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Shared async client so concurrent image fetches reuse pooled connections
+_pollinations_client: Optional[httpx.AsyncClient] = None
+
+def _get_pollinations_client() -> httpx.AsyncClient:
+    """Lazy initialization of the shared Pollinations.ai HTTP client"""
+    global _pollinations_client
+    if _pollinations_client is None or _pollinations_client.is_closed:
+        _pollinations_client = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=POLLINATIONS_TIMEOUT,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+        )
+    return _pollinations_client
+
+# Precompiled patterns for _clean_prompt
+_MARKDOWN_RE = re.compile(r'[*_`#\[\]()]')
+_FILLER_WORDS_RE = re.compile(r'\b(detailed|highly detailed|extremely detailed|very detailed|professional|amazing|stunning|beautiful|gorgeous|incredible)\b', re.IGNORECASE)
+_UNSAFE_CHARS_RE = re.compile(r'[^\w\s\-,.!?]')
+_WHITESPACE_RE = re.compile(r'\s+')
 
 def _clean_prompt(prompt: str) -> str:
     """
@@ -109,22 +184,52 @@ def _clean_prompt(prompt: str) -> str:
     Makes prompts simple, direct, and under 100 characters for better success rate.
     """
     # Remove markdown formatting
-    prompt = re.sub(r'[*_`#\[\]()]', '', prompt)
+    prompt = _MARKDOWN_RE.sub('', prompt)
     # Remove extra whitespace
-    prompt = ' '.join(prompt.split())
+    prompt = _WHITESPACE_RE.sub(' ', prompt).strip()
     # Remove common AI generation phrases that make prompts complex
-    prompt = re.sub(r'\b(detailed|highly detailed|extremely detailed|very detailed|professional|amazing|stunning|beautiful|gorgeous|incredible)\b', '', prompt, flags=re.IGNORECASE)
+    prompt = _FILLER_WORDS_RE.sub('', prompt)
     # Limit prompt length to 100 chars for better success (Pollinations.ai works better with shorter prompts)
     if len(prompt) > 100:
         # Take first 100 chars at word boundary
         prompt = prompt[:100].rsplit(' ', 1)[0]
     # Remove problematic characters but keep basic punctuation
-    prompt = re.sub(r'[^\w\s\-,.!?]', '', prompt)
+    prompt = _UNSAFE_CHARS_RE.sub('', prompt)
     # Remove multiple spaces
-    prompt = ' '.join(prompt.split())
-    return prompt.strip()
+    return _WHITESPACE_RE.sub(' ', prompt).strip()
+
+# PNG / JPEG magic bytes
+_IMAGE_SIGNATURES = (b'\x89PNG', b'\xff\xd8\xff')
 
-def generate_image_with_pollinations(prompt: str, max_retries: int = 2) -> Optional[str]:
+async def _encode_image_stream(response: httpx.Response) -> Tuple[bytes, int, Optional[bytearray]]:
+    """
+    Base64-encodes a streamed image body chunk by chunk into a data URL buffer,
+    so the raw bytes and their encoding are never held in memory together.
+    Stops reading as soon as the leading bytes show the body isn't a PNG/JPEG
+    (typically an HTML error page), returning None for the data URL.
+    Returns (leading bytes, bytes read, data URL bytes or None).
+    """
+    encoded = bytearray(b"data:image/png;base64,")
+    head = b""
+    pending = b""
+    size = 0
+    async for chunk in response.aiter_bytes(65536):
+        if len(head) < 8:
+            head += chunk[:8 - len(head)]
+            if len(head) >= 4 and not head.startswith(_IMAGE_SIGNATURES):
+                return head, size + len(chunk), None
+        size += len(chunk)
+        pending += chunk
+        # Encode whole 3-byte groups only; the remainder carries into the next chunk
+        aligned = len(pending) - len(pending) % 3
+        encoded += base64.b64encode(pending[:aligned])
+        pending = pending[aligned:]
+    if not head.startswith(_IMAGE_SIGNATURES):
+        return head, size, None
+    encoded += base64.b64encode(pending)
+    return head, size, encoded
+
+async def generate_image_with_pollinations(prompt: str, max_retries: int = 2) -> Optional[str]:
     """
     Generates an image using Pollinations.ai API with retry logic.
     
@@ -139,119 +244,123 @@ def generate_image_with_pollinations(prompt: str, max_retries: int = 2) -> Optio
     cleaned_prompt = _clean_prompt(prompt)
     
     if not cleaned_prompt:
-        print(f"[ImageSuggestionTool] ❌ Error: Empty prompt after cleaning")
+        logger.warning("Empty prompt after cleaning")
         return None
     
+    return await _fetch_pollinations_image(cleaned_prompt, max_retries)
+
+async def _fetch_pollinations_image(cleaned_prompt: str, max_retries: int = 2) -> Optional[str]:
+    """
+    Fetches the image for an already-cleaned prompt, so callers that clean
+    the prompt themselves don't pay for a second pass.
+    """
+    # Cache key is fixed before any retry simplifies the prompt
+    cache_prompt = cleaned_prompt
+    cached_url = image_cache.get(POLLINATIONS_MODEL, cache_prompt)
+    if cached_url:
+        logger.info("Using cached image for: %s...", cleaned_prompt[:60])
+        return cached_url
+    
+    client = _get_pollinations_client()
     for attempt in range(max_retries + 1):
         try:
             # URL encode the prompt
             encoded_prompt = quote(cleaned_prompt)
             # Construct the full URL with model parameter
-            full_url = f"{POLLINATIONS_BASE_URL}{encoded_prompt}?model=flux"
+            full_url = f"{POLLINATIONS_BASE_URL}{encoded_prompt}?model={POLLINATIONS_MODEL}"
             
             if attempt > 0:
                 # Wait before retry (exponential backoff)
                 wait_time = 2 ** attempt
-                print(f"[ImageSuggestionTool] Retry attempt {attempt}/{max_retries} after {wait_time}s...")
-                time.sleep(wait_time)
+                logger.info("Retry attempt %d/%d after %ss...", attempt, max_retries, wait_time)
+                await asyncio.sleep(wait_time)
             
-            print(f"[ImageSuggestionTool] Requesting image from Pollinations.ai (attempt {attempt + 1})")
-            print(f"[ImageSuggestionTool] Prompt: {cleaned_prompt[:60]}...")
+            logger.info("Requesting image from Pollinations.ai (attempt %d)", attempt + 1)
+            logger.info("Prompt: %s...", cleaned_prompt[:60])
             
-            # Make GET request to fetch the image with longer timeout
-            response = requests.get(full_url, stream=True, timeout=90, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
+            # Stream the GET request so the body is encoded as it arrives
+            async with client.stream("GET", full_url) as response:
             
-            if response.status_code == 200:
-                # Check content type
-                content_type = response.headers.get('Content-Type', '')
-                if 'image' not in content_type.lower():
-                    print(f"[ImageSuggestionTool] ⚠️ Warning: Unexpected content type: {content_type}")
+                if response.status_code == 200:
+                    # Check content type
+                    content_type = response.headers.get('Content-Type', '')
+                    if 'image' not in content_type.lower():
+                        logger.warning("Unexpected content type: %s", content_type)
                 
-                # Get image content
-                image_content = response.content
+                    # Stream the image straight into its base64 data URL
+                    image_head, image_size, encoded = await _encode_image_stream(response)
                 
-                # Check if we got actual image data (at least 1KB)
-                if len(image_content) > 1024:
-                    # Verify it's actually an image by checking magic bytes
-                    if image_content.startswith(b'\x89PNG') or image_content.startswith(b'\xff\xd8\xff'):
-                        # Convert image to base64 data URL for frontend display
-                        image_base64 = base64.b64encode(image_content).decode('utf-8')
-                        image_data_url = f"data:image/png;base64,{image_base64}"
-                        print(f"[ImageSuggestionTool] ✅ Image generated successfully ({len(image_content) / 1024:.2f} KB)")
+                    # Verify it's actually an image by checking magic bytes (checked while streaming)
+                    if encoded is None:
+                        logger.warning("Response doesn't appear to be an image")
+                        if attempt < max_retries:
+                            continue
+                    # Check if we got actual image data (at least 1KB)
+                    elif image_size > 1024:
+                        image_data_url = encoded.decode('ascii')
+                        logger.info("Image generated successfully (%.2f KB)", image_size / 1024)
+                        image_cache.set(POLLINATIONS_MODEL, cache_prompt, image_data_url)
                         return image_data_url
                     else:
-                        print(f"[ImageSuggestionTool] ⚠️ Warning: Response doesn't appear to be an image")
+                        logger.warning("Image too small (%d bytes)", image_size)
                         if attempt < max_retries:
                             continue
+                elif response.status_code == 500:
+                    logger.warning("Server error (500) - API might be overloaded or prompt invalid")
+                    if attempt < max_retries:
+                        # Try with a simpler prompt on retry
+                        if attempt == 1:
+                            # Simplify prompt for retry
+                            words = cleaned_prompt.split()[:10]  # Take first 10 words
+                            cleaned_prompt = ' '.join(words)
+                            logger.info("Trying with simplified prompt: %s", cleaned_prompt)
+                        continue
+                elif response.status_code == 404:
+                    logger.warning("404 Not Found")
+                    return None
+                elif response.status_code == 429:
+                    logger.warning("Rate limited (429)")
+                    if attempt < max_retries:
+                        wait_time = 5 * (attempt + 1)
+                        logger.info("Waiting %ss before retry...", wait_time)
+                        await asyncio.sleep(wait_time)
+                        continue
                 else:
-                    print(f"[ImageSuggestionTool] ❌ Error: Image too small ({len(image_content)} bytes)")
+                    logger.warning("Failed to retrieve image. Status code: %s", response.status_code)
                     if attempt < max_retries:
                         continue
-            elif response.status_code == 500:
-                print(f"[ImageSuggestionTool] ❌ Error: Server error (500) - API might be overloaded or prompt invalid")
-                if attempt < max_retries:
-                    # Try with a simpler prompt on retry
-                    if attempt == 1:
-                        # Simplify prompt for retry
-                        words = cleaned_prompt.split()[:10]  # Take first 10 words
-                        cleaned_prompt = ' '.join(words)
-                        print(f"[ImageSuggestionTool] Trying with simplified prompt: {cleaned_prompt}")
-                    continue
-            elif response.status_code == 404:
-                print(f"[ImageSuggestionTool] ❌ Error: 404 Not Found")
-                return None
-            elif response.status_code == 429:
-                print(f"[ImageSuggestionTool] ❌ Error: Rate limited (429)")
-                if attempt < max_retries:
-                    wait_time = 5 * (attempt + 1)
-                    print(f"[ImageSuggestionTool] Waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
-                    continue
-            else:
-                print(f"[ImageSuggestionTool] ❌ Error: Failed to retrieve image. Status code: {response.status_code}")
-                if attempt < max_retries:
-                    continue
                     
-        except requests.exceptions.Timeout:
-            print(f"[ImageSuggestionTool] ❌ Error: Request timeout (90s)")
+        except httpx.TimeoutException:
+            logger.warning("Request timeout (90s)")
             if attempt < max_retries:
                 continue
-        except requests.exceptions.RequestException as e:
-            print(f"[ImageSuggestionTool] ❌ Error during request: {e}")
+        except httpx.HTTPError as e:
+            logger.warning("Error during request: %s", e)
             if attempt < max_retries:
                 continue
         except Exception as e:
-            print(f"[ImageSuggestionTool] ❌ Unexpected error: {e}")
+            logger.warning("Unexpected error: %s", e)
             if attempt < max_retries:
                 continue
     
     return None
 
-def generate_image_suggestions(content: str, title: str = "") -> Dict:
-    """
-    Uses Gemini API to generate image prompts for blog content.
-    Then uses Pollinations.ai API for image generation.
+def _content_hash(content: str, title: str) -> str:
+    return hashlib.blake2b((title + "\0" + content[:500]).encode("utf-8"), digest_size=16).hexdigest()
 
-    Args:
-        content: Blog content
-        title: Blog title (optional)
-
-    Returns:
-        Dictionary with image suggestions and generated image URLs
+def _generate_prompt_suggestions(content: str, title: str = "") -> List[Dict]:
     """
-    try:
-        images = []
-        
-        # Step 1: Generate image prompts using Gemini (primary) or Groq (fallback)
-        suggestions = []
-        prompt_generated = False
-        
-        # Try Gemini first
-        if gemini_model:
-            try:
-                prompt = f"""Create exactly 3 simple image prompts for this blog.
+    Step 1: Generate image prompts using Gemini (primary) or Groq (fallback),
+    falling back to prompts derived from the content.
+    """
+    suggestions = []
+    prompt_generated = False
+    
+    # Try Gemini first
+    gemini = _get_gemini_model()
+    if gemini:
+        try:
+            prompt = f"""Create exactly 3 simple image prompts for this blog.
 
 Title: {title if title else 'Blog post'}
 Content: {content[:1500]}
@@ -264,50 +373,40 @@ Return JSON array:
 ]
 
 Keep prompts SHORT (under 80 chars), SIMPLE, direct. Return ONLY JSON."""
-                
-                response = gemini_model.generate_content(prompt)
-                suggestions_text = response.text.strip()
-                
-                # Remove markdown code blocks if present
-                if suggestions_text.startswith("```json"):
-                    suggestions_text = suggestions_text[7:]
-                if suggestions_text.startswith("```"):
-                    suggestions_text = suggestions_text[3:]
-                if suggestions_text.endswith("```"):
-                    suggestions_text = suggestions_text[:-3]
-                suggestions_text = suggestions_text.strip()
-                
-                try:
-                    suggestions = json.loads(suggestions_text)
-                    if not isinstance(suggestions, list):
-                        suggestions = [suggestions]
-                    if len(suggestions) > 0:
-                        prompt_generated = True
-                        print(f"[ImageSuggestionTool] ✅ Generated {len(suggestions)} prompts using Gemini")
-                except json.JSONDecodeError as e:
-                    print(f"[ImageSuggestionTool] Gemini JSON parse error: {e}")
-                    print(f"[ImageSuggestionTool] Response text: {suggestions_text[:200]}")
-            except Exception as e:
-                print(f"[ImageSuggestionTool] Gemini error: {e}")
-        
-        # Fallback to Groq if Gemini failed (with rate limiting and caching)
-        if not prompt_generated:
-            # Check cache first
-            import hashlib
-            content_hash = hashlib.md5(f"{title}_{content[:500]}".encode()).hexdigest()
-            cached_suggestions = _get_cached_prompt(content_hash)
             
-            if cached_suggestions:
-                suggestions = cached_suggestions
-                prompt_generated = True
-                print(f"[ImageSuggestionTool] ✅ Using cached prompts ({len(suggestions)} suggestions)")
-            else:
-                groq = _get_groq_model()
-                if groq and _check_groq_rate_limit():
-                    try:
-                        print(f"[ImageSuggestionTool] Using Groq for prompt generation (with rate limiting)...")
-                        # Simplified prompt - ask for simple, short prompts
-                        prompt = f"""Create exactly 3 simple image prompts for this blog.
+            response = gemini.generate_content(prompt)
+            suggestions_text = strip_code_fences(response.text)
+            
+            try:
+                suggestions = _loads(suggestions_text)
+                if not isinstance(suggestions, list):
+                    suggestions = [suggestions]
+                if len(suggestions) > 0:
+                    prompt_generated = True
+                    logger.info("Generated %d prompts using Gemini", len(suggestions))
+            except json.JSONDecodeError as e:
+                logger.warning("Gemini JSON parse error: %s", e)
+                logger.warning("Response text: %s", suggestions_text[:200])
+        except Exception as e:
+            logger.warning("Gemini error: %s", e)
+    
+    # Fallback to Groq if Gemini failed (with rate limiting and caching)
+    if not prompt_generated:
+        # Check cache first
+        content_hash = _content_hash(content, title)
+        cached_suggestions = _get_cached_prompt(content_hash)
+        
+        if cached_suggestions:
+            suggestions = cached_suggestions
+            prompt_generated = True
+            logger.info("Using cached prompts (%d suggestions)", len(suggestions))
+        else:
+            groq = _get_groq_model()
+            if groq and _check_groq_rate_limit():
+                try:
+                    logger.info("Using Groq for prompt generation (with rate limiting)...")
+                    # Simplified prompt - ask for simple, short prompts
+                    prompt = f"""Create exactly 3 simple image prompts for this blog.
 
 Title: {title if title else 'Blog post'}
 Content: {content[:1000]}
@@ -320,110 +419,126 @@ Return JSON array:
 ]
 
 Keep prompts SHORT (under 80 chars), SIMPLE, direct. Return ONLY JSON."""
-                        
-                        response = groq.invoke(prompt)
-                        suggestions_text = response.content if hasattr(response, 'content') else str(response)
-                        suggestions_text = suggestions_text.strip()
-                        
-                        # Remove markdown code blocks if present
-                        if suggestions_text.startswith("```json"):
-                            suggestions_text = suggestions_text[7:]
-                        if suggestions_text.startswith("```"):
-                            suggestions_text = suggestions_text[3:]
-                        if suggestions_text.endswith("```"):
-                            suggestions_text = suggestions_text[:-3]
-                        suggestions_text = suggestions_text.strip()
-                        
-                        try:
-                            suggestions = json.loads(suggestions_text)
-                            if not isinstance(suggestions, list):
-                                suggestions = [suggestions]
-                            if len(suggestions) > 0:
-                                prompt_generated = True
-                                _cache_prompt(content_hash, suggestions)
-                                print(f"[ImageSuggestionTool] ✅ Generated {len(suggestions)} prompts using Groq")
-                        except json.JSONDecodeError as e:
-                            print(f"[ImageSuggestionTool] Groq JSON parse error: {e}")
-                            print(f"[ImageSuggestionTool] Response text: {suggestions_text[:200]}")
-                    except Exception as e:
-                        error_msg = str(e)
-                        if 'rate limit' in error_msg.lower() or '429' in error_msg:
-                            print(f"[ImageSuggestionTool] ⚠️ Groq rate limit hit. Using fallback prompts.")
-                        else:
-                            print(f"[ImageSuggestionTool] Groq error: {e}")
-                else:
-                    if groq:
-                        print(f"[ImageSuggestionTool] ⚠️ Groq rate limit reached. Using fallback prompts.")
+                    
+                    from app.ai_blog_agents.agents._groq_client import guarded_invoke
+                    response = guarded_invoke(groq, prompt)
+                    suggestions_text = response.content if hasattr(response, 'content') else str(response)
+                    suggestions_text = strip_code_fences(suggestions_text)
+                    
+                    try:
+                        suggestions = _loads(suggestions_text)
+                        if not isinstance(suggestions, list):
+                            suggestions = [suggestions]
+                        if len(suggestions) > 0:
+                            prompt_generated = True
+                            _cache_prompt(content_hash, suggestions)
+                            logger.info("Generated %d prompts using Groq", len(suggestions))
+                    except json.JSONDecodeError as e:
+                        logger.warning("Groq JSON parse error: %s", e)
+                        logger.warning("Response text: %s", suggestions_text[:200])
+                except Exception as e:
+                    error_msg = str(e)
+                    if 'rate limit' in error_msg.lower() or '429' in error_msg:
+                        logger.warning("Groq rate limit hit. Using fallback prompts.")
+                    else:
+                        logger.warning("Groq error: %s", e)
+            else:
+                if groq:
+                    logger.warning("Groq rate limit reached. Using fallback prompts.")
+    
+    # Final fallback: create suggestions from content
+    if not prompt_generated:
+        logger.info("Using fallback prompt generation from content")
+        suggestions = _create_fallback_suggestions(content, title)
+    
+    return suggestions
+
+async def _generate_image(idx: int, suggestion: Dict, total: int) -> Optional[Dict]:
+    """Generates the image for one suggestion, returning its image entry or None"""
+    try:
+        # Use the prompt field if available, otherwise use description
+        image_prompt = suggestion.get("prompt") or suggestion.get("description", "")
         
-        # Final fallback: create suggestions from content
-        if not prompt_generated:
-            print(f"[ImageSuggestionTool] Using fallback prompt generation from content")
-            suggestions = _create_fallback_suggestions(content, title)
+        if not image_prompt:
+            # Create a prompt from title and description
+            title_text = suggestion.get("title", "")
+            desc_text = suggestion.get("description", "")
+            image_prompt = f"{title_text}, {desc_text}, digital art, high detail, professional"
         
-        # Step 2: Generate images using Pollinations.ai
-        print(f"[ImageSuggestionTool] Generating {min(len(suggestions), 3)} images using Pollinations.ai...")
-        successful_images = 0
+        # Ensure prompt is clean and optimized
+        image_prompt = _clean_prompt(image_prompt)
         
-        for idx, suggestion in enumerate(suggestions[:3], 1):  # Limit to 3 images to avoid rate limits
-            try:
-                # Use the prompt field if available, otherwise use description
-                image_prompt = suggestion.get("prompt") or suggestion.get("description", "")
-                
-                if not image_prompt:
-                    # Create a prompt from title and description
-                    title_text = suggestion.get("title", "")
-                    desc_text = suggestion.get("description", "")
-                    image_prompt = f"{title_text}, {desc_text}, digital art, high detail, professional"
-                
-                # Ensure prompt is clean and optimized
-                image_prompt = _clean_prompt(image_prompt)
-                
-                if not image_prompt:
-                    print(f"[ImageSuggestionTool] ⚠️ Skipping image {idx}: Empty prompt after cleaning")
-                    continue
-                
-                print(f"[ImageSuggestionTool] Generating image {idx}/{min(len(suggestions), 3)}: {image_prompt[:60]}...")
-                
-                # Generate image using Pollinations.ai with retry logic
-                image_url = generate_image_with_pollinations(image_prompt, max_retries=2)
-                
-                if image_url:
-                    images.append({
-                        "url": image_url,
-                        "title": suggestion.get("title", f"Image {idx}"),
-                        "description": suggestion.get("description", ""),
-                        "prompt": image_prompt,
-                        "placement": suggestion.get("placement", ""),
-                        "style": suggestion.get("style", "")
-                    })
-                    suggestion["image_url"] = image_url
-                    successful_images += 1
-                    print(f"[ImageSuggestionTool] ✅ Image {idx} generated successfully ({successful_images}/{min(len(suggestions), 3)})")
-                    
-                    # Small delay between requests to avoid rate limiting
-                    if idx < min(len(suggestions), 3):
-                        time.sleep(1)
-                else:
-                    print(f"[ImageSuggestionTool] ⚠️ Failed to generate image {idx} after retries")
-                    
-            except Exception as e:
-                import traceback
-                print(f"[ImageSuggestionTool] Error generating image {idx}: {e}")
-                print(traceback.format_exc())
-                continue
+        if not image_prompt:
+            logger.warning("Skipping image %d: Empty prompt after cleaning", idx)
+            return None
+        
+        logger.info("Generating image %d/%d: %s...", idx, total, image_prompt[:60])
+        
+        # Generate image using Pollinations.ai with retry logic
+        image_url = await _fetch_pollinations_image(image_prompt, max_retries=2)
+        
+        if not image_url:
+            logger.warning("Failed to generate image %d after retries", idx)
+            return None
         
+        suggestion["image_url"] = image_url
+        logger.info("Image %d generated successfully", idx)
         return {
-            "suggestions": suggestions,
-            "images": images,
-            "success": len(images) > 0,
-            "generated_count": len(images),
-            "total_suggestions": len(suggestions)
+            "url": image_url,
+            "title": suggestion.get("title", f"Image {idx}"),
+            "description": suggestion.get("description", ""),
+            "prompt": image_prompt,
+            "placement": suggestion.get("placement", ""),
+            "style": suggestion.get("style", "")
         }
-        
+    except Exception:
+        logger.exception("Error generating image %d", idx)
+        return None
+
+async def _generate_images(suggestions: List[Dict]) -> Dict:
+    """
+    Step 2: Generate images for up to 3 suggestions using Pollinations.ai.
+    The fetches are independent, so they run concurrently on the shared client.
+    Returns the suggestion/image result dictionary.
+    """
+    # Shallow copies: _generate_image sets image_url (a large data URL) on each entry,
+    # and the originals may be the dicts held in the prompt cache
+    suggestions = [dict(suggestion) for suggestion in suggestions]
+    selected = suggestions[:3]  # Limit to 3 images to avoid rate limits
+    logger.info("Generating %d images using Pollinations.ai...", len(selected))
+    
+    generated = await asyncio.gather(*(
+        _generate_image(idx, suggestion, len(selected))
+        for idx, suggestion in enumerate(selected, 1)
+    ))
+    images = [image for image in generated if image]
+    
+    return {
+        "suggestions": suggestions,
+        "images": images,
+        "success": len(images) > 0,
+        "generated_count": len(images),
+        "total_suggestions": len(suggestions)
+    }
+
+async def generate_image_suggestions(content: str, title: str = "") -> Dict:
+    """
+    Uses Gemini API to generate image prompts for blog content.
+    Then uses Pollinations.ai API for image generation.
+
+    Args:
+        content: Blog content
+        title: Blog title (optional)
+
+    Returns:
+        Dictionary with image suggestions and generated image URLs
+    """
+    try:
+        # Prompt generation uses the sync Gemini/Groq clients and rate limiter
+        suggestions = await asyncio.to_thread(_generate_prompt_suggestions, content, title)
+        return await _generate_images(suggestions)
     except Exception as e:
-        import traceback
-        print(f"[ImageSuggestionTool] Overall error: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Image suggestion generation failed")
         return {
             "suggestions": [],
             "images": [],
@@ -431,16 +546,117 @@ Keep prompts SHORT (under 80 chars), SIMPLE, direct. Return ONLY JSON."""
             "success": False
         }
 
+# Blogs per batched prompt-generation call; larger batches return diminishing gains
+IMAGE_PROMPT_BATCH_SIZE = 8
+
+def _generate_prompt_suggestions_batch(items: List[Tuple[str, str]]) -> List[Optional[List[Dict]]]:
+    """
+    Generates image prompts for several blogs with one Gemini/Groq call.
+    Returns one suggestion list per item, or None for items the batch couldn't cover.
+    """
+    results = [_get_cached_prompt(_content_hash(content, title)) for content, title in items]
+    pending = [i for i, cached in enumerate(results) if not cached]
+    if not pending:
+        return results
+    
+    blogs = "\n\n".join(
+        f"Blog {n}:\nTitle: {items[i][1] or 'Blog post'}\nContent: {items[i][0][:1000]}"
+        for n, i in enumerate(pending, 1)
+    )
+    prompt = f"""Create exactly 3 simple image prompts for each of these {len(pending)} blogs.
+
+{blogs}
+
+Return a JSON array with one inner array of 3 prompts per blog, in the same order:
+[
+  [
+    {{"title": "Image 1", "prompt": "simple prompt under 80 chars", "placement": "header", "description": "what it shows"}},
+    {{"title": "Image 2", "prompt": "simple prompt under 80 chars", "placement": "content", "description": "what it shows"}},
+    {{"title": "Image 3", "prompt": "simple prompt under 80 chars", "placement": "content", "description": "what it shows"}}
+  ]
+]
+
+Keep prompts SHORT (under 80 chars), SIMPLE, direct. Return ONLY JSON."""
+    
+    try:
+        suggestions_text = None
+        gemini = _get_gemini_model()
+        if gemini:
+            suggestions_text = gemini.generate_content(prompt).text
+        else:
+            groq = _get_groq_model()
+            # One rate-limit token covers the whole batch
+            if groq and _check_groq_rate_limit():
+                from app.ai_blog_agents.agents._groq_client import guarded_invoke
+                response = guarded_invoke(groq, prompt)
+                suggestions_text = response.content if hasattr(response, 'content') else str(response)
+        if not suggestions_text:
+            return results
+        
+        batch = _loads(strip_code_fences(suggestions_text))
+        if not isinstance(batch, list) or len(batch) != len(pending) or not all(isinstance(s, list) and s for s in batch):
+            logger.warning("Batch response shape mismatch, falling back to per-blog prompts")
+            return results
+        
+        for i, suggestions in zip(pending, batch):
+            results[i] = suggestions
+            _cache_prompt(_content_hash(*items[i]), suggestions)
+        logger.info("Generated prompts for %d blogs in one call", len(pending))
+    except Exception:
+        logger.exception("Batch prompt generation failed")
+    return results
+
+async def generate_image_suggestions_batch(items: List[Tuple[str, str]]) -> List[Dict]:
+    """
+    Batch variant of generate_image_suggestions for several blogs.
+    Prompts for up to IMAGE_PROMPT_BATCH_SIZE blogs are generated in a single LLM call;
+    blogs the batch couldn't cover go through the per-blog path.
+
+    Args:
+        items: (content, title) pairs
+
+    Returns:
+        One result dictionary per item, in order
+    """
+    results = []
+    for start in range(0, len(items), IMAGE_PROMPT_BATCH_SIZE):
+        chunk = items[start:start + IMAGE_PROMPT_BATCH_SIZE]
+        batched = await asyncio.to_thread(_generate_prompt_suggestions_batch, chunk)
+        for (content, title), suggestions in zip(chunk, batched):
+            if not suggestions:
+                results.append(await generate_image_suggestions(content, title))
+                continue
+            try:
+                results.append(await _generate_images(suggestions))
+            except Exception as e:
+                logger.exception("Image suggestion generation failed")
+                results.append({
+                    "suggestions": [],
+                    "images": [],
+                    "error": str(e),
+                    "success": False
+                })
+    return results
+
+# Words skipped when picking fallback image topics
+_COMMON_WORDS = frozenset({'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'its', 'may', 'new', 'now', 'old', 'see', 'two', 'way', 'who', 'boy', 'did', 'let', 'put', 'say', 'she', 'too', 'use'})
+# Whitespace-delimited tokens, matching str.split() without copying the whole content
+_WORD_TOKEN_RE = re.compile(r'\S+')
+
 def _create_fallback_suggestions(content: str, title: str = "") -> List[Dict]:
     """
     Creates exactly 3 simple fallback image suggestions from content.
     Uses very simple, short prompts for better Pollinations.ai success rate.
     """
     # Extract key topics from content (simple extraction)
-    words = content.lower().split()
-    # Get meaningful words (length 4-10, not too common)
-    common_words = {'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'her', 'was', 'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'its', 'may', 'new', 'now', 'old', 'see', 'two', 'way', 'who', 'boy', 'did', 'its', 'let', 'put', 'say', 'she', 'too', 'use'}
-    meaningful_words = [w for w in words if 4 <= len(w) <= 10 and w not in common_words][:5]
+    # Get meaningful words (length 4-10, not too common), stopping once 5 are found
+    meaningful_words = []
+    for match in _WORD_TOKEN_RE.finditer(content):
+        word = match.group().lower()
+        if 4 <= len(word) <= 10 and word not in _COMMON_WORDS:
+            meaningful_words.append(word)
+            if len(meaningful_words) == 5:
+                break
     
     suggestions = []
     
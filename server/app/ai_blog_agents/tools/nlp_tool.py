@@ -1,17 +1,18 @@
 # ai_blog_agents/tools/nlp_tool.py
+from collections import Counter
+from functools import lru_cache
 from typing import List, Tuple
 import re
 
+# Words longer than 3 characters
+_KEYWORD_RE = re.compile(r'\b\w{4,}\b')
+
+@lru_cache(maxsize=4096)
 def optimize_title(title: str) -> str:
-    # Simple example: capitalize words
+    # Simple example: capitalize words (str.title() would mangle apostrophes, e.g. "Don'T")
     return " ".join(word.capitalize() for word in title.split())
 
 def extract_keywords(text: str, max_keywords: int = 5) -> List[str]:
-    words = re.findall(r'\b\w+\b', text.lower())
-    freq = {}
-    for word in words:
-        if len(word) > 3:
-            freq[word] = freq.get(word, 0) + 1
+    freq = Counter(_KEYWORD_RE.findall(text.lower()))
     # return top max_keywords
-    sorted_keywords = sorted(freq.items(), key=lambda x: x[1], reverse=True)
-    return [k for k, v in sorted_keywords[:max_keywords]]
+    return [k for k, v in freq.most_common(max_keywords)]
\ No newline at end of file
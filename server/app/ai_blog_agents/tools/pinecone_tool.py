@@ -2,13 +2,25 @@
 from typing import List, Dict
 
 # Placeholder: replace with real Pinecone SDK usage
-async def query_similar(tags: List[str], top_k: int = 5) -> List[Dict]:
+async def query_similar_batch(tag_lists: List[List[str]], top_k: int = 5) -> List[List[Dict]]:
     """
-    Simulate Pinecone search by tags.
-    Return a list of blog summaries with engagement metrics.
+    Simulate one multi-query Pinecone search for several tag sets.
+    With the real SDK all queries go out in a single request instead of N round-trips.
+    Return one list of blog summaries with engagement metrics per tag set, in order.
     """
     # Simulated results
     return [
-        {"title": f"Similar blog {i+1}", "engagement": 50 + i*10, "tags": tags}
-        for i in range(top_k)
+        [
+            {"title": f"Similar blog {i+1}", "engagement": 50 + i*10, "tags": tags}
+            for i in range(top_k)
+        ]
+        for tags in tag_lists
     ]
+
+async def query_similar(tags: List[str], top_k: int = 5) -> List[Dict]:
+    """
+    Simulate Pinecone search by tags.
+    Return a list of blog summaries with engagement metrics.
+    """
+    results = await query_similar_batch([tags], top_k)
+    return results[0]
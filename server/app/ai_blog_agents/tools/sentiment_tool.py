@@ -1,20 +1,65 @@
 # ai_blog_agents/tools/sentiment_tool.py
-from typing import List, Dict, Any
-import os
-from langchain_groq import ChatGroq
+import asyncio
+import logging
+import re
+from typing import List, Dict, Any, Tuple
+from app.ai_blog_agents.agents._groq_client import get_groq, guarded_ainvoke, guarded_invoke
 from app.ai_blog_agents.utils.helpers import safe_json_parse
+from app.ai_blog_agents.utils.json_extract import extract_json
+
+logger = logging.getLogger(__name__)
 
 # Initialize ChatGroq for sentiment analysis
 try:
-    groq_api_key = os.getenv("GROQ_API_KEY")
-    if groq_api_key:
-        groq_model = ChatGroq(model="openai/gpt-oss-20b", api_key=groq_api_key)
-    else:
-        groq_model = None
-        print("[SentimentTool] Warning: GROQ_API_KEY not set")
+    groq_model = get_groq()
+    if groq_model is None:
+        logger.warning("GROQ_API_KEY not set")
 except Exception as e:
     groq_model = None
-    print(f"[SentimentTool] Warning: Failed to initialize ChatGroq: {e}")
+    logger.warning("Failed to initialize ChatGroq: %s", e)
+
+# Keywords for the keyword-based fallback
+POSITIVE_KEYWORDS = frozenset({"good", "great", "excellent", "love", "amazing", "helpful", "thanks", "thank you", "awesome", "fantastic"})
+NEGATIVE_KEYWORDS = frozenset({"bad", "hate", "terrible", "awful", "worst", "disappointed", "poor", "useless"})
+
+# Every keyword in one pattern, so a comment is scanned once instead of once per keyword.
+# The lookahead reports overlapping hits, keeping plain substring-match semantics.
+_KEYWORD_POLARITY = {**{kw: "+" for kw in POSITIVE_KEYWORDS}, **{kw: "-" for kw in NEGATIVE_KEYWORDS}}
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in sorted(_KEYWORD_POLARITY, key=len, reverse=True)) + "))"
+)
+
+def _comment_polarities(comment: str) -> set:
+    """'+'/'-' for the keyword groups found in an already-lowercased comment"""
+    found = set()
+    for match in _KEYWORD_RE.finditer(comment):
+        found.add(_KEYWORD_POLARITY[match.group(1)])
+        if len(found) == 2:
+            break
+    return found
+
+def _keyword_counts(comments: List[str]) -> Tuple[int, int, int]:
+    """
+    Keyword-based (positive, negative, neutral) counts.
+    Substring match, each comment lowercased and scanned once.
+    """
+    positive_count = negative_count = 0
+    for comment in comments:
+        found = _comment_polarities(comment.lower())
+        positive_count += "+" in found
+        negative_count += "-" in found
+    return positive_count, negative_count, len(comments) - positive_count - negative_count
+
+def _ai_sentiment(result: Dict[str, Any], positive_count: int, negative_count: int, neutral_count: int) -> Dict[str, Any]:
+    """Shapes a model sentiment object, defaulting counts to the keyword-based ones"""
+    return {
+        "positive": result.get("positive", positive_count),
+        "negative": result.get("negative", negative_count),
+        "neutral": result.get("neutral", neutral_count),
+        "overall_sentiment": result.get("overall_sentiment", "neutral"),
+        "key_themes": result.get("key_themes", []),
+        "recommendations": result.get("recommendations", [])
+    }
 
 def analyze_sentiment(comments: List[str]) -> Dict[str, Any]:
     """
@@ -31,12 +76,7 @@ def analyze_sentiment(comments: List[str]) -> Dict[str, Any]:
         }
     
     # Simple keyword-based fallback
-    positive_keywords = ["good", "great", "excellent", "love", "amazing", "helpful", "thanks", "thank you", "awesome", "fantastic"]
-    negative_keywords = ["bad", "hate", "terrible", "awful", "worst", "disappointed", "poor", "useless"]
-    
-    positive_count = sum(1 for c in comments if any(kw in c.lower() for kw in positive_keywords))
-    negative_count = sum(1 for c in comments if any(kw in c.lower() for kw in negative_keywords))
-    neutral_count = len(comments) - positive_count - negative_count
+    positive_count, negative_count, neutral_count = _keyword_counts(comments)
     
     # Use AI for better analysis if available
     if groq_model and len(comments) > 0:
@@ -59,20 +99,13 @@ Provide a JSON response with:
 
 Return ONLY valid JSON:"""
             
-            response = groq_model.invoke(prompt)
+            response = guarded_invoke(groq_model, prompt)
             if response and response.content:
                 result = safe_json_parse(response.content, {})
                 if result:
-                    return {
-                        "positive": result.get("positive", positive_count),
-                        "negative": result.get("negative", negative_count),
-                        "neutral": result.get("neutral", neutral_count),
-                        "overall_sentiment": result.get("overall_sentiment", "neutral"),
-                        "key_themes": result.get("key_themes", []),
-                        "recommendations": result.get("recommendations", [])
-                    }
+                    return _ai_sentiment(result, positive_count, negative_count, neutral_count)
         except Exception as e:
-            print(f"[SentimentTool] Error in AI analysis: {e}")
+            logger.exception("AI sentiment analysis failed")
     
     # Fallback to keyword-based analysis
     overall = "positive" if positive_count > negative_count else ("negative" if negative_count > positive_count else "neutral")
@@ -85,3 +118,77 @@ Return ONLY valid JSON:"""
         "key_themes": [],
         "recommendations": []
     }
+
+# Posts per batched sentiment prompt
+SENTIMENT_BATCH_SIZE = 8
+
+async def _analyze_sentiment_chunk(comment_groups: List[List[str]]) -> List[Dict[str, Any]]:
+    """
+    Analyzes up to SENTIMENT_BATCH_SIZE posts' comments with one prompt.
+    Falls back to analyze_sentiment per post if the response doesn't cover every post.
+    """
+    posts_text = "\n\n".join(
+        f"[[Post {n}]]\n" + "\n".join(f"{i+1}. {c}" for i, c in enumerate(group[:20]))  # Limit to 20 comments
+        for n, group in enumerate(comment_groups, 1)
+    )
+    prompt = f"""Analyze the sentiment of the comments on each of the following {len(comment_groups)} blog posts and provide insights:
+
+{posts_text}
+
+Provide a JSON response with one entry per post, in the same order:
+{{
+    "posts": [
+        {{
+            "positive": <count of positive comments>,
+            "negative": <count of negative comments>,
+            "neutral": <count of neutral comments>,
+            "overall_sentiment": "positive" | "negative" | "neutral",
+            "key_themes": ["theme1", "theme2"],
+            "recommendations": ["recommendation1", "recommendation2"]
+        }}
+    ]
+}}
+
+Return ONLY valid JSON:"""
+    
+    try:
+        response = await guarded_ainvoke(groq_model, prompt)
+        data = extract_json(response.content, {"posts": list}) if response and response.content else None
+        posts = data.get("posts") if isinstance(data, dict) else None
+        if isinstance(posts, list) and len(posts) == len(comment_groups) and all(isinstance(p, dict) for p in posts):
+            return [
+                _ai_sentiment(result, *_keyword_counts(group))
+                for group, result in zip(comment_groups, posts)
+            ]
+        logger.warning("Batched sentiment response didn't cover every post, analyzing separately")
+    except Exception as e:
+        logger.exception("Batched AI sentiment analysis failed")
+    
+    return list(await asyncio.gather(*(asyncio.to_thread(analyze_sentiment, group) for group in comment_groups)))
+
+async def analyze_sentiment_batch(comment_groups: List[List[str]]) -> List[Dict[str, Any]]:
+    """
+    Analyzes the comments of several blog posts, packing up to SENTIMENT_BATCH_SIZE
+    posts into each prompt and running the prompts concurrently.
+    Returns one analyze_sentiment-shaped result per comment group, in order.
+    """
+    results: List[Dict[str, Any]] = [None] * len(comment_groups)
+    # Posts without comments need no model call
+    pending = [i for i, group in enumerate(comment_groups) if group]
+    for i, group in enumerate(comment_groups):
+        if not group:
+            results[i] = analyze_sentiment(group)
+    
+    if not groq_model:
+        for i in pending:
+            results[i] = analyze_sentiment(comment_groups[i])
+        return results
+    
+    chunks = [pending[start:start + SENTIMENT_BATCH_SIZE] for start in range(0, len(pending), SENTIMENT_BATCH_SIZE)]
+    chunk_results = await asyncio.gather(*(
+        _analyze_sentiment_chunk([comment_groups[i] for i in chunk]) for chunk in chunks
+    ))
+    for chunk, chunk_result in zip(chunks, chunk_results):
+        for i, result in zip(chunk, chunk_result):
+            results[i] = result
+    return results
@@ -1,11 +1,18 @@
 # ai_blog_agents/tools/serpapi_tool.py
-from typing import List, Dict
+from dataclasses import dataclass
+from typing import List
 
-async def search_web(query: str, num_results: int = 5) -> List[Dict]:
+@dataclass(slots=True)
+class SearchResult:
+    """One web search hit; slotted so large result lists stay compact"""
+    title: str
+    url: str
+
+async def search_web(query: str, num_results: int = 5) -> List[SearchResult]:
     """
     Simulate web search results.
     """
     return [
-        {"title": f"Web result {i+1} for {query}", "url": f"https://example.com/{i+1}"}
-        for i in range(num_results)
+        SearchResult(f"Web result {i} for {query}", f"https://example.com/{i}")
+        for i in range(1, num_results + 1)
     ]
@@ -1,11 +1,39 @@
 # ai_blog_agents/utils/helpers.py
-import json
+import copy
+from functools import lru_cache
+from app.ai_blog_agents.utils.json_extract import _iter_balanced, _loads
+
+@lru_cache(maxsize=256)
+def _parse_json_object(raw_text: str):
+    # Raises on bad input, so only successful parses are cached.
+    # Fast path: the outermost first-{ .. last-} slice, which is the whole reply's object
+    # in the common case and costs a single C-level parse.
+    start = raw_text.find("{")
+    end = raw_text.rfind("}")
+    if start != -1 and end > start:
+        try:
+            return _loads(raw_text[start:end + 1])
+        except ValueError:
+            pass
+    # Stray braces in the surrounding prose: try each balanced {...} span in turn,
+    # skipping ones that aren't JSON (e.g. a "{placeholder}" before the object)
+    for span in _iter_balanced(raw_text):
+        try:
+            return _loads(span)
+        except ValueError:
+            continue
+    raise ValueError("No JSON object found")
 
 def safe_json_parse(raw_text: str, default: dict = None) -> dict:
+    """
+    Parses the first {...} object out of model output, returning default on failure.
+    Already-parsed dicts/lists are returned as-is; repeated responses hit an LRU cache.
+    """
+    if isinstance(raw_text, (dict, list)):
+        return raw_text
     default = default or {}
     try:
-        start = raw_text.find("{")
-        end = raw_text.rfind("}")
-        return json.loads(raw_text[start:end+1])
+        # Callers may mutate the result, so hand out a copy of the cached parse
+        return copy.deepcopy(_parse_json_object(raw_text))
     except Exception:
-        return default
+        return default
\ No newline at end of file
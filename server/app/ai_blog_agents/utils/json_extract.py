@@ -0,0 +1,125 @@
+# ai_blog_agents/utils/json_extract.py
+import json
+import re
+from typing import Any, Dict, Iterator, Optional
+
+# orjson parses LLM output several times faster; fall back to the stdlib when it isn't installed.
+# Both raise ValueError subclasses on bad input.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Optional leading ```json / ``` fence, body, optional trailing ``` fence
+_FENCE_RE = re.compile(r'^\s*(?:```(?:json)?)?\s*(.*?)\s*(?:```)?\s*$', re.DOTALL | re.IGNORECASE)
+
+def strip_code_fences(text: str) -> str:
+    """
+    Removes a leading ```json / ``` fence and a trailing ``` fence from model output.
+    """
+    return _FENCE_RE.match(text).group(1)
+
+# Characters the balanced-span scanner acts on; the regex skips everything else in C
+_STRUCTURAL_RE = re.compile(r'[{}\[\]"\\]')
+
+def _iter_balanced(text: str, opener: str = "{", closer: str = "}") -> Iterator[str]:
+    """
+    Yields every top-level balanced opener...closer span in text.
+    Tracks nesting depth and skips brackets inside JSON strings.
+    Only brackets, quotes and backslashes are visited, so long runs of prose
+    and string content cost no Python-level iterations.
+    """
+    depth = 0
+    start = -1
+    in_string = False
+    escaped_at = -1  # index of the character following a backslash inside a string
+    for match in _STRUCTURAL_RE.finditer(text):
+        i = match.start()
+        ch = text[i]
+        if in_string:
+            if i == escaped_at:
+                continue
+            if ch == "\\":
+                escaped_at = i + 1
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"' and depth > 0:
+            in_string = True
+        elif ch == opener:
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == closer and depth > 0:
+            depth -= 1
+            if depth == 0:
+                yield text[start:i + 1]
+
+def _infer_fields(data: Any, expected_keys: Dict[str, type]) -> Any:
+    """
+    Maps values onto expected keys by type when the model used different key names
+    (lists to list fields, strings to string fields, longest strings first).
+    """
+    if isinstance(data, list):
+        list_keys = [k for k, t in expected_keys.items() if t is list]
+        return {list_keys[0]: data} if len(list_keys) == 1 else data
+    if not isinstance(data, dict) or all(k in data for k in expected_keys):
+        return data
+
+    missing = [k for k in expected_keys if k not in data]
+    spare = [v for k, v in data.items() if k not in expected_keys]
+    spare_lists = [v for v in spare if isinstance(v, list)]
+    spare_strs = sorted((v for v in spare if isinstance(v, str)), key=len, reverse=True)
+    result = dict(data)
+    for key in missing:
+        if expected_keys[key] is list and spare_lists:
+            result[key] = spare_lists.pop(0)
+        elif expected_keys[key] is str and spare_strs:
+            result[key] = spare_strs.pop(0)
+    return result
+
+def extract_json(text: str, expected_keys: Optional[Dict[str, type]] = None) -> Optional[Any]:
+    """
+    Defensively extracts JSON from LLM output.
+
+    Steps: drop U+FFFD replacement chars, strip code fences, try a direct parse,
+    then scan for balanced {...} / [...] spans, and finally infer expected keys by value type.
+
+    Args:
+        text: Raw model response
+        expected_keys: Optional mapping of key -> type (str or list) the caller needs
+
+    Returns:
+        Parsed JSON (usually a dict), or None if nothing parseable was found
+    """
+    if not text:
+        return None
+    expected_keys = expected_keys or {}
+
+    text = strip_code_fences(text.replace("\ufffd", ""))
+    parsed = None
+    try:
+        parsed = _loads(text)
+    except ValueError:
+        candidates = []
+        # Try whichever bracket opens first, so an outer array wins over its items
+        pairs = sorted((("{", "}"), ("[", "]")), key=lambda p: text.find(p[0]) % (len(text) + 1))
+        for opener, closer in pairs:
+            for span in _iter_balanced(text, opener, closer):
+                try:
+                    candidates.append(_loads(span))
+                except ValueError:
+                    continue
+            if candidates:
+                break
+        # Prefer the object that carries the most expected keys
+        if candidates:
+            parsed = max(
+                candidates,
+                key=lambda c: sum(1 for k in expected_keys if k in c) if isinstance(c, dict) else 0
+            )
+
+    if parsed is None:
+        return None
+    return _infer_fields(parsed, expected_keys) if expected_keys else parsed
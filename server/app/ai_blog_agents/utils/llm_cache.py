@@ -0,0 +1,140 @@
+# ai_blog_agents/utils/llm_cache.py
+import asyncio
+import logging
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+from app.ai_blog_agents.agents._groq_client import GROQ_SEM, guarded_ainvoke, guarded_invoke
+
+logger = logging.getLogger(__name__)
+
+class LLMCache:
+    """
+    In-memory LRU + TTL cache for LLM responses, keyed by sha256(model + prompt).
+    Uses Redis as a shared second level when REDIS_URL is set, under "<prefix>:<key>".
+    """
+    def __init__(self, maxsize: int = 1024, ttl: int = 600, prefix: str = "llm"):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.prefix = prefix
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._redis = None
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            try:
+                import redis
+                self._redis = redis.Redis.from_url(redis_url, socket_timeout=1)
+            except Exception as e:
+                logger.warning("Redis unavailable, using in-memory cache only: %s", e)
+
+    @staticmethod
+    def make_key(model_name: str, prompt) -> str:
+        # prompt is either a plain string or a list of chat messages
+        if not isinstance(prompt, str):
+            prompt = "\0".join(f"{m.type}:{m.content}" for m in prompt)
+        return hashlib.sha256(f"{model_name}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, model_name: str, prompt) -> Optional[str]:
+        key = self.make_key(model_name, prompt)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+        if self._redis is not None:
+            try:
+                value = self._redis.get(f"{self.prefix}:{key}")
+                if value is not None:
+                    value = value.decode("utf-8")
+                    self._store(key, value)
+                    return value
+            except Exception as e:
+                logger.warning("Redis get error: %s", e)
+        return None
+
+    def set(self, model_name: str, prompt, value: str):
+        if not value:
+            return
+        key = self.make_key(model_name, prompt)
+        self._store(key, value)
+        if self._redis is not None:
+            try:
+                self._redis.set(f"{self.prefix}:{key}", value, ex=self.ttl)
+            except Exception as e:
+                logger.warning("Redis set error: %s", e)
+
+    def _store(self, key: str, value: str):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+llm_cache = LLMCache()
+
+def invoke_cached(model, model_name: str, prompt) -> Optional[str]:
+    """
+    Invokes a ChatGroq model and returns the response content, serving repeats from llm_cache.
+    """
+    cached = llm_cache.get(model_name, prompt)
+    if cached is not None:
+        return cached
+    response = guarded_invoke(model, prompt)
+    content = response.content if hasattr(response, 'content') else str(response)
+    llm_cache.set(model_name, prompt, content)
+    return content
+
+async def ainvoke_cached(model, model_name: str, prompt) -> Optional[str]:
+    """
+    Async variant of invoke_cached using model.ainvoke, so the event loop is not blocked.
+    """
+    cached = llm_cache.get(model_name, prompt)
+    if cached is not None:
+        return cached
+    response = await guarded_ainvoke(model, prompt)
+    content = response.content if hasattr(response, 'content') else str(response)
+    llm_cache.set(model_name, prompt, content)
+    return content
+
+_STREAM_END = object()
+
+async def astream_cached(model, model_name: str, prompt):
+    """
+    Streams response content chunks via model.astream. Cache hits are yielded as a
+    single chunk; a completed stream is stored in llm_cache.
+    """
+    cached = llm_cache.get(model_name, prompt)
+    if cached is not None:
+        yield cached
+        return
+    # Upstream is read into a queue under GROQ_SEM, so the slot is released as soon as
+    # Groq finishes rather than when a slow SSE consumer does
+    queue = asyncio.Queue()
+
+    async def read_upstream():
+        try:
+            async with GROQ_SEM:
+                async for chunk in model.astream(prompt):
+                    text = chunk.content if hasattr(chunk, 'content') else str(chunk)
+                    if text:
+                        queue.put_nowait(text)
+        finally:
+            queue.put_nowait(_STREAM_END)
+
+    reader = asyncio.create_task(read_upstream())
+    parts = []
+    try:
+        while (text := await queue.get()) is not _STREAM_END:
+            parts.append(text)
+            yield text
+        await reader  # re-raises upstream errors
+    finally:
+        reader.cancel()
+    llm_cache.set(model_name, prompt, "".join(parts))
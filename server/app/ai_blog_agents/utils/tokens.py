@@ -0,0 +1,35 @@
+# ai_blog_agents/utils/tokens.py
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio, used only when tiktoken is not installed
+CHARS_PER_TOKEN = 4
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    try:
+        import tiktoken
+        # gpt-4o's tokenizer is close enough for Llama / gpt-oss token counts
+        return tiktoken.encoding_for_model("gpt-4o")
+    except Exception as e:
+        logger.warning("tiktoken unavailable, estimating tokens from characters: %s", e)
+        return None
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncates text to at most max_tokens tokens.
+    """
+    if not text:
+        return ""
+    # Every token covers at least one character, so short text is always within budget
+    if len(text) <= max_tokens:
+        return text
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
@@ -5,13 +5,19 @@ Auth package for JWT authentication
 from .jwt_auth import (
     get_current_user,
     get_current_user_id,
+    get_current_user_id_fast,
     create_access_token,
-    verify_token
+    verify_token,
+    invalidate_user_cache,
+    register_user_cache_invalidator
 )
 
 __all__ = [
     "get_current_user",
     "get_current_user_id", 
+    "get_current_user_id_fast",
     "create_access_token",
-    "verify_token"
+    "verify_token",
+    "invalidate_user_cache",
+    "register_user_cache_invalidator"
 ]
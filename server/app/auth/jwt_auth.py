@@ -3,38 +3,101 @@ JWT Authentication Utilities
 Centralized authentication functions for all routers
 """
 
-import os
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import lru_cache
+from threading import Lock
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import jwt as pyjwt
-from pymongo import MongoClient
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from bson import ObjectId
+from app.database.connection import async_client
+from app.config import settings
 
 # JWT Configuration
-JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-super-secret-jwt-key-change-in-production")
+JWT_SECRET_KEY = settings.JWT_SECRET_KEY
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_TIME_HOURS = 24
 
+# Reused decoder and key bytes for the per-request decode. Every token we issue
+# carries exp and sub; nbf/iat/aud are never set, so their checks are skipped.
+JWT_DECODER = pyjwt.PyJWT()
+JWT_SECRET_BYTES = JWT_SECRET_KEY.encode("utf-8")
+JWT_DECODE_OPTIONS = {
+    "require": ["exp", "sub"],
+    "verify_nbf": False,
+    "verify_iat": False,
+    "verify_aud": False
+}
+
+def _decode_token(token: str) -> dict:
+    """Verify signature and expiry, returning the payload; raises pyjwt.PyJWTError"""
+    return JWT_DECODER.decode(token, JWT_SECRET_BYTES, algorithms=[JWT_ALGORITHM], options=JWT_DECODE_OPTIONS)
+
 # Security
 security = HTTPBearer()
 
-# MongoDB connection for user lookup
-try:
-    mongodb_uri = os.getenv("MONGODB_URI")
-    if not mongodb_uri:
-        raise ValueError("MONGODB_URI environment variable not set")
-    
-    client = MongoClient(mongodb_uri)
-    db = client["fluxwell"]
-    users_collection = db["users"]
-    print("JWT Auth: MongoDB connection successful")
-except Exception as e:
-    print(f"Warning: MongoDB connection failed in JWT auth: {e}")
+# Validated tokens -> user document, so repeat requests skip JWT verification and the
+# user lookup. Entries live until the token expires or TOKEN_CACHE_TTL seconds pass,
+# whichever is sooner, which bounds how stale a cached user document can get.
+TOKEN_CACHE_TTL = settings.TOKEN_CACHE_TTL
+TOKEN_CACHE_SIZE = 4096
+_TOKEN_CACHE: "OrderedDict[str, tuple]" = OrderedDict()  # token hash -> (expires_at, user)
+_TOKEN_CACHE_LOCK = Lock()
+
+def _token_key(token: str) -> str:
+    # Hash so raw tokens are never kept in memory
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+
+def _get_cached_user(token_key: str) -> Optional[dict]:
+    with _TOKEN_CACHE_LOCK:
+        entry = _TOKEN_CACHE.get(token_key)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.time():
+            del _TOKEN_CACHE[token_key]
+            return None
+        _TOKEN_CACHE.move_to_end(token_key)
+        return user
+
+def _cache_user(token_key: str, exp, user: dict):
+    expires_at = time.time() + TOKEN_CACHE_TTL
+    if isinstance(exp, (int, float)):
+        expires_at = min(expires_at, exp)
+    with _TOKEN_CACHE_LOCK:
+        _TOKEN_CACHE[token_key] = (expires_at, user)
+        _TOKEN_CACHE.move_to_end(token_key)
+        while len(_TOKEN_CACHE) > TOKEN_CACHE_SIZE:
+            _TOKEN_CACHE.popitem(last=False)
+
+# Other per-user caches register here, so every user-update path that already calls
+# invalidate_user_cache clears them too
+_USER_CACHE_INVALIDATORS = []
+
+def register_user_cache_invalidator(invalidator) -> None:
+    """Have invalidate_user_cache also call invalidator(user_id: str)"""
+    _USER_CACHE_INVALIDATORS.append(invalidator)
+
+def invalidate_user_cache(user_id) -> None:
+    """Drop cached auth entries for a user after their document changes"""
+    user_id = str(user_id)
+    with _TOKEN_CACHE_LOCK:
+        stale = [key for key, (_, user) in _TOKEN_CACHE.items() if str(user.get("_id")) == user_id]
+        for key in stale:
+            del _TOKEN_CACHE[key]
+    for invalidator in _USER_CACHE_INVALIDATORS:
+        invalidator(user_id)
+
+# MongoDB collection for user lookup, on the shared async client so the lookup
+# doesn't hold a threadpool worker
+if async_client is not None:
+    users_collection = async_client["fluxwell"]["users"]
+else:
+    print("Warning: MongoDB connection not available for JWT auth")
     users_collection = None
 
 def create_access_token(data: dict) -> str:
@@ -45,41 +108,97 @@ def create_access_token(data: dict) -> str:
     encoded_jwt = pyjwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+# Fields downstream code reads from the authenticated user; the rest of the
+# document (onboarding data, health-service tokens, ...) isn't fetched per request
+USER_PROJECTION = {
+    "_id": 1,
+    "email": 1,
+    "full_name": 1,
+    "auth_provider": 1,
+    "profile_picture_url": 1,
+    "onboarding_completed": 1,
+    "created_at": 1
+}
+
+@lru_cache(maxsize=10000)
+def _oid(user_id: str) -> ObjectId:
+    # The same sub comes back on every request from a user; skip re-validating the hex
+    return ObjectId(user_id)
+
+def _decode_user_object_id(token: str):
+    """Validate the JWT and return (user ObjectId, payload), raising 401/500 HTTPExceptions"""
+    payload = _decode_token(token)
+    user_id: str = payload.get("sub")
+    if user_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, 
+            detail="Invalid authentication credentials"
+        )
+    
+    if users_collection is None:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail="Database connection not available"
+        )
+    
+    # Convert string user_id to ObjectId for database query
+    try:
+        user_object_id = _oid(user_id)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, 
+            detail="Invalid user ID format"
+        )
+    return user_object_id, payload
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Get current user from JWT token"""
     try:
-        payload = pyjwt.decode(credentials.credentials, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED, 
-                detail="Invalid authentication credentials"
-            )
-        
-        if users_collection is None:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
-                detail="Database connection not available"
-            )
+        token_key = _token_key(credentials.credentials)
+        cached_user = _get_cached_user(token_key)
+        if cached_user is not None:
+            return dict(cached_user)
         
-        # Convert string user_id to ObjectId for database query
-        from bson import ObjectId
-        try:
-            user_object_id = ObjectId(user_id)
-        except Exception:
+        user_object_id, payload = _decode_user_object_id(credentials.credentials)
+        user = await users_collection.find_one({"_id": user_object_id}, projection=USER_PROJECTION)
+        if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, 
-                detail="Invalid user ID format"
+                detail="User not found"
             )
         
-        user = users_collection.find_one({"_id": user_object_id})
+        _cache_user(token_key, payload.get("exp"), user)
+        return dict(user)
+    except HTTPException:
+        raise
+    except pyjwt.PyJWTError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, 
+            detail="Invalid authentication credentials"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
+            detail=f"Authentication error: {str(e)}"
+        )
+
+async def get_current_user_id(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+    """Get current user ID from JWT token, confirming the user exists with an _id-only lookup"""
+    try:
+        cached_user = _get_cached_user(_token_key(credentials.credentials))
+        if cached_user is not None:
+            return str(cached_user["_id"])
+        
+        user_object_id, _ = _decode_user_object_id(credentials.credentials)
+        user = await users_collection.find_one({"_id": user_object_id}, projection={"_id": 1})
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, 
                 detail="User not found"
             )
-        
-        return user
+        return str(user["_id"])
+    except HTTPException:
+        raise
     except pyjwt.PyJWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, 
@@ -91,24 +210,31 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
             detail=f"Authentication error: {str(e)}"
         )
 
-def get_current_user_id(current_user: dict = Depends(get_current_user)) -> str:
-    """Extract user ID from current user object"""
-    user_id = current_user.get("_id")
+def get_current_user_id_fast(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+    """
+    Get current user ID from the JWT's sub claim alone, without a database round-trip.
+    For endpoints that only scope queries by user ID; use get_current_user_id when
+    the user must still exist.
+    """
+    try:
+        payload = _decode_token(credentials.credentials)
+    except pyjwt.PyJWTError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, 
+            detail="Invalid authentication credentials"
+        )
+    user_id = payload.get("sub")
     if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, 
             detail="User ID not found in token"
         )
-    
-    # Convert ObjectId to string if needed
-    if hasattr(user_id, '__str__'):
-        return str(user_id)
-    return user_id
+    return str(user_id)
 
 def verify_token(token: str) -> Optional[dict]:
     """Verify JWT token and return payload"""
     try:
-        payload = pyjwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        payload = _decode_token(token)
         return payload
     except pyjwt.PyJWTError:
         return None
@@ -0,0 +1,30 @@
+"""
+Application settings
+Reads .env once at import; modules take their configuration from `settings`
+instead of calling load_dotenv/os.getenv themselves.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+@dataclass(frozen=True)
+class Settings:
+    MONGODB_URI: Optional[str] = os.getenv("MONGODB_URI")
+    DB_NAME: Optional[str] = os.getenv("DB_NAME")
+    JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "your-super-secret-jwt-key-change-in-production")
+    TOKEN_CACHE_TTL: int = int(os.getenv("TOKEN_CACHE_TTL", "30"))
+    SECRET_KEY: Optional[str] = os.getenv("SECRET_KEY")
+    GROQ_API_KEY: Optional[str] = os.getenv("GROQ_API_KEY")
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
+    FRONTEND_URL: str = os.getenv("FRONTEND_URL", "http://localhost:5173")
+    PUBLIC_BACKEND_URL: Optional[str] = os.getenv("PUBLIC_BACKEND_URL")
+    GOOGLE_CLIENT_ID: Optional[str] = os.getenv("GOOGLE_CLIENT_ID")
+    GOOGLE_CLIENT_SECRET: Optional[str] = os.getenv("GOOGLE_CLIENT_SECRET")
+    FITBIT_CLIENT_ID: Optional[str] = os.getenv("FITBIT_CLIENT_ID")
+    FITBIT_CLIENT_SECRET: Optional[str] = os.getenv("FITBIT_CLIENT_SECRET")
+
+settings = Settings()
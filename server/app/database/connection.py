@@ -1,26 +1,52 @@
-from pymongo import MongoClient
-from dotenv import load_dotenv
-import os
+from pymongo import AsyncMongoClient, MongoClient
+from app.config import settings
+import asyncio
 
-load_dotenv()
+MONGO_URI = settings.MONGODB_URI
+DB_NAME = settings.DB_NAME
 
-MONGO_URI = os.getenv("MONGODB_URI")
-DB_NAME = os.getenv("DB_NAME")
+# Pool settings shared by the sync and async clients
+POOL_OPTIONS = {"maxPoolSize": 50, "minPoolSize": 5, "maxIdleTimeMS": 60000, "waitQueueTimeoutMS": 2000}
 
-# Initialize database connection with error handling
+# Initialize database connection with error handling.
+# These are the app's only Mongo clients; import them rather than constructing new ones.
+client = None
+async_client = None  # for request paths that await Mongo (e.g. auth)
+db = None
+async_db = None  # async_client's handle on DB_NAME, for async handlers
 try:
     if not MONGO_URI:
         raise ValueError("MONGODB_URI environment variable not set")
-    if not DB_NAME:
-        raise ValueError("DB_NAME environment variable not set")
     
-    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000)
-    db = client[DB_NAME]
+    client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=5000, **POOL_OPTIONS)
+    async_client = AsyncMongoClient(MONGO_URI, serverSelectionTimeoutMS=5000, **POOL_OPTIONS)
     
     # Test connection
     client.admin.command('ping')
+    
+    if not DB_NAME:
+        raise ValueError("DB_NAME environment variable not set")
+    db = client[DB_NAME]
+    async_db = async_client[DB_NAME]
     print(f"Database connection successful: {DB_NAME}")
 except Exception as e:
     print(f"Warning: Database connection failed: {e}")
-    client = None
-    db = None
\ No newline at end of file
+    db = None
+    async_db = None
+
+async def warm_pools():
+    """
+    Opens minPoolSize authenticated connections on both clients up front, so the
+    first requests don't pay for TLS + SCRAM handshakes. Concurrent pings each
+    check out their own connection.
+    """
+    warm = POOL_OPTIONS["minPoolSize"]
+    tasks = []
+    if client is not None:
+        tasks += [asyncio.to_thread(client.admin.command, 'ping') for _ in range(warm)]
+    if async_client is not None:
+        tasks += [async_client.admin.command('ping') for _ in range(warm)]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    failures = [r for r in results if isinstance(r, Exception)]
+    if failures:
+        print(f"Warning: Could not warm database connection pool: {failures[0]}")
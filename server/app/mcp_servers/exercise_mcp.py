@@ -1,4 +1,8 @@
 import os
+import asyncio
+import time
+from collections import OrderedDict
+from urllib.parse import quote
 import httpx
 from fastapi import FastAPI
 
@@ -8,18 +12,63 @@ EXDB_BASE = os.getenv(
     "https://workout-databaese.vercel.app/api/v1"
 )
 
+# HTTP/2 needs the h2 package; fall back to HTTP/1.1 keep-alive without it
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# One pooled client for the server's lifetime, so calls reuse TCP/TLS connections
+CLIENT = httpx.AsyncClient(
+    base_url=EXDB_BASE,
+    http2=_HTTP2_AVAILABLE,
+    timeout=10.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+)
+
+# ExerciseDB data is effectively static, so successful responses are kept in memory
+# for a few minutes, keyed by path + normalized params
+CACHE_TTL = 300
+BODY_PARTS_CACHE_TTL = 600
+CACHE_MAXSIZE = 4096
+_response_cache: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (expires_at, json)
+
+# Max concurrent body-part requests in the filter fallback
+FALLBACK_CONCURRENCY = 5
+
+async def _get_json(path: str, params: dict | None = None, ttl: int = CACHE_TTL):
+    """GET path from ExerciseDB, serving repeats from the TTL cache. Raises on HTTP errors."""
+    key = (path, tuple(sorted((params or {}).items())))
+    entry = _response_cache.get(key)
+    if entry is not None:
+        if entry[0] > time.monotonic():
+            _response_cache.move_to_end(key)
+            return entry[1]
+        del _response_cache[key]
+    
+    r = await CLIENT.get(path, params=params)
+    r.raise_for_status()
+    data = r.json()
+    _response_cache[key] = (time.monotonic() + ttl, data)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > CACHE_MAXSIZE:
+        _response_cache.popitem(last=False)
+    return data
+
 app = FastAPI(title="exercise-db-mcp")
 
+@app.on_event("shutdown")
+async def _close_client():
+    await CLIENT.aclose()
+
 @app.post("/tools/search_exercises")
 async def search_exercises(q: str, limit: int = 20):
     """Search exercises by text query from ExerciseDB."""
-    async with httpx.AsyncClient() as client:
-        r = await client.get(
-            f"{EXDB_BASE}/exercises/search",
-            params={"q": q, "limit": limit}
-        )
-        r.raise_for_status()
-        return r.json()
+    return await _get_json(
+        "/exercises/search",
+        params={"q": q, "limit": limit}
+    )
 
 @app.post("/tools/filter_exercises")
 async def filter_exercises(
@@ -34,98 +83,98 @@ async def filter_exercises(
 ):
     """Filter exercises by body parts, muscles, or equipment."""
     # Use the correct API endpoint for filtering
-    async with httpx.AsyncClient() as client:
-        # If we have specific body parts, use the bodyparts endpoint
-        if body_parts and len(body_parts) == 1:
-            # Single body part - use the specific endpoint
-            body_part = body_parts[0].lower().replace(" ", "%20")
-            # Increase limit to get more exercises for better variety
-            params = {"limit": min(limit * 2, 50)}
-            if offset > 0:
-                params["offset"] = offset
-            if search:
-                params["search"] = search
-            if sortBy:
-                params["sortBy"] = sortBy
-            if sortOrder:
-                params["sortOrder"] = sortOrder
-            
-            try:
-                r = await client.get(
-                    f"{EXDB_BASE}/bodyparts/{body_part}/exercises",
-                    params=params
-                )
-                r.raise_for_status()
-                return r.json()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 400:
-                    # Fallback to general exercises endpoint
-                    pass
-                else:
-                    raise
-        
-        # Multiple body parts or other filters - use general exercises endpoint
-        params = {"limit": limit, "offset": offset}
-        if muscles:
-            params["muscles"] = ",".join(muscles)
-        if body_parts:
-            # Filter out invalid body parts that don't exist in the API
-            valid_body_parts = ["neck", "lower arms", "shoulders", "cardio", "upper arms", "chest", "lower legs", "back", "upper legs", "waist"]
-            filtered_body_parts = [bp for bp in body_parts if bp in valid_body_parts]
-            if filtered_body_parts:
-                params["bodyParts"] = ",".join(filtered_body_parts)
-        if equipment:
-            params["equipment"] = ",".join(equipment)
+    # If we have specific body parts, use the bodyparts endpoint
+    if body_parts and len(body_parts) == 1:
+        # Single body part - use the specific endpoint
+        body_part = quote(body_parts[0].lower())
+        # Increase limit to get more exercises for better variety
+        params = {"limit": min(limit * 2, 50)}
+        if offset > 0:
+            params["offset"] = offset
         if search:
             params["search"] = search
         if sortBy:
             params["sortBy"] = sortBy
         if sortOrder:
             params["sortOrder"] = sortOrder
-
+        
         try:
-            r = await client.get(
-                f"{EXDB_BASE}/exercises",
+            return await _get_json(
+                f"/bodyparts/{body_part}/exercises",
                 params=params
             )
-            r.raise_for_status()
-            return r.json()
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 400:
-                # Fallback to getting exercises from multiple body parts
-                all_exercises = []
-                if body_parts:
-                    # Filter to only valid body parts and try all of them
-                    valid_body_parts = ["neck", "lower arms", "shoulders", "cardio", "upper arms", "chest", "lower legs", "back", "upper legs", "waist"]
-                    filtered_body_parts = [bp for bp in body_parts if bp in valid_body_parts]
-                    for body_part in filtered_body_parts:
-                        try:
-                            body_part_clean = body_part.lower().replace(" ", "%20")
-                            # Increase limit to get more exercises for better variety
-                            r = await client.get(
-                                f"{EXDB_BASE}/bodyparts/{body_part_clean}/exercises",
+                # Fallback to general exercises endpoint
+                pass
+            else:
+                raise
+    
+    # Multiple body parts or other filters - use general exercises endpoint
+    params = {"limit": limit, "offset": offset}
+    if muscles:
+        params["muscles"] = ",".join(muscles)
+    if body_parts:
+        # Filter out invalid body parts that don't exist in the API
+        valid_body_parts = ["neck", "lower arms", "shoulders", "cardio", "upper arms", "chest", "lower legs", "back", "upper legs", "waist"]
+        filtered_body_parts = [bp for bp in body_parts if bp in valid_body_parts]
+        if filtered_body_parts:
+            params["bodyParts"] = ",".join(filtered_body_parts)
+    if equipment:
+        params["equipment"] = ",".join(equipment)
+    if search:
+        params["search"] = search
+    if sortBy:
+        params["sortBy"] = sortBy
+    if sortOrder:
+        params["sortOrder"] = sortOrder
+
+    try:
+        return await _get_json(
+            "/exercises",
+            params=params
+        )
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 400:
+            # Fallback to getting exercises from multiple body parts
+            all_exercises = []
+            if body_parts:
+                # Filter to only valid body parts and try all of them
+                valid_body_parts = ["neck", "lower arms", "shoulders", "cardio", "upper arms", "chest", "lower legs", "back", "upper legs", "waist"]
+                filtered_body_parts = [bp for bp in body_parts if bp in valid_body_parts]
+                
+                # Bound the fan-out so one request can't open a connection per body part
+                semaphore = asyncio.Semaphore(FALLBACK_CONCURRENCY)
+                
+                async def fetch_body_part(body_part: str) -> list:
+                    try:
+                        body_part_clean = quote(body_part.lower())
+                        # Increase limit to get more exercises for better variety
+                        async with semaphore:
+                            data = await _get_json(
+                                f"/bodyparts/{body_part_clean}/exercises",
                                 params={"limit": min(limit * 2, 50)}  # Get more exercises per body part
                             )
-                            if r.status_code == 200:
-                                data = r.json()
-                                if isinstance(data, dict) and "data" in data:
-                                    all_exercises.extend(data["data"])
-                        except Exception:
-                            continue
+                        if isinstance(data, dict) and "data" in data:
+                            return data["data"]
+                    except Exception:
+                        pass
+                    return []
                 
-                # Return in expected format
-                return {
-                    "success": True,
-                    "data": all_exercises[:limit],
-                    "metadata": {"totalExercises": len(all_exercises)}
-                }
-            else:
-                raise
+                # Body parts are independent, so fetch them concurrently
+                for exercises in await asyncio.gather(*(fetch_body_part(bp) for bp in filtered_body_parts)):
+                    all_exercises.extend(exercises)
+            
+            # Return in expected format
+            return {
+                "success": True,
+                "data": all_exercises[:limit],
+                "metadata": {"totalExercises": len(all_exercises)}
+            }
+        else:
+            raise
 
 @app.get("/tools/list_body_parts")
 async def list_body_parts():
     """List all available body parts from ExerciseDB."""
-    async with httpx.AsyncClient() as client:
-        r = await client.get(f"{EXDB_BASE}/exercises/bodyparts")
-        r.raise_for_status()
-        return r.json()
\ No newline at end of file
+    return await _get_json("/exercises/bodyparts", ttl=BODY_PARTS_CACHE_TTL)
\ No newline at end of file
@@ -0,0 +1,6 @@
+# app/models/_config.py
+from pydantic import ConfigDict
+
+# Leaf response/ref models are never mutated after construction; extra keys from
+# Mongo documents are dropped. Request bodies keep the default, mutable config.
+OUT_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
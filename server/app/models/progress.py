@@ -1,7 +1,9 @@
 import datetime
+from dataclasses import dataclass
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Literal, Any
 from bson import ObjectId
+from app.models._config import OUT_MODEL_CONFIG
 
 
 # -----------------
@@ -19,6 +21,7 @@ class ProgressEntryIn(BaseModel):
 
 
 class ProgressEntryOut(ProgressEntryIn):
+    model_config = OUT_MODEL_CONFIG
     id: str
     user_id: str
 
@@ -34,6 +37,7 @@ class MilestoneIn(BaseModel):
 
 
 class MilestoneOut(MilestoneIn):
+    model_config = OUT_MODEL_CONFIG
     id: str
     user_id: str
     progress: float  # % toward goal
@@ -57,6 +61,7 @@ class ProgressIn(BaseModel):
 
 
 class ProgressOut(ProgressIn):
+    model_config = OUT_MODEL_CONFIG
     id: str
     created_at: datetime.datetime
 
@@ -64,7 +69,10 @@ class ProgressOut(ProgressIn):
 # -----------------
 # Streaks
 # -----------------
-class StreakOut(BaseModel):
+# Output-only records that are never parsed from request bodies are plain slotted
+# dataclasses; FastAPI and orjson serialize them directly
+@dataclass(slots=True, frozen=True)
+class StreakOut:
     current_streak: int
     longest_streak: int
     last_entry_date: Optional[datetime.date] = None
@@ -73,7 +81,8 @@ class StreakOut(BaseModel):
 # -----------------
 # Badges
 # -----------------
-class BadgeOut(BaseModel):
+@dataclass(slots=True, frozen=True)
+class BadgeOut:
     badge_id: str
     name: str
     description: str
@@ -92,6 +101,7 @@ class CalorieEntryIn(BaseModel):
 
 
 class CalorieEntryOut(CalorieEntryIn):
+    model_config = OUT_MODEL_CONFIG
     id: str
     user_id: str
     created_at: datetime.datetime
@@ -108,6 +118,7 @@ class MacroEntryIn(BaseModel):
 
 
 class MacroEntryOut(MacroEntryIn):
+    model_config = OUT_MODEL_CONFIG
     id: str
     user_id: str
     created_at: datetime.datetime
@@ -123,6 +134,7 @@ class MealEntryIn(BaseModel):
 
 
 class MealEntryOut(MealEntryIn):
+    model_config = OUT_MODEL_CONFIG
     id: str
     user_id: str
     created_at: datetime.datetime
@@ -143,6 +155,7 @@ class SleepEntryIn(BaseModel):
 
 
 class SleepEntryOut(SleepEntryIn):
+    model_config = OUT_MODEL_CONFIG
     id: str
     user_id: str
     created_at: datetime.datetime
@@ -157,6 +170,7 @@ class HydrationEntryIn(BaseModel):
 
 
 class HydrationEntryOut(HydrationEntryIn):
+    model_config = OUT_MODEL_CONFIG
     id: str
     user_id: str
     created_at: datetime.datetime
@@ -176,6 +190,7 @@ class GoalIn(BaseModel):
 
 
 class GoalOut(GoalIn):
+    model_config = OUT_MODEL_CONFIG
     id: str
     user_id: str
     completed: bool = False
@@ -197,6 +212,7 @@ class WorkoutCompletionIn(BaseModel):
 
 
 class WorkoutCompletionOut(WorkoutCompletionIn):
+    model_config = OUT_MODEL_CONFIG
     id: str
     user_id: str
     completion_rate: float
@@ -216,6 +232,7 @@ class BadgeIn(BaseModel):
 
 
 class EnhancedBadgeOut(BaseModel):
+    model_config = OUT_MODEL_CONFIG
     id: str
     name: str
     description: str
@@ -231,6 +248,7 @@ class EnhancedBadgeOut(BaseModel):
 # Dashboard Models
 # -----------------
 class DashboardMetrics(BaseModel):
+    model_config = OUT_MODEL_CONFIG
     workout_completion: Dict[str, Any]
     calorie_intake: Dict[str, Any]
     macro_breakdown: Dict[str, Any]
@@ -242,7 +260,8 @@ class DashboardMetrics(BaseModel):
     badges_streaks: Dict[str, Any]
 
 
-class WeeklyData(BaseModel):
+@dataclass(slots=True, frozen=True)
+class WeeklyData:
     date: datetime.date
     value: float
     target: Optional[float] = None
@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field, validator
 from typing import List, Optional, Union
 from datetime import datetime
 from bson import ObjectId
+from app.models._config import OUT_MODEL_CONFIG
 
 class ExerciseRef(BaseModel):
     exercise_id: str
@@ -14,6 +15,7 @@ class ExerciseRef(BaseModel):
     reps: int = 10
 
 class WorkoutDay(BaseModel):
+    model_config = OUT_MODEL_CONFIG
     weekday: int  # 0-6 (Mon-Sun)
     name: str
     exercises: List[ExerciseRef] = []
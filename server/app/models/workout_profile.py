@@ -2,6 +2,7 @@
 from datetime import datetime
 from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
+from app.models._config import OUT_MODEL_CONFIG
 
 WorkoutLocation = Literal["home", "gym", "outdoor", "mixed"]
 Equipment = Literal["bodyweight", "dumbbells", "resistance_bands", "kettlebell", "other"]
@@ -19,11 +20,13 @@ class WorkoutProfileIn(BaseModel):
     custom_equipment: Optional[List[str]] = Field(default_factory=list)
 
 class WorkoutProfileOut(WorkoutProfileIn):
+    model_config = OUT_MODEL_CONFIG
     id: str
     user_id: str
     created_at: datetime
     updated_at: datetime
 
 class WorkoutStatus(BaseModel):
+    model_config = OUT_MODEL_CONFIG
     profile_exists: bool
     plan_exists: bool
@@ -1,12 +1,19 @@
 # app/routers/ai_realtime.py
 from fastapi import APIRouter, Depends, HTTPException
-from app.auth.jwt_auth import get_current_user_id
-from app.database.connection import db
-from datetime import datetime, timedelta
+from app.auth.jwt_auth import get_current_user_id_fast, register_user_cache_invalidator
+from app.database.connection import async_db
+from app.routers.realtime import get_metrics
+from bson import ObjectId
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import httpx
 import os
 import asyncio
-from typing import Dict, Any, List
+import time
+from collections import OrderedDict
+from threading import Lock
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
 
 router = APIRouter(prefix="/api/ai/realtime", tags=["AI-Realtime"])
 
@@ -22,16 +29,62 @@ THRESHOLDS = {
     "calories": {"min": 1200, "max": 3000, "critical_min": 800, "critical_max": 4000},  # daily calories
 }
 
-def analyze_metric(key: str, value: Any) -> Dict[str, Any]:
-    """Analyze a single metric and return analysis results"""
-    if key not in THRESHOLDS:
-        return None
-    
-    # Convert value to number if possible
+# Display names per metric, built once rather than per analysis
+_TITLES = {k: k.replace('_', ' ').title() for k in THRESHOLDS}
+
+# (min, max, critical_min, critical_max) per metric. The tuples serve the scalar path with a
+# single dict probe; the contiguous (n, 4) table, rows in THRESHOLDS order, backs the
+# vectorized pass through its column views.
+_BOUNDS = {k: (th["min"], th["max"], th["critical_min"], th["critical_max"]) for k, th in THRESHOLDS.items()}
+_KEYS = tuple(_BOUNDS)
+_KEY_INDEX = {k: i for i, k in enumerate(_KEYS)}
+_TABLE = np.array(list(_BOUNDS.values()), dtype=np.float64)
+_MIN, _MAX, _CMIN, _CMAX = _TABLE.T
+
+# Severity codes returned by the classifiers
+NORMAL, WARN_LOW, WARN_HIGH, CRIT_LOW, CRIT_HIGH = range(5)
+
+# (severity, message, recommendation) per code, with each metric's title pre-filled;
+# only the value is formatted in per analysis
+_SEVERITY_TEXT = (
+    ("normal", "{title} is within normal range", "Keep up the good work!"),
+    ("warning", "{title} is below normal range ({{}})", "Consider rest, hydration, or consulting a healthcare provider"),
+    ("warning", "{title} is above normal range ({{}})", "Consider reducing activity, staying hydrated, or consulting a healthcare provider"),
+    ("critical", "{title} is critically low ({{}})", "Seek immediate medical attention"),
+    ("critical", "{title} is critically high ({{}})", "Seek immediate medical attention"),
+)
+_TEMPLATES = {
+    k: tuple((severity, message.format(title=title), recommendation) for severity, message, recommendation in _SEVERITY_TEXT)
+    for k, title in _TITLES.items()
+}
+
+def _severity_code(bounds: Tuple[float, float, float, float], value: float) -> int:
+    """
+    Severity code for one value without an if/elif cascade. The critical range always
+    contains the normal range, so a critical breach also trips the matching warning bound:
+    below critical_min -> 1 + 2 = CRIT_LOW, above critical_max -> 2 + 2 = CRIT_HIGH.
+    """
+    mn, mx, cmn, cmx = bounds
+    return (value < mn) + 2 * ((value > mx) + (value < cmn) + (value > cmx))
+
+def classify_metrics(values: np.ndarray) -> np.ndarray:
+    """
+    Severity code per _KEYS column for an array of metric values (last axis in _KEYS order).
+    Critical bounds are applied last so they win over the warning bounds; NaN slots come back NORMAL.
+    """
+    codes = np.full(values.shape, NORMAL, dtype=np.int8)
+    codes[values < _MIN] = WARN_LOW
+    codes[values > _MAX] = WARN_HIGH
+    codes[values < _CMIN] = CRIT_LOW
+    codes[values > _CMAX] = CRIT_HIGH
+    return codes
+
+def _parse_metric_value(key: str, value: Any):
+    """Convert a raw metric value to a number, or None if it can't be parsed"""
     try:
         if isinstance(value, str):
             # Handle blood pressure format "120/80"
-            if key in ["blood_pressure_systolic", "blood_pressure_diastolic"] and "/" in value:
+            if key in ("blood_pressure_systolic", "blood_pressure_diastolic") and "/" in value:
                 parts = value.split("/")
                 if key == "blood_pressure_systolic":
                     value = float(parts[0])
@@ -41,78 +94,150 @@ def analyze_metric(key: str, value: Any) -> Dict[str, Any]:
                 value = float(value)
     except (ValueError, IndexError):
         return None
-    
-    th = THRESHOLDS[key]
-    severity = "normal"
-    message = ""
-    recommendation = ""
-    
-    if value < th["critical_min"] or value > th["critical_max"]:
-        severity = "critical"
-        if value < th["critical_min"]:
-            message = f"{key.replace('_', ' ').title()} is critically low ({value})"
-            recommendation = "Seek immediate medical attention"
-        else:
-            message = f"{key.replace('_', ' ').title()} is critically high ({value})"
-            recommendation = "Seek immediate medical attention"
-    elif value < th["min"] or value > th["max"]:
-        severity = "warning"
-        if value < th["min"]:
-            message = f"{key.replace('_', ' ').title()} is below normal range ({value})"
-            recommendation = "Consider rest, hydration, or consulting a healthcare provider"
-        else:
-            message = f"{key.replace('_', ' ').title()} is above normal range ({value})"
-            recommendation = "Consider reducing activity, staying hydrated, or consulting a healthcare provider"
-    else:
-        severity = "normal"
-        message = f"{key.replace('_', ' ').title()} is within normal range"
-        recommendation = "Keep up the good work!"
-    
+    return value
+
+def _build_analysis(key: str, value: Any, code: int) -> Dict[str, Any]:
+    """Analysis result for a metric already classified to a severity code"""
+    severity, message, recommendation = _TEMPLATES[key][code]
     return {
         "metric": key,
         "value": value,
         "severity": severity,
-        "message": message,
+        "message": message.format(value),
         "recommendation": recommendation
     }
 
+def analyze_metric(key: str, value: Any) -> Dict[str, Any]:
+    """Analyze a single metric and return analysis results"""
+    bounds = _BOUNDS.get(key)
+    if bounds is None:
+        return None
+    
+    value = _parse_metric_value(key, value)
+    if value is None:
+        return None
+    
+    return _build_analysis(key, value, _severity_code(bounds, value))
+
+def analyze_metrics(metric_mapping: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Analyze every known, non-zero metric in one vectorized threshold pass.
+    Results keep the mapping's order; unknown or unparseable metrics are skipped.
+    """
+    present = {}
+    for key, value in metric_mapping.items():
+        if key in _KEY_INDEX and value and value != 0:  # Only analyze non-zero values
+            value = _parse_metric_value(key, value)
+            if value is not None:
+                present[key] = value
+    if not present:
+        return []
+    
+    values = np.full(len(_KEYS), np.nan)
+    for key, value in present.items():
+        values[_KEY_INDEX[key]] = value
+    codes = classify_metrics(values)
+    return [_build_analysis(key, value, int(codes[_KEY_INDEX[key]])) for key, value in present.items()]
+
 def generate_ai_summary(analyses: List[Dict[str, Any]]) -> str:
     """Generate AI-powered summary based on metric analyses"""
-    critical_issues = [a for a in analyses if a["severity"] == "critical"]
-    warning_issues = [a for a in analyses if a["severity"] == "warning"]
-    normal_metrics = [a for a in analyses if a["severity"] == "normal"]
+    # Bucket in one pass; only the fields the summary uses are collected
+    critical_names = []
+    warning_recommendations = []
+    for a in analyses:
+        severity = a["severity"]
+        if severity == "critical":
+            critical_names.append(a["metric"].replace('_', ' '))
+        elif severity == "warning":
+            warning_recommendations.append(a["recommendation"])
     
-    if critical_issues:
-        return f"🚨 CRITICAL ALERT: {len(critical_issues)} critical health indicators detected. Please seek immediate medical attention for: {', '.join([a['metric'].replace('_', ' ') for a in critical_issues])}"
-    elif warning_issues:
-        return f"⚠️ Health Advisory: {len(warning_issues)} metrics outside normal range. Consider: {', '.join([a['recommendation'] for a in warning_issues[:2]])}"
-    elif normal_metrics:
+    if critical_names:
+        return f"🚨 CRITICAL ALERT: {len(critical_names)} critical health indicators detected. Please seek immediate medical attention for: {', '.join(critical_names)}"
+    elif warning_recommendations:
+        return f"⚠️ Health Advisory: {len(warning_recommendations)} metrics outside normal range. Consider: {', '.join(warning_recommendations[:2])}"
+    elif analyses:
         return "✅ All health metrics are within normal ranges. Great job maintaining your health!"
     else:
         return "📊 Analyzing your health data... Please ensure your health service is properly connected."
 
+# Each user's health-service connection, (provider, has_access_token), cached briefly so
+# repeat /suggestions calls skip the user lookup. User-update paths clear it through
+# invalidate_user_cache.
+HEALTH_CONNECTION_PROJECTION = {"auth_provider": 1, "health_service_provider": 1, "access_token": 1}
+HEALTH_CONNECTION_CACHE_TTL = 30
+HEALTH_CONNECTION_CACHE_SIZE = 10000
+_health_connection_cache: "OrderedDict[str, tuple]" = OrderedDict()  # user_id -> (expires_at, connection)
+_health_connection_lock = Lock()
+
+@lru_cache(maxsize=4096)
+def _parse_oid(user_id: str) -> ObjectId:
+    return ObjectId(user_id)
+
+def _oid(user_id) -> ObjectId:
+    """ObjectId for a user id, memoized per id string; ObjectIds pass through unchanged"""
+    if isinstance(user_id, ObjectId):
+        return user_id
+    return _parse_oid(user_id)
+
+def _invalidate_health_connection(user_id: str) -> None:
+    with _health_connection_lock:
+        _health_connection_cache.pop(user_id, None)
+
+register_user_cache_invalidator(_invalidate_health_connection)
+
+async def _get_health_connection(user_id: str) -> Optional[Tuple[Optional[str], bool]]:
+    """(provider, has_access_token) for the user, or None if the user doesn't exist"""
+    now = time.monotonic()
+    with _health_connection_lock:
+        entry = _health_connection_cache.get(user_id)
+        if entry is not None and entry[0] > now:
+            _health_connection_cache.move_to_end(user_id)
+            return entry[1]
+    
+    user = await async_db.users.find_one({"_id": _oid(user_id)}, HEALTH_CONNECTION_PROJECTION)
+    if not user:
+        return None
+    
+    auth_provider = user.get("auth_provider", "form")
+    if auth_provider in ["google", "fitbit"]:
+        provider = auth_provider
+    else:
+        provider = user.get("health_service_provider")
+    connection = (provider, bool(user.get("access_token")))
+    
+    with _health_connection_lock:
+        _health_connection_cache[user_id] = (now + HEALTH_CONNECTION_CACHE_TTL, connection)
+        _health_connection_cache.move_to_end(user_id)
+        while len(_health_connection_cache) > HEALTH_CONNECTION_CACHE_SIZE:
+            _health_connection_cache.popitem(last=False)
+    return connection
+
+# Response timestamps only need one-second resolution, so the ISO string is rebuilt
+# once per second; a single (second, iso) tuple keeps the swap atomic across threads
+_timestamp_cache = (0, "")
+
+def _utc_timestamp() -> str:
+    """Naive-UTC ISO timestamp for the current second"""
+    global _timestamp_cache
+    now = int(time.time())
+    second, iso = _timestamp_cache
+    if now != second:
+        iso = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat()
+        _timestamp_cache = (now, iso)
+    return iso
+
 @router.get("/suggestions")
-async def realtime_suggestions(user_id: str = Depends(get_current_user_id)):
+async def realtime_suggestions(user_id: str = Depends(get_current_user_id_fast)):
     """Get AI-powered health suggestions based on current metrics"""
     try:
-        from bson import ObjectId
-        user_object_id = ObjectId(user_id)
-        
         # Get user's current health service provider
-        user = db.users.find_one({"_id": user_object_id})
-        if not user:
+        connection = await _get_health_connection(user_id)
+        if connection is None:
             raise HTTPException(404, "User not found")
         
         # Check if user has connected health service
-        auth_provider = user.get("auth_provider", "form")
-        health_service_provider = user.get("health_service_provider")
-        
-        if auth_provider in ["google", "fitbit"]:
-            provider = auth_provider
-        else:
-            provider = health_service_provider
-            
-        if not provider or not user.get("access_token"):
+        provider, has_access_token = connection
+        if not provider or not has_access_token:
             return {
                 "summary": "🔌 Please connect a health service to receive personalized AI suggestions based on your real-time health data.",
                 "anomalies": [],
@@ -122,10 +247,7 @@ async def realtime_suggestions(user_id: str = Depends(get_current_user_id)):
         
         # Get current metrics by calling the realtime metrics endpoint logic
         try:
-            # Import the realtime router's get_metrics function
-            from app.routers.realtime import get_metrics
-            
-            # Call the get_metrics function directly with the resolved user_id
+            # Call the realtime router's get_metrics function directly with the resolved user_id
             metrics_response = await get_metrics(user_id)
             metrics_data = metrics_response
         except Exception as e:
@@ -143,10 +265,6 @@ async def realtime_suggestions(user_id: str = Depends(get_current_user_id)):
                 "sleep": "light"
             }
         
-        # Analyze each metric
-        analyses = []
-        anomalies = []
-        
         # Map the metrics to our analysis format
         metric_mapping = {
             "heart_rate": metrics_data.get("heart_rate", 0),
@@ -165,13 +283,9 @@ async def realtime_suggestions(user_id: str = Depends(get_current_user_id)):
                 metric_mapping["blood_pressure_systolic"] = float(bp_parts[0])
                 metric_mapping["blood_pressure_diastolic"] = float(bp_parts[1])
         
-        for metric_key, value in metric_mapping.items():
-            if value and value != 0:  # Only analyze non-zero values
-                analysis = analyze_metric(metric_key, value)
-                if analysis:
-                    analyses.append(analysis)
-                    if analysis["severity"] in ["warning", "critical"]:
-                        anomalies.append(analysis["message"])
+        # Analyze every metric in one pass
+        analyses = analyze_metrics(metric_mapping)
+        anomalies = [a["message"] for a in analyses if a["severity"] != "normal"]
         
         # Generate AI summary
         summary = generate_ai_summary(analyses)
@@ -182,7 +296,7 @@ async def realtime_suggestions(user_id: str = Depends(get_current_user_id)):
             "analyses": analyses,
             "connected": True,
             "provider": provider,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _utc_timestamp()
         }
         
     except Exception as e:
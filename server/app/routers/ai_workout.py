@@ -74,7 +74,7 @@ def cache_result(expiry_seconds=300):  # 5 minutes default
 
 router = APIRouter(prefix="/ai/workout", tags=["AI Workout"])
 
-from app.auth.jwt_auth import get_current_user_id
+from app.auth.jwt_auth import get_current_user_id_fast
 
 # Init Groq client and model
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
@@ -761,7 +761,7 @@ async def run_groq_agent(user_id: str, mode: str = "assist") -> dict:
 
 # -------------------- FastAPI Endpoints -------------------------------
 @router.post("/generate")
-async def ai_generate_workout(user_id: str = Depends(get_current_user_id), mode: str = "assist"):
+async def ai_generate_workout(user_id: str = Depends(get_current_user_id_fast), mode: str = "assist"):
     """
     mode = assist → AI helps user build plan (filter + suggestions)
     mode = ai → AI generates full plan
@@ -779,7 +779,7 @@ async def ai_generate_workout(user_id: str = Depends(get_current_user_id), mode:
 
 # Legacy compatibility: old clients call /ai/workout/generate-plan
 @router.post("/generate-plan")
-async def ai_generate_workout_legacy(user_id: str = Depends(get_current_user_id)):
+async def ai_generate_workout_legacy(user_id: str = Depends(get_current_user_id_fast)):
     # Build a deterministic, DB-backed 5-day plan to ensure the UI always renders
     # 1) Get user profile details
     user_profile = await call_mcp(user_client, "get_user_profile", {"user_id": user_id})
@@ -1309,7 +1309,7 @@ async def _apply_user_profile_filters(exercises: list, user_id: str) -> list:
 
 @cache_result(expiry_seconds=1800)  # Cache for 30 minutes for better performance
 @router.post("/filter-library")
-async def ai_filter_library(payload: dict, user_id: str = Depends(get_current_user_id)):
+async def ai_filter_library(payload: dict, user_id: str = Depends(get_current_user_id_fast)):
     """
     Filter the full exercise library via Exercise MCP and return normalized results with caching.
     Payload: { filters: { muscles?:[], body_parts?:[], equipment?:[], search?: string, focus?: string, focuses?: string[] }, limit?: number, focus?: string, focuses?: string[] }
@@ -1447,7 +1447,7 @@ async def ai_filter_library(payload: dict, user_id: str = Depends(get_current_us
 
 @router.post("/skip")
 @router.post("/suggest-alternative")  # Add direct route for better compatibility
-async def ai_suggest_alternative(payload: dict, user_id: str = Depends(get_current_user_id)):
+async def ai_suggest_alternative(payload: dict, user_id: str = Depends(get_current_user_id_fast)):
     """
     Suggest alternatives using Exercise MCP, not free-form LLM text.
     Payload = { "skipped_exercise": str, "reason": str, "context": {"muscles":[], "body_parts":[], "equipment":[] } }
@@ -1724,7 +1724,7 @@ async def ai_suggest_alternative(payload: dict, user_id: str = Depends(get_curre
 
 # Legacy compatibility: alias to previous route name
 @router.post("/suggest-alternative")
-async def ai_suggest_alternative_legacy(payload: dict, user_id: str = Depends(get_current_user_id)):
+async def ai_suggest_alternative_legacy(payload: dict, user_id: str = Depends(get_current_user_id_fast)):
     try:
         return await ai_suggest_alternative(payload, user_id)
     except HTTPException as e:
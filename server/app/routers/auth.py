@@ -3,29 +3,26 @@ from fastapi.responses import RedirectResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from authlib.integrations.starlette_client import OAuth
 from starlette.requests import Request
-from pymongo import MongoClient
+from app.database.connection import client
 from pydantic import BaseModel, EmailStr
-import os
-from dotenv import load_dotenv
+from app.config import settings
 from datetime import datetime, timedelta
 import logging
 import bcrypt
 import jwt as pyjwt
 from typing import Optional
 from ..models.user import OnboardingUpdateRequest, OnboardingData, OnboardingStep1, OnboardingStep2, UserResponse, SocialAuthData, OnboardingDataResponse, AIAssessmentResult, OnboardingNutrition
-from ..auth.jwt_auth import get_current_user
+from ..auth.jwt_auth import get_current_user, invalidate_user_cache
 from app.models.nutrition_profile import NutritionProfileIn
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-load_dotenv()
-
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 # JWT Configuration
-JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-super-secret-jwt-key-change-in-production")
+JWT_SECRET_KEY = settings.JWT_SECRET_KEY
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_TIME_HOURS = 24
 
@@ -77,11 +74,9 @@ def create_access_token(data: dict) -> str:
 
 # MongoDB Connection
 try:
-    mongodb_uri = os.getenv("MONGODB_URI")
-    if not mongodb_uri:
+    if client is None:
         raise ValueError("MONGODB_URI environment variable not set")
     
-    client = MongoClient(mongodb_uri)
     # Test connection
     client.admin.command('ping')
     db = client["fluxwell"]
@@ -96,10 +91,10 @@ except Exception as e:
 oauth = OAuth()
 
 # Check OAuth credentials
-google_client_id = os.getenv("GOOGLE_CLIENT_ID")
-google_client_secret = os.getenv("GOOGLE_CLIENT_SECRET")
-fitbit_client_id = os.getenv("FITBIT_CLIENT_ID")
-fitbit_client_secret = os.getenv("FITBIT_CLIENT_SECRET")
+google_client_id = settings.GOOGLE_CLIENT_ID
+google_client_secret = settings.GOOGLE_CLIENT_SECRET
+fitbit_client_id = settings.FITBIT_CLIENT_ID
+fitbit_client_secret = settings.FITBIT_CLIENT_SECRET
 
 # Configure Google OAuth
 if not google_client_id or not google_client_secret:
@@ -261,7 +256,7 @@ async def login_user(user_credentials: UserLogin):
 @router.get("/me")
 async def get_current_user_info(current_user=Depends(get_current_user)):
     """Get current user information"""
-    return UserResponse(
+    return UserResponse.model_construct(
         id=str(current_user["_id"]),
         full_name=current_user["full_name"],
         email=current_user["email"],
@@ -285,6 +280,7 @@ async def complete_onboarding(current_user=Depends(get_current_user)):
                 "onboarding.completed_at": datetime.utcnow()
             }}
         )
+        invalidate_user_cache(current_user["_id"])
         
         if result.modified_count == 0:
             raise HTTPException(status_code=400, detail="Failed to update onboarding status")
@@ -331,6 +327,7 @@ async def save_onboarding_data(
             {"_id": current_user["_id"]},
             {"$set": update_data}
         )
+        invalidate_user_cache(current_user["_id"])
         
         if result.modified_count == 0:
             raise HTTPException(status_code=404, detail="User not found")
@@ -490,6 +487,7 @@ async def update_onboarding_step1(
             {"_id": current_user["_id"]},
             {"$set": update_data}
         )
+        invalidate_user_cache(current_user["_id"])
         
         if result.modified_count == 0:
             raise HTTPException(status_code=400, detail="Failed to update step 1 data")
@@ -522,6 +520,7 @@ async def update_onboarding_step2(
             {"_id": current_user["_id"]},
             {"$set": update_data}
         )
+        invalidate_user_cache(current_user["_id"])
         
         if result.modified_count == 0:
             raise HTTPException(status_code=400, detail="Failed to update step 2 data")
@@ -652,6 +651,7 @@ async def save_ai_assessment(
             {"_id": current_user["_id"]},
             {"$set": update_data}
         )
+        invalidate_user_cache(current_user["_id"])
         
         if result.modified_count == 0:
             # If no modification, try to create the onboarding structure
@@ -668,6 +668,7 @@ async def save_ai_assessment(
                 },
                 upsert=True
             )
+            invalidate_user_cache(current_user["_id"])
         
         logger.info(f"AI assessment saved for user: {current_user['email']}")
         
@@ -764,7 +765,7 @@ async def google_callback(request: Request):
             access_token = create_access_token(data={"sub": str(result.inserted_id)})
             
             # Redirect new users directly to onboarding with token
-            frontend_url = os.getenv('FRONTEND_URL', 'http://localhost:5173')
+            frontend_url = settings.FRONTEND_URL
             redirect_url = f"{frontend_url}/onboarding?token={access_token}&new_user=true"
             logger.info(f"Redirecting new user to onboarding: {redirect_url}")
             
@@ -785,6 +786,7 @@ async def google_callback(request: Request):
                         }
                     }
                 )
+                invalidate_user_cache(existing_user["_id"])
                 logger.info("Updated user with Google Fit access token")
             
             # Create JWT token for existing user
@@ -793,7 +795,7 @@ async def google_callback(request: Request):
             # Check if user has completed onboarding
             has_completed_onboarding = existing_user.get("onboarding_completed", False)
             
-            frontend_url = os.getenv('FRONTEND_URL', 'http://localhost:5173')
+            frontend_url = settings.FRONTEND_URL
             
             if not has_completed_onboarding:
                 # Redirect to onboarding if not completed
@@ -809,7 +811,7 @@ async def google_callback(request: Request):
     except Exception as e:
         logger.error(f"Error in google_callback: {e}")
         # Redirect to signup page with error
-        frontend_url = os.getenv('FRONTEND_URL', 'http://localhost:5173')
+        frontend_url = settings.FRONTEND_URL
         error_url = f"{frontend_url}/signup?error=oauth_failed"
         return RedirectResponse(url=error_url)
 
@@ -818,7 +820,7 @@ def _get_public_backend_base(request: Request) -> str:
     Prefer PUBLIC_BACKEND_URL env (e.g., http://localhost:8000 or https://your-ngrok-domain),
     otherwise fall back to request.base_url.
     """
-    public_base = os.getenv("PUBLIC_BACKEND_URL")
+    public_base = settings.PUBLIC_BACKEND_URL
     if public_base:
         return public_base.rstrip("/") + "/"
     # Fallback to request base_url
@@ -846,6 +848,7 @@ async def handle_health_service_connection(request: Request, user_info: dict, to
             {"_id": user_object_id},
             {"$set": update_data}
         )
+        invalidate_user_cache(user_object_id)
         
         if result.modified_count == 0:
             raise HTTPException(status_code=500, detail="Failed to update user with Google OAuth data")
@@ -857,13 +860,13 @@ async def handle_health_service_connection(request: Request, user_info: dict, to
         request.session.pop("connection_intent", None)
         
         # Redirect to a success page that will communicate with the parent window
-        frontend_url = os.getenv("FRONTEND_URL", "http://localhost:5173")
+        frontend_url = settings.FRONTEND_URL
         success_url = f"{frontend_url}/auth-success?provider=google&type=health_service"
         return RedirectResponse(url=success_url)
         
     except Exception as e:
         logger.error(f"Error in handle_health_service_connection: {e}")
-        frontend_url = os.getenv("FRONTEND_URL", "http://localhost:5173")
+        frontend_url = settings.FRONTEND_URL
         error_url = f"{frontend_url}/auth-error?provider=google&type=health_service&error=connection_failed"
         return RedirectResponse(url=error_url)
 
@@ -889,6 +892,7 @@ async def handle_fitbit_health_service_connection(request: Request, user_info: d
             {"_id": user_object_id},
             {"$set": update_data}
         )
+        invalidate_user_cache(user_object_id)
         
         if result.modified_count == 0:
             raise HTTPException(status_code=500, detail="Failed to update user with Fitbit OAuth data")
@@ -900,13 +904,13 @@ async def handle_fitbit_health_service_connection(request: Request, user_info: d
         request.session.pop("connection_intent", None)
         
         # Redirect to frontend with success message
-        frontend_url = os.getenv("FRONTEND_URL", "http://localhost:5173")
+        frontend_url = settings.FRONTEND_URL
         redirect_url = f"{frontend_url}/realtime?connected=fitbit"
         return RedirectResponse(url=redirect_url)
         
     except Exception as e:
         logger.error(f"Error in handle_fitbit_health_service_connection: {e}")
-        frontend_url = os.getenv("FRONTEND_URL", "http://localhost:5173")
+        frontend_url = settings.FRONTEND_URL
         error_url = f"{frontend_url}/realtime?error=fitbit_connect_failed"
         return RedirectResponse(url=error_url)
 
@@ -1004,7 +1008,7 @@ async def fitbit_callback(request: Request):
             access_token = create_access_token(data={"sub": str(result.inserted_id)})
             
             # Redirect new users directly to onboarding with token
-            frontend_url = os.getenv('FRONTEND_URL', 'http://localhost:5173')
+            frontend_url = settings.FRONTEND_URL
             redirect_url = f"{frontend_url}/onboarding?token={access_token}&new_user=true"
             logger.info(f"Redirecting new Fitbit user to onboarding: {redirect_url}")
             
@@ -1023,6 +1027,7 @@ async def fitbit_callback(request: Request):
                     "social_auth_data.fitbit": user_info
                 }}
             )
+            invalidate_user_cache(existing_user["_id"])
             logger.info(f"Existing Fitbit user logged in: {email}")
             
             # Create JWT token for existing user
@@ -1031,7 +1036,7 @@ async def fitbit_callback(request: Request):
             # Check if user has completed onboarding
             has_completed_onboarding = existing_user.get("onboarding_completed", False)
             
-            frontend_url = os.getenv('FRONTEND_URL', 'http://localhost:5173')
+            frontend_url = settings.FRONTEND_URL
             
             if not has_completed_onboarding:
                 # Redirect to onboarding if not completed
@@ -1047,7 +1052,7 @@ async def fitbit_callback(request: Request):
     except Exception as e:
         logger.error(f"Error in fitbit_callback: {e}")
         # Redirect to signup page with error
-        frontend_url = os.getenv('FRONTEND_URL', 'http://localhost:5173')
+        frontend_url = settings.FRONTEND_URL
         error_url = f"{frontend_url}/signup?error=fitbit_oauth_failed"
         return RedirectResponse(url=error_url)
 
@@ -1059,12 +1064,12 @@ async def test_auth():
         "mongodb_connected": users_collection is not None,
         "google_oauth_configured": bool(google_client_id and google_client_secret),
         "fitbit_oauth_configured": bool(fitbit_client_id and fitbit_client_secret),
-        "google_client_id_set": bool(os.getenv("GOOGLE_CLIENT_ID")),
-        "google_client_secret_set": bool(os.getenv("GOOGLE_CLIENT_SECRET")),
-        "fitbit_client_id_set": bool(os.getenv("FITBIT_CLIENT_ID")),
-        "fitbit_client_secret_set": bool(os.getenv("FITBIT_CLIENT_SECRET")),
-        "mongodb_uri_set": bool(os.getenv("MONGODB_URI")),
-        "frontend_url": os.getenv('FRONTEND_URL', 'http://localhost:5173'),
+        "google_client_id_set": bool(settings.GOOGLE_CLIENT_ID),
+        "google_client_secret_set": bool(settings.GOOGLE_CLIENT_SECRET),
+        "fitbit_client_id_set": bool(settings.FITBIT_CLIENT_ID),
+        "fitbit_client_secret_set": bool(settings.FITBIT_CLIENT_SECRET),
+        "mongodb_uri_set": bool(settings.MONGODB_URI),
+        "frontend_url": settings.FRONTEND_URL,
         "status": "ready"
     }
 
@@ -1,6 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from typing import List, Optional, Dict, Any
+import asyncio
 import json
+import logging
 import re
 from datetime import datetime, timedelta
 from bson import ObjectId
@@ -18,12 +21,12 @@ from app.models.blog import (
     CommentIn, CommentOut, LikeRequest, LikeResponse, RelatedBlogsResponse
 )
 from app.database.connection import db
-from app.auth.jwt_auth import get_current_user_id, get_current_user, verify_token
+from app.auth.jwt_auth import get_current_user_id_fast, get_current_user, verify_token
 from app.ai_blog_agents.graph.suggestion_graph import BlogSuggestionGraph
 from app.ai_blog_agents.graph.blog_generation_graph import BlogGenerationGraph
 from app.ai_blog_agents.agents.engagement_agent import EngagementAgent
 from app.ai_blog_agents.agents.blog_planner_agent import BlogPlannerAgent
-from app.ai_blog_agents.agents.blog_writer_agent import generate_blog
+from app.ai_blog_agents.agents.blog_writer_agent import generate_blog, stream_blog
 from app.ai_blog_agents.agents.seo_optimizer_agent import optimize_blog
 from app.ai_blog_agents.agents.summarizer_agent import summarize_blog
 from app.ai_blog_agents.agents.translation_agent import TranslationAgent
@@ -31,6 +34,8 @@ from app.ai_blog_agents.agents.readability_agent import ReadabilityAgent
 from app.ai_blog_agents.agents.tone_agent import ToneAgent
 from app.ai_blog_agents.tools.image_suggestion_tool import generate_image_suggestions
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/blog", tags=["Blog"])
 
 # Initialize AI agents lazily to avoid import-time errors
@@ -132,6 +137,24 @@ def get_blog_generation_graph():
             _blog_generation_graph = None
     return _blog_generation_graph
 
+async def _sse_events(chunks):
+    """Wrap an async iterator of text chunks as Server-Sent Events"""
+    try:
+        async for chunk in chunks:
+            yield f"data: {json.dumps({'content': chunk}, ensure_ascii=False)}\n\n"
+        yield "event: done\ndata: {}\n\n"
+    except Exception:
+        # Details go to the log only; the client gets a generic message
+        logger.exception("Blog stream failed")
+        yield f"event: error\ndata: {json.dumps({'error': 'Stream failed'})}\n\n"
+
+def _sse_response(chunks) -> StreamingResponse:
+    return StreamingResponse(
+        _sse_events(chunks),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 def _oid(val: str):
     """Convert string to ObjectId"""
     try:
@@ -162,7 +185,7 @@ async def get_blog_posts(
     search: Optional[str] = Query(None, description="Search in title and content"),
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Get user's blog posts with filters"""
     try:
@@ -238,10 +261,7 @@ async def get_blog_posts(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"Error in get_blog_posts: {str(e)}")
-        print(error_trace)
+        logger.exception("Error in get_blog_posts")
         # Return empty response instead of crashing
         return {
             "posts": [],
@@ -333,10 +353,7 @@ async def get_public_blog_posts(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"Error in get_public_blog_posts: {str(e)}")
-        print(error_trace)
+        logger.exception("Error in get_public_blog_posts")
         # Return empty response instead of crashing
         return {
             "posts": [],
@@ -390,15 +407,13 @@ async def get_public_blog_post(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error fetching public blog post: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error fetching public blog post")
         raise HTTPException(status_code=500, detail=f"Error fetching blog post: {str(e)}")
 
 @router.get("/posts/{post_id}", response_model=BlogPostOut)
 async def get_blog_post(
     post_id: str,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Get a single blog post by ID (authenticated, for user's own posts)"""
     try:
@@ -417,7 +432,7 @@ async def get_blog_post(
 @router.post("/posts", response_model=BlogPostOut)
 async def create_blog_post(
     post: BlogPostIn,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Create a new blog post"""
     try:
@@ -456,7 +471,7 @@ async def create_blog_post(
 async def update_blog_post(
     post_id: str,
     post: BlogPostIn,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Update a blog post"""
     try:
@@ -498,7 +513,7 @@ async def update_blog_post(
 @router.delete("/posts/{post_id}")
 async def delete_blog_post(
     post_id: str,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Delete a blog post"""
     try:
@@ -793,15 +808,13 @@ async def _calculate_analytics(user_id: str) -> BlogAnalytics:
 
 @router.get("/analytics", response_model=BlogAnalytics)
 async def get_blog_analytics(
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Get blog analytics for the user"""
     try:
         return await _calculate_analytics(user_id)
     except Exception as e:
-        import traceback
-        print(f"Error in get_blog_analytics: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error in get_blog_analytics")
         raise HTTPException(status_code=500, detail=f"Error fetching analytics: {str(e)}")
 
 # -------------------------
@@ -811,7 +824,7 @@ async def get_blog_analytics(
 @router.get("/insights", response_model=AIInsights)
 async def get_ai_insights(
     category: Optional[str] = Query(None, description="Category for topic suggestions"),
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Get AI insights and suggestions"""
     try:
@@ -831,20 +844,22 @@ async def get_ai_insights(
             tags = latest_blog.get("tags", [])
         
         engagement_agent = get_engagement_agent()
-        engagement_result = await engagement_agent.run({
-            "user_id": user_id,
-            "tags": tags,
-            "content": content
-        })
-        
-        # Get topic suggestions
         suggestion_graph = get_suggestion_graph()
-        suggestion_result = await suggestion_graph.run(
-            content=content if content else None,
-            tags=tags if tags else None,
-            user_id=user_id,
-            category=category or "general",
-            count=5
+        
+        # Engagement insights and topic suggestions are independent, run them concurrently
+        engagement_result, suggestion_result = await asyncio.gather(
+            engagement_agent.run({
+                "user_id": user_id,
+                "tags": tags,
+                "content": content
+            }),
+            suggestion_graph.run(
+                content=content if content else None,
+                tags=tags if tags else None,
+                user_id=user_id,
+                category=category or "general",
+                count=5
+            )
         )
         
         return AIInsights(
@@ -859,9 +874,7 @@ async def get_ai_insights(
             }
         )
     except Exception as e:
-        import traceback
-        print(f"Error in get_ai_insights: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error in get_ai_insights")
         # Return fallback insights instead of failing
         return AIInsights(
             insights="Your content shows good potential. Focus on trending topics in health and fitness.",
@@ -875,7 +888,7 @@ async def get_ai_insights(
 async def get_topic_suggestions(
     category: Optional[str] = Query("general", description="Category for suggestions"),
     count: int = Query(5, ge=1, le=10, description="Number of suggestions"),
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Get AI-generated topic suggestions"""
     try:
@@ -901,7 +914,7 @@ async def get_topic_suggestions(
 @router.post("/editor/generate-outline", response_model=OutlineResponse)
 async def generate_outline(
     request: GenerateOutlineRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Generate blog outline from topic using BlogGenerationGraph"""
     try:
@@ -1011,15 +1024,13 @@ async def generate_outline(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error generating outline: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error generating outline")
         raise HTTPException(status_code=500, detail=f"Error generating outline: {str(e)}")
 
 @router.post("/editor/generate-content", response_model=ContentResponse)
 async def generate_content(
     request: GenerateContentRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Generate full blog content after user approves the outline"""
     try:
@@ -1054,15 +1065,23 @@ async def generate_content(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error generating content: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error generating content")
         raise HTTPException(status_code=500, detail=f"Error generating content: {str(e)}")
 
+@router.post("/editor/generate-content/stream")
+async def generate_content_stream(
+    request: GenerateContentRequest,
+    user_id: str = Depends(get_current_user_id_fast)
+):
+    """Stream full blog content as Server-Sent Events"""
+    if not request.approved:
+        raise HTTPException(status_code=400, detail="Outline must be approved before generating content")
+    return _sse_response(stream_blog(request.topic, mindmap=request.outline))
+
 @router.post("/editor/optimize-title", response_model=OptimizeTitleResponse)
 async def optimize_title(
     request: OptimizeTitleRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Optimize blog title for SEO"""
     try:
@@ -1109,10 +1128,7 @@ async def optimize_title(
             success=True
         )
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"[optimize_title] ❌ Error: {str(e)}")
-        print(error_trace)
+        logger.exception("optimize_title failed")
         return OptimizeTitleResponse(
             optimized_title=request.title or "",
             suggestions=[],
@@ -1122,7 +1138,7 @@ async def optimize_title(
 @router.post("/editor/improve-readability", response_model=ImproveReadabilityResponse)
 async def improve_readability(
     request: ImproveReadabilityRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Improve content readability"""
     try:
@@ -1138,18 +1154,27 @@ async def improve_readability(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error improving readability: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error improving readability")
         return ImproveReadabilityResponse(
             improved_content=request.content,
             success=False
         )
 
+@router.post("/editor/improve-readability/stream")
+async def improve_readability_stream(
+    request: ImproveReadabilityRequest,
+    user_id: str = Depends(get_current_user_id_fast)
+):
+    """Stream readability-improved content as Server-Sent Events"""
+    readability_agent = get_readability_agent()
+    if not readability_agent or not readability_agent.model:
+        raise HTTPException(status_code=500, detail="Readability agent not available")
+    return _sse_response(readability_agent.stream_readability(request.content, request.title or ""))
+
 @router.post("/editor/adjust-tone", response_model=AdjustToneResponse)
 async def adjust_tone(
     request: AdjustToneRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Adjust content tone"""
     try:
@@ -1165,18 +1190,27 @@ async def adjust_tone(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error adjusting tone: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error adjusting tone")
         return AdjustToneResponse(
             adjusted_content=request.content,
             success=False
         )
 
+@router.post("/editor/adjust-tone/stream")
+async def adjust_tone_stream(
+    request: AdjustToneRequest,
+    user_id: str = Depends(get_current_user_id_fast)
+):
+    """Stream tone-adjusted content as Server-Sent Events"""
+    tone_agent = get_tone_agent()
+    if not tone_agent or not tone_agent.model:
+        raise HTTPException(status_code=500, detail="Tone agent not available")
+    return _sse_response(tone_agent.stream_tone(request.content, request.target_tone, request.title or ""))
+
 @router.post("/editor/generate-meta", response_model=GenerateMetaResponse)
 async def generate_meta(
     request: GenerateMetaRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Generate SEO meta tags"""
     try:
@@ -1194,9 +1228,7 @@ async def generate_meta(
             success=True
         )
     except Exception as e:
-        import traceback
-        print(f"Error generating meta: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error generating meta")
         return GenerateMetaResponse(
             seo_meta="",
             tags=[],
@@ -1207,7 +1239,7 @@ async def generate_meta(
 @router.post("/editor/translate", response_model=TranslateResponse)
 async def translate_content(
     request: TranslateRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Translate blog content and title"""
     try:
@@ -1263,10 +1295,7 @@ async def translate_content(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        error_trace = traceback.format_exc()
-        print(f"[translate_content] ❌ Error: {str(e)}")
-        print(error_trace)
+        logger.exception("translate_content failed")
         return TranslateResponse(
             translated_content=request.content or "",
             translated_title=request.title,
@@ -1275,6 +1304,21 @@ async def translate_content(
             success=False
         )
 
+@router.post("/editor/translate/stream")
+async def translate_content_stream(
+    request: TranslateRequest,
+    user_id: str = Depends(get_current_user_id_fast)
+):
+    """Stream translated content as Server-Sent Events (title not included)"""
+    translation_agent = get_translation_agent()
+    if not translation_agent or not translation_agent.model:
+        raise HTTPException(status_code=500, detail="Translation agent not available")
+    return _sse_response(translation_agent.translate_stream(
+        request.content,
+        request.target_language,
+        request.source_language
+    ))
+
 @router.post("/public/summarize", response_model=SummarizeResponse)
 async def summarize_public_blog(
     request: SummarizeRequest
@@ -1311,9 +1355,7 @@ async def summarize_public_blog(
             success=True
         )
     except Exception as e:
-        import traceback
-        print(f"Error summarizing public blog content: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error summarizing public blog content")
         return SummarizeResponse(
             summary="",
             keywords=[],
@@ -1323,7 +1365,7 @@ async def summarize_public_blog(
 @router.post("/editor/summarize", response_model=SummarizeResponse)
 async def summarize_content(
     request: SummarizeRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Summarize blog content"""
     try:
@@ -1334,9 +1376,7 @@ async def summarize_content(
             success=True
         )
     except Exception as e:
-        import traceback
-        print(f"Error summarizing content: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error summarizing content")
         return SummarizeResponse(
             summary="",
             keywords=[],
@@ -1346,20 +1386,18 @@ async def summarize_content(
 @router.post("/editor/suggest-images", response_model=ImageSuggestionResponse)
 async def suggest_images(
     request: ImageSuggestionRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Generate image suggestions for blog"""
     try:
-        result = generate_image_suggestions(request.content, request.title or "")
+        result = await generate_image_suggestions(request.content, request.title or "")
         return ImageSuggestionResponse(
             suggestions=result.get("suggestions", []),
             images=result.get("images", []),
             success=result.get("success", False)
         )
     except Exception as e:
-        import traceback
-        print(f"Error suggesting images: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error suggesting images")
         return ImageSuggestionResponse(
             suggestions=[],
             images=[],
@@ -1369,7 +1407,7 @@ async def suggest_images(
 @router.post("/editor/regenerate-section", response_model=RegenerateSectionResponse)
 async def regenerate_section(
     request: RegenerateSectionRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Regenerate a specific section of blog content"""
     try:
@@ -1429,7 +1467,7 @@ Instructions:
 
 Return ONLY the regenerated section content, starting with the section heading (## {request.section_title}):"""
         
-        response = planner_agent.run_prompt(prompt)
+        response = await planner_agent.arun_prompt(prompt)
         if response:
             return RegenerateSectionResponse(
                 regenerated_section=response.strip(),
@@ -1440,15 +1478,13 @@ Return ONLY the regenerated section content, starting with the section heading (
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error regenerating section: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error regenerating section")
         raise HTTPException(status_code=500, detail=f"Error regenerating section: {str(e)}")
 
 @router.post("/editor/analyze", response_model=ContentAnalysisResponse)
 async def analyze_content(
     request: ContentAnalysisRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Analyze content for SEO, readability, and other metrics"""
     try:
@@ -1456,8 +1492,11 @@ async def analyze_content(
         word_count = len(request.content.split())
         read_time = max(1, word_count // 200)
         
-        # Get SEO score
-        seo_result = await optimize_blog(request.title, "", request.content)
+        # SEO optimization and summary are independent, run them concurrently
+        seo_result, summary_result = await asyncio.gather(
+            optimize_blog(request.title, "", request.content),
+            summarize_blog(request.title, request.content)
+        )
         
         # Calculate keyword density (simplified)
         content_lower = request.content.lower()
@@ -1468,8 +1507,7 @@ async def analyze_content(
         # Estimate SEO score (0-100)
         seo_score = min(100, max(0, int(50 + (keyword_density * 2) + (len(request.title.split()) * 5))))
         
-        # Get summary for suggestions
-        summary_result = await summarize_blog(request.title, request.content)
+        # Use summary keywords for suggestions
         suggestions = []
         if summary_result.get("keywords"):
             suggestions.append(f"Consider using these keywords: {', '.join(summary_result['keywords'][:5])}")
@@ -1482,9 +1520,7 @@ async def analyze_content(
             success=True
         )
     except Exception as e:
-        import traceback
-        print(f"Error analyzing content: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error analyzing content")
         # Return basic analysis
         word_count = len(request.content.split())
         read_time = max(1, word_count // 200)
@@ -1551,9 +1587,7 @@ async def toggle_like(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error toggling like: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error toggling like")
         raise HTTPException(status_code=500, detail=f"Error toggling like: {str(e)}")
 
 @router.get("/posts/{post_id}/like-status", response_model=Dict[str, Any])
@@ -1630,9 +1664,7 @@ async def add_comment(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error adding comment: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error adding comment")
         raise HTTPException(status_code=500, detail=f"Error adding comment: {str(e)}")
 
 @router.get("/posts/{post_id}/comments", response_model=List[CommentOut])
@@ -1661,9 +1693,7 @@ async def get_comments(post_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error fetching comments: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error fetching comments")
         return []
 
 @router.delete("/posts/{post_id}/comments/{comment_id}")
@@ -1703,9 +1733,7 @@ async def delete_comment(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error deleting comment: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error deleting comment")
         raise HTTPException(status_code=500, detail=f"Error deleting comment: {str(e)}")
 
 # -------------------------
@@ -1774,9 +1802,7 @@ async def get_related_blogs(post_id: str):
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
-        print(f"Error getting related blogs: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error getting related blogs")
         return RelatedBlogsResponse(
             related_blogs=[],
             suggested_topics=[],
@@ -16,7 +16,7 @@ from app.models.chat import (
     ChatSessionIn, ChatSessionOut, ChatHistoryResponse, 
     SessionMessagesResponse, MessageIn
 )
-from app.auth.jwt_auth import get_current_user_id
+from app.auth.jwt_auth import get_current_user_id_fast
 
 load_dotenv()
 
@@ -34,7 +34,7 @@ groq_client = AsyncGroq(api_key=os.getenv("GROQ_API_KEY"))
 @router.post("/sessions", response_model=ChatSessionOut)
 async def create_chat_session(
     session_data: ChatSessionIn,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Create a new chat session"""
     try:
@@ -51,7 +51,7 @@ async def get_chat_history(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     search: Optional[str] = Query(None, description="Search in titles and messages"),
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Get user's chat history with pagination and search"""
     try:
@@ -70,7 +70,7 @@ async def get_session_messages(
     session_id: str,
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=100, description="Messages per page"),
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Get messages for a specific chat session"""
     try:
@@ -90,7 +90,7 @@ async def get_session_messages(
 async def update_session_title(
     session_id: str,
     title: str = Form(...),
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Update session title"""
     try:
@@ -110,7 +110,7 @@ async def update_session_title(
 @router.delete("/sessions/{session_id}")
 async def delete_chat_session(
     session_id: str,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Delete a chat session and all its messages"""
     try:
@@ -136,7 +136,7 @@ async def chat_with_fluxie_langgraph(
     style: str = Form("friendly"),
     session_id: Optional[str] = Form(None),
     file: Optional[UploadFile] = File(None),
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """LangGraph-powered chat with advanced state management and memory"""
     
@@ -14,7 +14,7 @@ from pydantic import BaseModel, Field
 from bson import ObjectId
 
 from app.database.connection import db
-from app.auth import get_current_user_id
+from app.auth import get_current_user_id_fast
 from bson import ObjectId as _BsonObjectId
 from dotenv import load_dotenv
 # Groq client assumed to be initialized in your project like in ai_workout.py
@@ -952,7 +952,7 @@ async def _startup_indexes():
 
 # ---------- CRUD: Meal Logs ----------
 @router.post("/meals", response_model=MealLogOut)
-def create_meal(payload: Union[MealLogIn, SimpleMealLogIn], user_id: str = Depends(get_current_user_id)):
+def create_meal(payload: Union[MealLogIn, SimpleMealLogIn], user_id: str = Depends(get_current_user_id_fast)):
     now = _now()
     
     # Handle both complex and simple meal log formats
@@ -1017,7 +1017,7 @@ def create_meal(payload: Union[MealLogIn, SimpleMealLogIn], user_id: str = Depen
     )
 
 @router.get("/meals", response_model=List[MealLogOut])
-def list_meals(user_id: str = Depends(get_current_user_id), start: Optional[str] = None, end: Optional[str] = None):
+def list_meals(user_id: str = Depends(get_current_user_id_fast), start: Optional[str] = None, end: Optional[str] = None):
     q = {"user_id": _oid(user_id)}
     if start:
         try:
@@ -1064,7 +1064,7 @@ def list_meals(user_id: str = Depends(get_current_user_id), start: Optional[str]
     return out
 
 @router.get("/meals/{meal_id}", response_model=MealLogOut)
-def read_meal(meal_id: str, user_id: str = Depends(get_current_user_id)):
+def read_meal(meal_id: str, user_id: str = Depends(get_current_user_id_fast)):
     d = db.meals.find_one({"_id": _oid(meal_id), "user_id": _oid(user_id)})
     if not d:
         raise HTTPException(404, "Meal not found")
@@ -1086,7 +1086,7 @@ def read_meal(meal_id: str, user_id: str = Depends(get_current_user_id)):
     )
 
 @router.put("/meals/{meal_id}", response_model=MealLogOut)
-def update_meal(meal_id: str, payload: MealLogIn, user_id: str = Depends(get_current_user_id)):
+def update_meal(meal_id: str, payload: MealLogIn, user_id: str = Depends(get_current_user_id_fast)):
     now = _now()
     res = db.meals.find_one_and_update(
         {"_id": _oid(meal_id), "user_id": _oid(user_id)},
@@ -1107,7 +1107,7 @@ def update_meal(meal_id: str, payload: MealLogIn, user_id: str = Depends(get_cur
     )
 
 @router.delete("/meals/{meal_id}")
-def delete_meal(meal_id: str, user_id: str = Depends(get_current_user_id)):
+def delete_meal(meal_id: str, user_id: str = Depends(get_current_user_id_fast)):
     res = db.meals.delete_one({"_id": _oid(meal_id), "user_id": _oid(user_id)})
     if res.deleted_count == 0:
         raise HTTPException(404, "Not found")
@@ -1115,7 +1115,7 @@ def delete_meal(meal_id: str, user_id: str = Depends(get_current_user_id)):
 
 # ---------- Water logs ----------
 @router.post("/water")
-def add_water(payload: WaterLogIn, user_id: str = Depends(get_current_user_id)):
+def add_water(payload: WaterLogIn, user_id: str = Depends(get_current_user_id_fast)):
     now = _now()
     ts = payload.timestamp or now
     doc = {"user_id": _oid(user_id), "amount_ml": payload.amount_ml, "timestamp": ts, "created_at": now}
@@ -1146,7 +1146,7 @@ def add_water(payload: WaterLogIn, user_id: str = Depends(get_current_user_id)):
     }
 
 @router.get("/streak")
-def get_streak(user_id: str = Depends(get_current_user_id)):
+def get_streak(user_id: str = Depends(get_current_user_id_fast)):
     """Get user's current streak information"""
     # Update streak when user accesses this endpoint (daily check-in)
     _update_nutrition_streak(user_id)
@@ -1165,7 +1165,7 @@ def get_streak(user_id: str = Depends(get_current_user_id)):
     }
 
 @router.post("/activity")
-def log_activity(user_id: str = Depends(get_current_user_id)):
+def log_activity(user_id: str = Depends(get_current_user_id_fast)):
     """Log user activity for streak tracking (called when user visits app)"""
     _update_nutrition_streak(user_id)
     
@@ -1177,7 +1177,7 @@ def log_activity(user_id: str = Depends(get_current_user_id)):
     }
 
 @router.get("/water/today")
-def water_today(user_id: str = Depends(get_current_user_id)):
+def water_today(user_id: str = Depends(get_current_user_id_fast)):
     today = datetime.utcnow().date()
     start = datetime.combine(today, datetime.min.time())
     end = datetime.combine(today, datetime.max.time())
@@ -1195,7 +1195,7 @@ def water_today(user_id: str = Depends(get_current_user_id)):
 
 # ---------- Macro Targets ----------
 @router.post("/macros", response_model=MacroTargetsOut)
-def set_macros(payload: MacroTargetsIn, user_id: str = Depends(get_current_user_id)):
+def set_macros(payload: MacroTargetsIn, user_id: str = Depends(get_current_user_id_fast)):
     now = _now()
     doc = {"user_id": _oid(user_id), **payload.dict(), "updated_at": now}
     existing = db.macro_targets.find_one({"user_id": _oid(user_id)})
@@ -1209,7 +1209,7 @@ def set_macros(payload: MacroTargetsIn, user_id: str = Depends(get_current_user_
     return MacroTargetsOut(id=str(saved["_id"]), user_id=str(saved["user_id"]), calories=saved.get("calories"), protein_g=saved.get("protein_g"), carbs_g=saved.get("carbs_g"), fats_g=saved.get("fats_g"), diet_pref=saved.get("diet_pref"), exclude_foods=saved.get("exclude_foods", []), updated_at=saved.get("updated_at"))
 
 @router.get("/macros", response_model=Optional[MacroTargetsOut])
-def get_macros(user_id: str = Depends(get_current_user_id)):
+def get_macros(user_id: str = Depends(get_current_user_id_fast)):
     d = db.macro_targets.find_one({"user_id": _oid(user_id)})
     if not d:
         profile = _get_nutrition_profile(user_id) or {}
@@ -1218,7 +1218,7 @@ def get_macros(user_id: str = Depends(get_current_user_id)):
 
 # ---------- Grocery List generation ----------
 @router.get("/grocery-list")
-def get_grocery_list(user_id: str = Depends(get_current_user_id)):
+def get_grocery_list(user_id: str = Depends(get_current_user_id_fast)):
     """
     Compile a grocery list from all meal items for the next 7 days
     (simple heuristic: collect unique ingredient names from logged meals).
@@ -1237,7 +1237,7 @@ def get_grocery_list(user_id: str = Depends(get_current_user_id)):
     return {"items": unique_items, "generated_at": datetime.utcnow()}
 
 @router.get("/grocery-list/export")
-def export_grocery_csv(user_id: str = Depends(get_current_user_id)):
+def export_grocery_csv(user_id: str = Depends(get_current_user_id_fast)):
     data = get_grocery_list(user_id)
     items = data["items"]
     buf = io.StringIO()
@@ -1335,7 +1335,7 @@ def _simple_swap_candidates(item_name: str, exclude_list: List[str], target_prof
     return [{"title": c, **macro_base} for c in candidates[:actual_limit]]
 
 @router.post("/meal-swap")
-async def meal_swap(req: MealSwapRequest = Body(...), user_id: str = Depends(get_current_user_id)):
+async def meal_swap(req: MealSwapRequest = Body(...), user_id: str = Depends(get_current_user_id_fast)):
     logger.info(f"Meal swap request: meal_type={req.meal_type}, current_title={req.current_meal_title}")
 
     # Handle test format with meal_type and current_meal_title
@@ -1811,7 +1811,7 @@ async def _call_groq_chat(system: str, user: str, temperature: float = 0.2, max_
     raise AgentNodeError(f"AI call failed after trying all models: {last_error}")
 
 @router.post("/generate-recipe", response_model=GeneratedRecipe)
-async def generate_recipe(payload: GenerateRecipeRequest, user_id: str = Depends(get_current_user_id)):
+async def generate_recipe(payload: GenerateRecipeRequest, user_id: str = Depends(get_current_user_id_fast)):
     user = db.users.find_one({"_id": _oid(user_id)}) or {}
     system = (
         "You are a professional nutritionist and recipe writer. Produce healthy, practical recipes. "
@@ -1882,7 +1882,7 @@ def predict_daily_compliance(user_id: str, day: date = None) -> Dict[str, Any]:
     return {"status": status, "score": score, "meals_count": len(meals), "total_calories": total_cal, "target_calories": target}
 
 @router.get("/compliance/today")
-def compliance_today(user_id: str = Depends(get_current_user_id)):
+def compliance_today(user_id: str = Depends(get_current_user_id_fast)):
     return predict_daily_compliance(user_id)
 
 # ---------- Diet optimization agent (LangGraph implementation) ----------
@@ -2730,7 +2730,7 @@ async def _run_diet_agent(user_id: str, swap_context: Optional[dict] = None) ->
 
 
 @router.post("/agent/run")
-async def agent_run(background_tasks: BackgroundTasks, user_id: str = Depends(get_current_user_id)):
+async def agent_run(background_tasks: BackgroundTasks, user_id: str = Depends(get_current_user_id_fast)):
     async def runner():
         await _run_diet_agent(user_id)
 
@@ -2739,7 +2739,7 @@ async def agent_run(background_tasks: BackgroundTasks, user_id: str = Depends(ge
 
 
 @router.post("/agent/plan", response_model=dict)
-async def agent_generate_plan(user_id: str = Depends(get_current_user_id)):
+async def agent_generate_plan(user_id: str = Depends(get_current_user_id_fast)):
     result = await _run_diet_agent(user_id)
     return {
         "plan": _serialize_plan_entries(result.get("daily_plan", [])),
@@ -2752,7 +2752,7 @@ async def agent_generate_plan(user_id: str = Depends(get_current_user_id)):
 
 
 @router.post("/agent/refresh", response_model=dict)
-async def agent_refresh_plan(payload: Dict[str, Any] = Body(default_factory=dict), user_id: str = Depends(get_current_user_id)):
+async def agent_refresh_plan(payload: Dict[str, Any] = Body(default_factory=dict), user_id: str = Depends(get_current_user_id_fast)):
     force = bool(payload.get("force"))
     today = _today_date_str()
     logger.info(f"Refreshing meal plan for user {user_id} on date {today} (force={force})")
@@ -2880,7 +2880,7 @@ async def agent_refresh_plan(payload: Dict[str, Any] = Body(default_factory=dict
 
 
 @router.post("/agent/swap", response_model=dict)
-async def agent_swap_meal(payload: MealSwapRequest, user_id: str = Depends(get_current_user_id)):
+async def agent_swap_meal(payload: MealSwapRequest, user_id: str = Depends(get_current_user_id_fast)):
     swap_context = payload.dict(exclude_none=True)
     result = await _run_diet_agent(user_id, swap_context=swap_context)
     
@@ -2917,7 +2917,7 @@ async def agent_swap_meal(payload: MealSwapRequest, user_id: str = Depends(get_c
 
 
 @router.post("/agent/save", response_model=dict)
-async def save_agent_plan(payload: Dict[str, Any] = Body(default_factory=dict), user_id: str = Depends(get_current_user_id)):
+async def save_agent_plan(payload: Dict[str, Any] = Body(default_factory=dict), user_id: str = Depends(get_current_user_id_fast)):
     """Save the current agent plan to database"""
     today = _today_date_str()
     logger.info(f"Saving meal plan for user {user_id} on date {today}")
@@ -2971,7 +2971,7 @@ async def save_agent_plan(payload: Dict[str, Any] = Body(default_factory=dict),
     }
 
 @router.post("/agent/auto-generate", response_model=dict)
-async def auto_generate_meal_plan(user_id: str = Depends(get_current_user_id)):
+async def auto_generate_meal_plan(user_id: str = Depends(get_current_user_id_fast)):
     """Automatically generate a meal plan if none exists for today"""
     today = _today_date_str()
     logger.info(f"Auto-generating meal plan for user {user_id} on date {today}")
@@ -3048,7 +3048,7 @@ class NutritionProfileOut(NutritionProfileIn):
     updated_at: datetime
 
 @router.get("/profile", response_model=Optional[NutritionProfileOut])
-def get_nutrition_profile(user_id: str = Depends(get_current_user_id)):
+def get_nutrition_profile(user_id: str = Depends(get_current_user_id_fast)):
     doc = db.nutrition_profiles.find_one({"user_id": _oid(user_id)})
     if not doc:
         return None
@@ -3067,7 +3067,7 @@ def get_nutrition_profile(user_id: str = Depends(get_current_user_id)):
     )
 
 @router.post("/profile", response_model=NutritionProfileOut)
-def upsert_nutrition_profile(payload: NutritionProfileIn, user_id: str = Depends(get_current_user_id)):
+def upsert_nutrition_profile(payload: NutritionProfileIn, user_id: str = Depends(get_current_user_id_fast)):
     now = _now()
     body = { **payload.dict(), "updated_at": now }
     existing = db.nutrition_profiles.find_one({"user_id": _oid(user_id)})
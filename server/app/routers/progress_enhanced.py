@@ -16,7 +16,7 @@ from app.models.progress import (
     DashboardMetrics, WeeklyData
 )
 from app.database.connection import db
-from app.auth.jwt_auth import get_current_user_id
+from app.auth.jwt_auth import get_current_user_id_fast
 
 router = APIRouter(prefix="/api/progress", tags=["Progress Enhanced"])
 
@@ -330,7 +330,7 @@ def _get_user_stats(user_id: str) -> Dict[str, Any]:
 # Nutrition Endpoints
 # -------------------------
 @router.post("/nutrition/calories", response_model=CalorieEntryOut)
-def log_calories(entry: CalorieEntryIn, user_id: str = Depends(get_current_user_id)):
+def log_calories(entry: CalorieEntryIn, user_id: str = Depends(get_current_user_id_fast)):
     """Log daily calorie intake"""
     doc = entry.dict()
     doc["user_id"] = _oid(user_id)
@@ -351,7 +351,7 @@ def log_calories(entry: CalorieEntryIn, user_id: str = Depends(get_current_user_
 
 @router.get("/nutrition/calories", response_model=List[CalorieEntryOut])
 def get_calories(
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_current_user_id_fast),
     days: int = Query(30, description="Number of days to retrieve")
 ):
     """Get calorie entries for the last N days - pulls from nutrition module meals"""
@@ -391,7 +391,7 @@ def get_calories(
 
 
 @router.post("/nutrition/macros", response_model=MacroEntryOut)
-def log_macros(entry: MacroEntryIn, user_id: str = Depends(get_current_user_id)):
+def log_macros(entry: MacroEntryIn, user_id: str = Depends(get_current_user_id_fast)):
     """Log daily macronutrient intake"""
     doc = entry.dict()
     doc["user_id"] = _oid(user_id)
@@ -412,7 +412,7 @@ def log_macros(entry: MacroEntryIn, user_id: str = Depends(get_current_user_id))
 
 @router.get("/nutrition/macros", response_model=List[MacroEntryOut])
 def get_macros(
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_current_user_id_fast),
     days: int = Query(30, description="Number of days to retrieve")
 ):
     """Get macro entries for the last N days - pulls from nutrition module meals"""
@@ -462,7 +462,7 @@ def get_macros(
 
 
 @router.post("/nutrition/meals", response_model=MealEntryOut)
-def log_meal(entry: MealEntryIn, user_id: str = Depends(get_current_user_id)):
+def log_meal(entry: MealEntryIn, user_id: str = Depends(get_current_user_id_fast)):
     """Log meal compliance"""
     doc = entry.dict()
     doc["user_id"] = _oid(user_id)
@@ -483,7 +483,7 @@ def log_meal(entry: MealEntryIn, user_id: str = Depends(get_current_user_id)):
 
 @router.get("/nutrition/meals", response_model=List[MealEntryOut])
 def get_meals(
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_current_user_id_fast),
     days: int = Query(30, description="Number of days to retrieve")
 ):
     """Get meal entries for the last N days - pulls from nutrition module meals"""
@@ -527,7 +527,7 @@ def get_meals(
 # Health Endpoints
 # -------------------------
 @router.post("/health/sleep", response_model=SleepEntryOut)
-def log_sleep(entry: SleepEntryIn, user_id: str = Depends(get_current_user_id)):
+def log_sleep(entry: SleepEntryIn, user_id: str = Depends(get_current_user_id_fast)):
     """Log sleep data"""
     doc = entry.dict()
     doc["user_id"] = _oid(user_id)
@@ -552,7 +552,7 @@ def log_sleep(entry: SleepEntryIn, user_id: str = Depends(get_current_user_id)):
 
 @router.get("/health/sleep", response_model=List[SleepEntryOut])
 def get_sleep(
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_current_user_id_fast),
     days: int = Query(30, description="Number of days to retrieve")
 ):
     """Get sleep entries for the last N days"""
@@ -574,7 +574,7 @@ def get_sleep(
 
 
 @router.post("/health/hydration", response_model=HydrationEntryOut)
-def log_hydration(entry: HydrationEntryIn, user_id: str = Depends(get_current_user_id)):
+def log_hydration(entry: HydrationEntryIn, user_id: str = Depends(get_current_user_id_fast)):
     """Log hydration data"""
     doc = entry.dict()
     doc["user_id"] = _oid(user_id)
@@ -595,7 +595,7 @@ def log_hydration(entry: HydrationEntryIn, user_id: str = Depends(get_current_us
 
 @router.get("/health/hydration", response_model=List[HydrationEntryOut])
 def get_hydration(
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_current_user_id_fast),
     days: int = Query(30, description="Number of days to retrieve")
 ):
     """Get hydration entries for the last N days - pulls from nutrition module water tracking"""
@@ -643,7 +643,7 @@ def get_hydration(
 # Goal Management Endpoints
 # -------------------------
 @router.post("/goals", response_model=GoalOut)
-def create_goal(goal: GoalIn, user_id: str = Depends(get_current_user_id)):
+def create_goal(goal: GoalIn, user_id: str = Depends(get_current_user_id_fast)):
     """Create a new goal"""
     doc = goal.dict()
     doc["user_id"] = _oid(user_id)
@@ -662,7 +662,7 @@ def create_goal(goal: GoalIn, user_id: str = Depends(get_current_user_id)):
 
 @router.get("/goals", response_model=Dict[str, Any])
 def get_goals(
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_current_user_id_fast),
     category: Optional[str] = Query(None, description="Filter by category"),
     completed: Optional[bool] = Query(None, description="Filter by completion status")
 ):
@@ -747,7 +747,7 @@ def get_goals(
 def update_goal_progress(
     goal_id: str,
     progress: float,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id_fast)
 ):
     """Update goal progress"""
     goal = db.goals.find_one({"_id": _oid(goal_id), "user_id": _oid(user_id)})
@@ -781,7 +781,7 @@ def update_goal_progress(
 # Workout Completion Endpoints
 # -------------------------
 @router.post("/workouts/completion", response_model=WorkoutCompletionOut)
-def log_workout_completion(entry: WorkoutCompletionIn, user_id: str = Depends(get_current_user_id)):
+def log_workout_completion(entry: WorkoutCompletionIn, user_id: str = Depends(get_current_user_id_fast)):
     """Log workout completion"""
     doc = entry.dict()
     doc["user_id"] = _oid(user_id)
@@ -803,7 +803,7 @@ def log_workout_completion(entry: WorkoutCompletionIn, user_id: str = Depends(ge
 
 @router.get("/workouts/completion", response_model=List[WorkoutCompletionOut])
 def get_workout_completions(
-    user_id: str = Depends(get_current_user_id),
+    user_id: str = Depends(get_current_user_id_fast),
     days: int = Query(30, description="Number of days to retrieve")
 ):
     """Get workout completions for the last N days"""
@@ -828,7 +828,7 @@ def get_workout_completions(
 # Enhanced Badge Endpoints
 # -------------------------
 @router.post("/badges/check")
-def check_user_badges(user_id: str = Depends(get_current_user_id)):
+def check_user_badges(user_id: str = Depends(get_current_user_id_fast)):
     """Check and unlock badges for user, returns newly unlocked badges"""
     newly_unlocked = _check_enhanced_badges(user_id)
     return {
@@ -837,7 +837,7 @@ def check_user_badges(user_id: str = Depends(get_current_user_id)):
     }
 
 @router.post("/badges/initialize")
-def initialize_user_badges(user_id: str = Depends(get_current_user_id)):
+def initialize_user_badges(user_id: str = Depends(get_current_user_id_fast)):
     """Initialize all possible badges for user (locked state)"""
     initialized = []
     
@@ -870,7 +870,7 @@ def initialize_user_badges(user_id: str = Depends(get_current_user_id)):
     }
 
 @router.get("/badges/enhanced", response_model=List[EnhancedBadgeOut])
-def get_enhanced_badges(user_id: str = Depends(get_current_user_id)):
+def get_enhanced_badges(user_id: str = Depends(get_current_user_id_fast)):
     """Get enhanced badges with progress tracking - initializes badges if none exist"""
     
     # Check if user has any badges, if not initialize them
@@ -931,7 +931,7 @@ def get_enhanced_badges(user_id: str = Depends(get_current_user_id)):
 # Dashboard Endpoint
 # -------------------------
 @router.get("/dashboard", response_model=DashboardMetrics)
-def get_dashboard_metrics(user_id: str = Depends(get_current_user_id)):
+def get_dashboard_metrics(user_id: str = Depends(get_current_user_id_fast)):
     """Get comprehensive dashboard metrics"""
     now = datetime.utcnow()
     week_ago = now - timedelta(days=7)
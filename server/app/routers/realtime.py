@@ -6,7 +6,7 @@ import asyncio
 import time
 from typing import Dict, Any
 
-from app.auth.jwt_auth import get_current_user_id
+from app.auth.jwt_auth import get_current_user_id_fast
 from app.database.connection import db
 
 router = APIRouter(prefix="/api/realtime", tags=["Realtime"])
@@ -604,7 +604,7 @@ async def health_check():
 # -----------------------
 
 @router.get("/status")
-async def connection_status(user_id: str = Depends(get_current_user_id)):
+async def connection_status(user_id: str = Depends(get_current_user_id_fast)):
     """Return whether the current user is connected to Google Fit or Fitbit."""
     from bson import ObjectId
     try:
@@ -648,7 +648,7 @@ async def connection_status(user_id: str = Depends(get_current_user_id)):
 # -----------------------
 
 @router.get("/metrics")
-async def get_metrics(user_id: str = Depends(get_current_user_id)):
+async def get_metrics(user_id: str = Depends(get_current_user_id_fast)):
     try:
         # No caching - always fetch fresh data for realtime
         current_time = datetime.utcnow().timestamp()
@@ -13,7 +13,7 @@ from app.models.workout_profile import (
 router = APIRouter(prefix="/workout", tags=["Workout"])
 
 # ---------- JWT Authentication ----------
-from app.auth.jwt_auth import get_current_user_id
+from app.auth.jwt_auth import get_current_user_id_fast
 # -------------------------------------------------------------
 
 def _oid(val: str) -> ObjectId:
@@ -73,13 +73,13 @@ def _startup():
     _ensure_indexes()
 
 @router.get("/status", response_model=WorkoutStatus)
-def status(user_id: str = Depends(get_current_user_id)):
+def status(user_id: str = Depends(get_current_user_id_fast)):
     profile = db.workout_profiles.find_one({"user_id": _oid(user_id)})
     plan = db.workout_plans.find_one({"user_id": _oid(user_id), "status": "active"})
     return WorkoutStatus(profile_exists=bool(profile), plan_exists=bool(plan))
 
 @router.get("/profile", response_model=Optional[WorkoutProfileOut])
-def read_profile(user_id: str = Depends(get_current_user_id)):
+def read_profile(user_id: str = Depends(get_current_user_id_fast)):
     doc = db.workout_profiles.find_one({"user_id": _oid(user_id)})
     if not doc:
         return None
@@ -98,7 +98,7 @@ def read_profile(user_id: str = Depends(get_current_user_id)):
     )
 
 @router.post("/profile", response_model=WorkoutProfileOut)
-def upsert_profile(payload: WorkoutProfileIn, user_id: str = Depends(get_current_user_id)):
+def upsert_profile(payload: WorkoutProfileIn, user_id: str = Depends(get_current_user_id_fast)):
     now = datetime.utcnow()
     existing = db.workout_profiles.find_one({"user_id": _oid(user_id)})
     body = {
@@ -4,7 +4,7 @@ from typing import Optional, List, Dict, Any
 from app.models.workout import WorkoutPlan, WorkoutDay, ExerciseRef, WorkoutSession
 from app.database.connection import db  # your Mongo client
 from bson import ObjectId
-from app.auth.jwt_auth import get_current_user_id
+from app.auth.jwt_auth import get_current_user_id_fast
 
 router = APIRouter(prefix="/workouts", tags=["Workouts"])
 
@@ -69,7 +69,7 @@ def _user_match_filter(user_id_str: str, user_oid: ObjectId) -> dict:
     return {"$or": [{"user_id": user_oid}, {"user_id": user_id_str}]}
 
 @router.post("/custom/plan/check-conflicts")
-def check_custom_plan_conflicts(payload: dict, user_id: str = Depends(get_current_user_id)):
+def check_custom_plan_conflicts(payload: dict, user_id: str = Depends(get_current_user_id_fast)):
     """Check if any of the provided dates already have workouts (AI or CUSTOM). Payload: { dates: string[] }"""
     user_oid = _oid(user_id)
     dates: List[str] = [ _ensure_date_str(x) for x in (payload.get("dates") or []) ]
@@ -123,7 +123,7 @@ def check_custom_plan_conflicts(payload: dict, user_id: str = Depends(get_curren
     return {"conflicts": conflicts}
 
 @router.post("/custom/plan/save")
-def save_custom_plan(payload: dict, user_id: str = Depends(get_current_user_id)):
+def save_custom_plan(payload: dict, user_id: str = Depends(get_current_user_id_fast)):
     """
     Save custom plan entries per date with optional replacement.
     Payload: {
@@ -271,7 +271,7 @@ def save_custom_plan(payload: dict, user_id: str = Depends(get_current_user_id))
     return {"ok": True, "replaced": replace, "dates": target_dates}
 
 @router.get("/plan")
-def get_plan(user_id: str = Depends(get_current_user_id)):
+def get_plan(user_id: str = Depends(get_current_user_id_fast)):
     # Convert user_id to ObjectId for database queries
     user_oid = _oid(user_id)
     
@@ -364,7 +364,7 @@ def get_plan(user_id: str = Depends(get_current_user_id)):
     return _convert_objectids_to_strings(plan)
 
 @router.patch("/plan")
-def replace_plan(payload: dict, user_id: str = Depends(get_current_user_id)):
+def replace_plan(payload: dict, user_id: str = Depends(get_current_user_id_fast)):
     """Replace the entire workout plan (used by 'Use this plan' action).
     Expected payload shape:
     { "days": [ { "name": str, "weekday": int, "exercises": [ { exercise_id,name,sets,reps,duration_seconds,rest_seconds,notes } ] } ] }
@@ -513,7 +513,7 @@ def replace_plan(payload: dict, user_id: str = Depends(get_current_user_id)):
     return _convert_objectids_to_strings(saved)
 
 @router.delete("/plan")
-def delete_plan(user_id: str = Depends(get_current_user_id)):
+def delete_plan(user_id: str = Depends(get_current_user_id_fast)):
     user_oid = _oid(user_id)
     result = db.workout_plans.delete_one({"user_id": user_oid})
     if result.deleted_count == 0:
@@ -521,7 +521,7 @@ def delete_plan(user_id: str = Depends(get_current_user_id)):
     return {"ok": True, "message": "Workout plan deleted successfully"}
 
 @router.patch("/plan/day/{weekday}/add")
-def add_exercise_to_day(weekday: int, ex: ExerciseRef, user_id: str = Depends(get_current_user_id)):
+def add_exercise_to_day(weekday: int, ex: ExerciseRef, user_id: str = Depends(get_current_user_id_fast)):
     if weekday < 0 or weekday > 6:
         raise HTTPException(400, "weekday 0..6")
     
@@ -539,7 +539,7 @@ def add_exercise_to_day(weekday: int, ex: ExerciseRef, user_id: str = Depends(ge
     return {"ok": True}
 
 @router.get("/session/today")
-def get_todays_session(user_id: str = Depends(get_current_user_id)):
+def get_todays_session(user_id: str = Depends(get_current_user_id_fast)):
     today = date.today().isoformat()
     # Convert user_id to ObjectId for database queries
     user_oid = _oid(user_id)
@@ -620,7 +620,7 @@ def get_todays_session(user_id: str = Depends(get_current_user_id)):
     return _convert_objectids_to_strings(inserted_session)
 
 @router.patch("/session/complete-exercise/{exercise_id}")
-def complete_exercise(exercise_id: str, user_id: str = Depends(get_current_user_id)):
+def complete_exercise(exercise_id: str, user_id: str = Depends(get_current_user_id_fast)):
     today = date.today().isoformat()
     # Convert user_id to ObjectId for database queries
     user_oid = _oid(user_id)
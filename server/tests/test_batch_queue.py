@@ -0,0 +1,74 @@
+# server/tests/test_batch_queue.py
+import asyncio
+import pytest
+
+from app.ai_blog_agents.agents.batch_queue import BatchQueue
+
+
+def run_batches(items, **options):
+    """Submits (item, size) pairs concurrently under one key; returns (results, batches flushed)"""
+    batches = []
+
+    async def flush_fn(key, batch):
+        batches.append(list(batch))
+        return [item.upper() for item in batch]
+
+    async def main():
+        queue = BatchQueue(flush_fn, **options)
+        results = await asyncio.gather(*(queue.submit("k", item, size) for item, size in items))
+        assert not queue._tasks
+        return results
+
+    return asyncio.run(main()), batches
+
+
+class TestBatchQueue:
+    """Test cases for BatchQueue"""
+
+    def test_flush_after_delay(self):
+        """Items under every cap are flushed together once max_delay elapses"""
+        results, batches = run_batches([("a", 1), ("b", 1), ("c", 1)], max_delay=0.01)
+        assert results == ["A", "B", "C"]
+        assert batches == [["a", "b", "c"]]
+
+    def test_flush_on_item_count(self):
+        """A batch is flushed as soon as it holds max_items"""
+        results, batches = run_batches([("a", 1), ("b", 1), ("c", 1)], max_delay=0.01, max_items=2)
+        assert results == ["A", "B", "C"]
+        assert batches == [["a", "b"], ["c"]]
+
+    def test_flush_on_size(self):
+        """An item that would push the batch past max_chars starts a new batch"""
+        results, batches = run_batches([("a", 4), ("b", 4), ("c", 4)], max_delay=0.01, max_chars=10)
+        assert results == ["A", "B", "C"]
+        assert batches == [["a", "b"], ["c"]]
+
+    def test_oversize_item_sent_alone(self):
+        """An item larger than max_chars goes out in a batch of its own"""
+        results, batches = run_batches([("a", 3), ("big", 50), ("c", 3)], max_delay=0.01, max_chars=10)
+        assert results == ["A", "BIG", "C"]
+        assert batches == [["a"], ["big"], ["c"]]
+
+    def test_flush_error_reaches_every_caller(self):
+        """A failing flush_fn raises in each waiting submit"""
+        async def flush_fn(key, batch):
+            raise RuntimeError("upstream down")
+
+        async def main():
+            queue = BatchQueue(flush_fn, max_delay=0.01)
+            return await asyncio.gather(queue.submit("k", "a"), queue.submit("k", "b"), return_exceptions=True)
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_result_count_mismatch(self):
+        """A flush_fn returning the wrong number of results fails the batch"""
+        async def flush_fn(key, batch):
+            return batch[:1]
+
+        async def main():
+            queue = BatchQueue(flush_fn, max_delay=0.01)
+            return await asyncio.gather(queue.submit("k", "a"), queue.submit("k", "b"))
+
+        with pytest.raises(ValueError):
+            asyncio.run(main())
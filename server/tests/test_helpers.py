@@ -0,0 +1,47 @@
+# server/tests/test_helpers.py
+from app.ai_blog_agents.utils.helpers import safe_json_parse
+
+
+class TestSafeJsonParse:
+    """Test cases for safe_json_parse"""
+
+    def test_fenced_reply(self):
+        """Parses the object out of a fenced LLM reply"""
+        raw = 'Here you go:\n```json\n{"title": "Leg Day", "tags": ["legs", "strength"]}\n```'
+        assert safe_json_parse(raw) == {"title": "Leg Day", "tags": ["legs", "strength"]}
+
+    def test_nested_object(self):
+        """The outer object wins over its nested objects"""
+        raw = '{"meta": {"score": 7}, "items": [{"a": 1}]}'
+        assert safe_json_parse(raw) == {"meta": {"score": 7}, "items": [{"a": 1}]}
+
+    def test_placeholder_before_json(self):
+        """A stray {placeholder} in the prose before the object is skipped"""
+        raw = 'Fill in {placeholder} as needed. Result: {"ok": true}'
+        assert safe_json_parse(raw) == {"ok": True}
+
+    def test_brace_in_trailing_prose(self):
+        """A stray } after the object doesn't break the parse"""
+        raw = '{"ok": true}\nNote: use } sparingly'
+        assert safe_json_parse(raw) == {"ok": True}
+
+    def test_braces_inside_strings(self):
+        """Braces inside JSON strings don't affect the span"""
+        raw = 'Prefix {x} then {"text": "a } and { b"} suffix }'
+        assert safe_json_parse(raw) == {"text": "a } and { b"}
+
+    def test_no_json_returns_default(self):
+        """Returns the default when nothing parses"""
+        assert safe_json_parse("no json here", {"fallback": 1}) == {"fallback": 1}
+        assert safe_json_parse("{not json}") == {}
+
+    def test_result_is_a_copy(self):
+        """Mutating a result doesn't leak into later cached parses"""
+        raw = '{"items": [1, 2]}'
+        safe_json_parse(raw)["items"].append(3)
+        assert safe_json_parse(raw) == {"items": [1, 2]}
+
+    def test_already_parsed_passthrough(self):
+        """Dicts and lists are returned as-is"""
+        data = {"a": 1}
+        assert safe_json_parse(data) is data
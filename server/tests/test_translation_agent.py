@@ -0,0 +1,73 @@
+# server/tests/test_translation_agent.py
+import asyncio
+
+from app.ai_blog_agents.agents.translation_agent import (
+    LONG_CONTENT_BLOCK_CHARS,
+    LONG_CONTENT_CHARS,
+    TranslationAgent,
+    _split_markdown,
+)
+
+
+def rebuild(blocks):
+    return "".join(sep + block for sep, block in blocks)
+
+
+class TestSplitMarkdown:
+    """Test cases for _split_markdown"""
+
+    def test_paragraphs_packed_and_rebuilt(self):
+        """Paragraphs are packed into blocks and rejoin to the original text"""
+        content = "\n\n".join(f"Paragraph {i} " + "x" * 300 for i in range(20))
+        blocks = _split_markdown(content, max_chars=1000)
+        assert len(blocks) > 1
+        assert all(len(block) <= 1000 for _, block in blocks)
+        assert rebuild(blocks) == content
+
+    def test_heading_starts_new_paragraph(self):
+        """A heading line is a boundary even without a blank line before it"""
+        content = "intro line\n## Heading\nbody line"
+        blocks = _split_markdown(content, max_chars=15)
+        assert [block for _, block in blocks] == ["intro line", "## Heading", "body line"]
+
+    def test_fenced_code_not_split(self):
+        """Blank lines and headings inside a code fence are not boundaries"""
+        fence = "```\n# not a heading\n\ncode\n```"
+        blocks = _split_markdown(f"before\n\n{fence}\n\nafter", max_chars=len(fence))
+        assert fence in [block for _, block in blocks]
+
+    def test_oversized_paragraph_without_blank_lines(self):
+        """Text with only single newlines is split on lines to fit max_chars"""
+        content = "\n".join("line %d of the text" % i for i in range(2000))
+        blocks = _split_markdown(content)
+        assert len(blocks) > 1
+        assert all(len(block) <= LONG_CONTENT_BLOCK_CHARS for _, block in blocks)
+        assert rebuild(blocks) == content
+
+    def test_oversized_single_line(self):
+        """A single over-long line is split on sentence ends, then by length"""
+        content = "A short sentence. " * 800 + "y" * 6000
+        blocks = _split_markdown(content.strip())
+        assert all(len(block) <= LONG_CONTENT_BLOCK_CHARS for _, block in blocks)
+
+
+class TestTranslateLong:
+    """Test cases for long-content translation"""
+
+    def test_long_text_without_blank_lines_terminates(self):
+        """Regression: over-limit text with no blank lines is translated block by block, not recursively"""
+        agent = TranslationAgent.__new__(TranslationAgent)
+        prompts = []
+
+        async def fake_prompt(prompt, system=None):
+            prompts.append(prompt)
+            return "translated"
+
+        agent.arun_prompt = fake_prompt
+        content = "\n".join("single newline line %d" % i for i in range(1000))
+        assert len(content) > LONG_CONTENT_CHARS
+
+        result = asyncio.run(agent._translate_one(content, None, "English", "Spanish"))
+        blocks = _split_markdown(content)
+        assert len(prompts) == len(blocks)
+        assert result == ("".join(sep + "translated" for sep, _ in blocks), None)